@@ -0,0 +1,266 @@
+"""
+Benchmarks das métricas do trabalho_1 e do bloco de centralidades do trabalho_2.
+
+Cada métrica roda em um subprocesso próprio, sobre os arquivos do Gnutella em vários tamanhos
+e sobre grafos sintéticos livres de escala, medindo o tempo de parede, o pico de memória
+alocada pela métrica (tracemalloc) e as operações por segundo. Os resultados vão para um
+JSON e, se existir uma base salva, cada medição é comparada com ela e as regressões são
+apontadas. A base não é versionada: tempos medidos em uma máquina não servem de referência
+para outra, então cada máquina grava a sua com --salvar-base.
+
+Exemplos:
+    python benchmarks/executar.py                         # tudo, comparando com benchmarks/base.json
+    python benchmarks/executar.py --metricas diametro pontes --conjuntos gnutella08
+    python benchmarks/executar.py --salvar-base           # grava as medições como nova base
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+CAMINHO_BASE = os.path.join(DIRETORIO, "base.json")
+CAMINHO_RESULTADOS = os.path.join(DIRETORIO, "resultados.json")
+TOLERANCIA_TEMPO = 0.25  # Aumento relativo do tempo considerado regressão
+TOLERANCIA_MEMORIA = 0.25  # Aumento relativo do pico de memória alocada considerado regressão
+TEMPO_MINIMO = 0.05  # Segundos; tempos menores (na base ou agora) são ruído do relógio e do sistema
+DIFERENCA_MINIMA = 0.01  # Segundos; diferenças absolutas menores nunca são regressão nem melhoria
+MIN_REPETICOES = 3  # Medições com menos repetições que isso ficam fora da comparação
+FRACAO_ORCAMENTO = 0.9  # Execuções que usam essa fração do orçamento medem o orçamento, não a métrica
+TEMPO_LIMITE_PADRAO = 900  # Segundos por subprocesso
+
+
+def _rss_pico_mb():
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024  # bytes no macOS, KB no Linux
+
+
+def medir(metrica, conjunto, tamanho, repeticoes):
+    """
+    Executa uma métrica no processo atual (chamado dentro do subprocesso).
+
+    O grafo é montado antes de cada repetição, fora da medição, para que caches de uma
+    execução não beneficiem a seguinte. A saída das funções é descartada. O pico de RSS do
+    processo inclui a importação das bibliotecas e a montagem dos dados, então a memória da
+    métrica é medida à parte: uma execução extra, depois das cronometradas, sob o tracemalloc
+    (que registra também os arrays do NumPy), com o pico de memória alocada durante ela.
+
+    Returns:
+        dict: "estado" ("ok", "ignorado" ou "orcamento" quando a métrica esgota o seu
+        orçamento de tempo), "nos", "arestas", "tempos" (segundos de cada repetição),
+        "operacoes", "memoria_pico_mb" (pico alocado pela métrica), "rss_inicial_mb" (pico antes
+        da primeira execução) e "rss_pico_mb".
+    """
+    import suite
+
+    definicao = suite.METRICAS[metrica]
+    tempos = []
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        arestas = suite.carregar_arestas(conjunto, tamanho)
+        if definicao["limite"] is not None and len(arestas) > definicao["limite"]:
+            return {"estado": "ignorado", "arestas": len(arestas)}
+        rss_inicial = None
+        for _ in range(repeticoes):
+            dados = suite.preparar(arestas, definicao["usa"])
+            if rss_inicial is None:
+                rss_inicial = _rss_pico_mb()
+            inicio = time.perf_counter()
+            definicao["executar"](dados)
+            tempos.append(time.perf_counter() - inicio)
+
+        dados = suite.preparar(arestas, definicao["usa"])
+        tracemalloc.start()
+        try:
+            definicao["executar"](dados)
+            memoria_pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    operacoes = definicao["operacoes"]
+    if operacoes == "arestas":
+        operacoes = dados["csr"].num_arestas
+    elif operacoes == "nos":
+        operacoes = dados["csr"].num_nos
+    orcamento = definicao["orcamento"]
+    return {
+        "estado": "orcamento" if orcamento is not None and min(tempos) >= FRACAO_ORCAMENTO * orcamento else "ok",
+        "nos": dados["csr"].num_nos,
+        "arestas": dados["csr"].num_arestas,
+        "tempos": tempos,
+        "operacoes": operacoes,
+        "memoria_pico_mb": memoria_pico / (1024 * 1024),
+        "rss_inicial_mb": rss_inicial,
+        "rss_pico_mb": _rss_pico_mb(),
+    }
+
+
+def _executar_subprocesso(metrica, conjunto, tamanho, repeticoes, tempo_limite):
+    """Roda `medir` em um interpretador novo, para que o pico de RSS seja só desta medição."""
+    comando = [sys.executable, os.path.abspath(__file__), "--trabalhador", metrica, conjunto, tamanho,
+               "--repeticoes", str(repeticoes)]
+    ambiente = dict(os.environ, MPLBACKEND="Agg", GRAFOS_HEADLESS="1")
+    try:
+        processo = subprocess.run(comando, capture_output=True, text=True, timeout=tempo_limite, env=ambiente)
+    except subprocess.TimeoutExpired:
+        return {"estado": "tempo_esgotado"}
+    if processo.returncode != 0:
+        return {"estado": "erro", "erro": processo.stderr.strip().splitlines()[-1:]}
+    return json.loads(processo.stdout.strip().splitlines()[-1])
+
+
+def _resumir(medicao):
+    """Acrescenta tempo mínimo/mediano e ops/s a uma medição concluída."""
+    if medicao["estado"] in ("ok", "orcamento"):
+        medicao["tempo_min"] = min(medicao["tempos"])
+        medicao["tempo_mediano"] = statistics.median(medicao["tempos"])
+        medicao["ops_por_segundo"] = medicao["operacoes"] / max(medicao["tempo_min"], 1e-9)
+    return medicao
+
+
+def _ambiente():
+    import numpy
+    import scipy
+    import networkx
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "nucleos": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "scipy": scipy.__version__,
+        "networkx": networkx.__version__,
+    }
+
+
+def _comparar_tempo(atual, anterior, tolerancia):
+    """Situação do tempo mínimo, ou None se a medição é curta demais para ser comparada."""
+    if min(atual, anterior) < TEMPO_MINIMO or abs(atual - anterior) < DIFERENCA_MINIMA:
+        return None
+    if atual > (1 + tolerancia) * anterior:
+        return "regressao"
+    if atual < (1 - tolerancia) * anterior:
+        return "melhoria"
+    return "estavel"
+
+
+def comparar(resultados, base, tolerancia_tempo=TOLERANCIA_TEMPO, tolerancia_memoria=TOLERANCIA_MEMORIA):
+    """
+    Compara cada medição com a da base pelo tempo mínimo e pelo pico de memória alocada pela
+    métrica. Ficam de fora as medições que esgotaram o orçamento de tempo ("orcamento"; o seu
+    tempo é o do orçamento) e as com menos de `MIN_REPETICOES` repetições, de um lado ou do
+    outro. O tempo só é comparado se os dois mínimos passam de `TEMPO_MINIMO` e diferem em pelo
+    menos `DIFERENCA_MINIMA`: abaixo disso, a variação relativa é ruído.
+
+    Returns:
+        list: Um dicionário por medição comparada, com "chave", "tempo" e "memoria" (razões
+        atual / base; "tempo" é None se o tempo não foi comparado) e "situacao": "regressao",
+        "melhoria" ou "estavel".
+    """
+    comparacoes = []
+    for chave, atual in resultados.items():
+        anterior = base.get(chave)
+        if atual["estado"] != "ok" or not anterior or anterior["estado"] != "ok":
+            continue
+        if min(len(atual["tempos"]), len(anterior["tempos"])) < MIN_REPETICOES:
+            continue
+        situacao_tempo = _comparar_tempo(atual["tempo_min"], anterior["tempo_min"], tolerancia_tempo)
+        tempo = None if situacao_tempo is None else atual["tempo_min"] / anterior["tempo_min"]
+        # Pico abaixo de 1 MB é ruído de alocação; a razão usa esse piso
+        memoria = max(atual["memoria_pico_mb"], 1.0) / max(anterior["memoria_pico_mb"], 1.0)
+        if situacao_tempo == "regressao" or memoria > 1 + tolerancia_memoria:
+            situacao = "regressao"
+        elif situacao_tempo == "melhoria":
+            situacao = "melhoria"
+        else:
+            situacao = "estavel"
+        comparacoes.append({"chave": chave, "tempo": tempo, "memoria": memoria, "situacao": situacao})
+    return comparacoes
+
+
+def _casos(metricas, conjuntos, tamanhos, sinteticos):
+    for conjunto in conjuntos:
+        lista = sinteticos if conjunto == "sintetico" else tamanhos
+        for tamanho in lista:
+            for metrica in metricas:
+                yield metrica, conjunto, tamanho
+
+
+def main(argumentos=None):
+    import suite
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--metricas", nargs="+", choices=list(suite.METRICAS), default=list(suite.METRICAS))
+    parser.add_argument("--conjuntos", nargs="+", choices=[*suite.ARQUIVOS, "sintetico"],
+                        default=[*suite.ARQUIVOS, "sintetico"])
+    parser.add_argument("--tamanhos", nargs="+", choices=suite.TAMANHOS_ARQUIVO, default=list(suite.TAMANHOS_ARQUIVO))
+    parser.add_argument("--sinteticos", nargs="+", choices=list(suite.TAMANHOS_SINTETICOS),
+                        default=list(suite.TAMANHOS_SINTETICOS))
+    parser.add_argument("--repeticoes", type=int, default=MIN_REPETICOES,
+                        help=f"Repetições por caso; com menos de {MIN_REPETICOES}, o caso não é comparado.")
+    parser.add_argument("--tempo-limite", type=float, default=TEMPO_LIMITE_PADRAO, help="Segundos por subprocesso.")
+    parser.add_argument("--saida", default=CAMINHO_RESULTADOS)
+    parser.add_argument("--base", default=CAMINHO_BASE)
+    parser.add_argument("--salvar-base", action="store_true", help="Grava as medições como a nova base.")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_TEMPO)
+    parser.add_argument("--trabalhador", nargs=3, metavar=("METRICA", "CONJUNTO", "TAMANHO"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argumentos)
+
+    if args.trabalhador:
+        print(json.dumps(medir(*args.trabalhador, args.repeticoes)))
+        return 0
+
+    resultados = {}
+    for metrica, conjunto, tamanho in _casos(args.metricas, args.conjuntos, args.tamanhos, args.sinteticos):
+        chave = f"{metrica}|{conjunto}|{tamanho}"
+        medicao = _resumir(_executar_subprocesso(metrica, conjunto, tamanho, args.repeticoes, args.tempo_limite))
+        resultados[chave] = medicao
+        if medicao["estado"] == "ok":
+            print(f"{chave:55s} {medicao['tempo_min']:10.4f} s  {medicao['memoria_pico_mb']:8.1f} MB "
+                  f"(RSS {medicao['rss_pico_mb']:.0f})  {medicao['ops_por_segundo']:14,.0f} ops/s")
+        elif medicao["estado"] == "orcamento":
+            print(f"{chave:55s} {medicao['tempo_min']:10.4f} s  orçamento de tempo esgotado (fora da comparação)")
+        else:
+            print(f"{chave:55s} {medicao['estado']} {medicao.get('erro', '')}")
+
+    relatorio = {"ambiente": _ambiente(), "resultados": resultados}
+    with open(args.saida, "w", encoding="utf-8") as arquivo:
+        json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+    print(f"\nResultados salvos em {args.saida}")
+
+    regressoes = []
+    if os.path.exists(args.base) and not args.salvar_base:
+        with open(args.base, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+        if base.get("ambiente", {}).get("plataforma") != relatorio["ambiente"]["plataforma"]:
+            print("Aviso: a base foi medida em outra plataforma; as comparações são apenas indicativas.")
+        comparacoes = comparar(resultados, base["resultados"], args.tolerancia)
+        regressoes = [c for c in comparacoes if c["situacao"] == "regressao"]
+        for comparacao in comparacoes:
+            if comparacao["situacao"] != "estavel":
+                tempo = "-" if comparacao["tempo"] is None else f"x{comparacao['tempo']:.2f}"
+                print(f"{comparacao['situacao'].upper():10s} {comparacao['chave']:55s} "
+                      f"tempo {tempo}  memória x{comparacao['memoria']:.2f}")
+        print(f"{len(comparacoes)} medições comparadas com {args.base}: {len(regressoes)} regressões.")
+
+    if args.salvar_base:
+        if os.path.exists(args.base):
+            # Mantém as medições da base que não foram refeitas nesta execução
+            with open(args.base, encoding="utf-8") as arquivo:
+                anteriores = json.load(arquivo)["resultados"]
+            relatorio["resultados"] = {**anteriores, **resultados}
+        with open(args.base, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        print(f"Base salva em {args.base}")
+
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+import os
+import sys
+
+import numpy as np
+import scipy.sparse.linalg as spla
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(RAIZ, "trabalho_1"), os.path.join(RAIZ, "trabalho_2")]
+
+import networkx as nx  # noqa: E402
+
+from leitura import ler_arestas  # noqa: E402
+from grafo_csr import GrafoCSR  # noqa: E402
+from grafo_direcionado import GrafoDirecionadoCSR  # noqa: E402
+import codigo_trabalho_1 as t1  # noqa: E402
+from centralidade import Centralidades  # noqa: E402
+from intermediacao import intermediacao, intermediacao_rk  # noqa: E402
+from ranking import top_k  # noqa: E402
+
+
+# Conjuntos de dados e métricas dos benchmarks. Tudo é local: os arquivos do Gnutella vêm com
+# o repositório e os grafos sintéticos são gerados com semente fixa.
+
+ARQUIVOS = {
+    "gnutella08": os.path.join(RAIZ, "trabalho_1", "p2p-Gnutella08.txt"),
+    "gnutella09": os.path.join(RAIZ, "trabalho_1", "p2p-Gnutella09.txt"),
+}
+TAMANHOS_ARQUIVO = ("amostra", "10%", "50%", "100%")  # "amostra": as 100 primeiras arestas, como em __main__
+TAMANHOS_SINTETICOS = {"10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+ARESTAS_AMOSTRA = 100
+EXPOENTE_SINTETICO = 2.5  # Expoente da lei de potência dos graus dos grafos sintéticos
+NUM_PARES = 1000  # Consultas do benchmark de menores caminhos
+TEMPO_LIMITE = 10  # Orçamento (s) das métricas com busca exponencial
+
+
+def arestas_sinteticas(num_arestas, expoente=EXPOENTE_SINTETICO, seed=0):
+    """
+    Grafo livre de escala pelo modelo de Chung–Lu: cada ponta de aresta é sorteada com
+    probabilidade proporcional a um peso w_i ~ i^(-1 / (expoente - 1)), o que dá graus com
+    cauda P(k) ~ k^-expoente. Laços são descartados; arestas repetidas ficam para a construção
+    do grafo unificar.
+
+    Args:
+        num_arestas (int): Arestas sorteadas.
+        expoente (float): Expoente da distribuição de graus (> 2).
+        seed (int): Semente do gerador.
+
+    Returns:
+        numpy.ndarray: Array (m, 2) de int64.
+    """
+    num_nos = max(2, num_arestas // 4)
+    pesos = np.arange(1, num_nos + 1, dtype=np.float64) ** (-1.0 / (expoente - 1))
+    rng = np.random.default_rng(seed)
+    arestas = rng.choice(num_nos, size=(num_arestas, 2), p=pesos / pesos.sum())
+    return arestas[arestas[:, 0] != arestas[:, 1]].astype(np.int64)
+
+
+def carregar_arestas(conjunto, tamanho):
+    """
+    Arestas de um conjunto ("gnutella08", "gnutella09" ou "sintetico") em um tamanho: para os
+    arquivos, "amostra" ou uma fração ("10%", "50%", "100%") das linhas, na ordem do arquivo;
+    para os sintéticos, uma chave de `TAMANHOS_SINTETICOS`.
+    """
+    if conjunto == "sintetico":
+        return arestas_sinteticas(TAMANHOS_SINTETICOS[tamanho])
+    arestas = ler_arestas(ARQUIVOS[conjunto])
+    if tamanho == "amostra":
+        return arestas[:ARESTAS_AMOSTRA]
+    return arestas[:max(1, round(len(arestas) * float(tamanho.rstrip("%")) / 100))]
+
+
+def _centralidades(d):
+    centralidades = Centralidades.de_arestas(d["arestas"])
+    # Katz precisa de alpha < 1 / (maior autovalor); calculado aqui para não entrar na medição
+    maior_autovalor = spla.eigsh(centralidades.matriz, k=1, which="LA", return_eigenvectors=False)[0] \
+        if centralidades.num_nos >= 3 else 1.0
+    d["alpha_katz"] = 0.9 / max(float(maior_autovalor), 1.0)
+    return centralidades
+
+
+def _permutado(d):
+    permutacao = np.random.default_rng(0).permutation(int(d["arestas"].max()) + 1)
+    return GrafoCSR.de_arestas(permutacao[d["arestas"]])
+
+
+# Formato -> construção a partir do dicionário de `preparar` (já com "arestas" e "csr")
+FORMATOS = {
+    "nx": lambda d: d["csr"].para_networkx(),
+    "direcionado": lambda d: GrafoDirecionadoCSR.de_arestas(d["arestas"]),
+    "permutado": _permutado,
+    "centralidades": _centralidades,
+    "graus": lambda d: dict(zip(d["csr"].rotulos.tolist(), d["csr"].grau().tolist())),
+}
+
+
+def preparar(arestas, formatos=()):
+    """
+    Monta, fora da medição, tudo o que uma métrica recebe: o `GrafoCSR`, os nós das consultas
+    (origem = nó de maior grau, destino = nó do meio da componente da origem, `NUM_PARES`
+    pares sorteados) e os `formatos` extras que ela usa (chaves de `FORMATOS`).
+    """
+    csr = GrafoCSR.de_arestas(arestas)
+    origem = int(np.argmax(csr.grau()))
+    componente = np.flatnonzero(csr.componentes() == csr.componentes()[origem])
+    destino = int(componente[len(componente) // 2])
+    rng = np.random.default_rng(0)
+    dados = {
+        "arestas": arestas,
+        "csr": csr,
+        "origem": csr.rotulo(origem),
+        "destino": csr.rotulo(destino),
+        "pares": csr.rotulos[rng.integers(0, csr.num_nos, size=(NUM_PARES, 2))].tolist(),
+    }
+    for formato in formatos:
+        dados[formato] = FORMATOS[formato](dados)
+    return dados
+
+
+def _metrica(executar, usa=(), limite=None, operacoes="arestas", orcamento=None):
+    return {"executar": executar, "usa": usa, "limite": limite, "operacoes": operacoes, "orcamento": orcamento}
+
+
+# Nome -> métrica: "executar" (função sobre o dicionário de `preparar`), "usa" (formatos
+# extras), "limite" (maior número de arestas em que roda; as de custo quadrático ou
+# exponencial acima dele ficam como "ignorado"), "operacoes" (o que conta como uma operação
+# nas ops/s: "arestas", "nos" ou um número fixo por execução) e "orcamento" (o tempo limite
+# das métricas com busca exponencial; as execuções que o esgotam não entram na comparação).
+METRICAS = {
+    # trabalho_1: construção dos grafos
+    "construcao_csr": _metrica(lambda d: GrafoCSR.de_arestas(d["arestas"])),
+    "construcao_nx": _metrica(lambda d: nx.Graph(d["arestas"].tolist())),
+    "construcao_direcionado": _metrica(lambda d: GrafoDirecionadoCSR.de_arestas(d["arestas"])),
+    # trabalho_1: questões (funções get_* sem desenho)
+    "pdf_ccdf": _metrica(lambda d: t1.get_pdf_and_ccdf(d["csr"], desenhar=False), operacoes="nos"),
+    "comparar_graus": _metrica(lambda d: t1.comparar_graus({"grafo": d["csr"]}, desenhar=False), operacoes="nos"),
+    "caminhos_simples": _metrica(
+        lambda d: t1.get_all_paths(d["csr"], d["origem"], d["destino"], limite=1000,
+                                   tempo_limite=TEMPO_LIMITE, desenhar=False),
+        operacoes=1000, orcamento=TEMPO_LIMITE,
+    ),
+    "menor_caminho": _metrica(
+        lambda d: t1.get_shortest_path(d["csr"], d["origem"], d["destino"], desenhar=False), operacoes=1
+    ),
+    "menores_caminhos": _metrica(
+        lambda d: t1.get_shortest_paths(d["csr"], d["pares"], trabalhadores=1), operacoes=NUM_PARES
+    ),
+    "distancia_media": _metrica(lambda d: t1.get_average_path(d["csr"]), limite=30_000, operacoes="nos"),
+    "distancia_media_amostrada": _metrica(lambda d: t1.get_average_path(d["csr"], amostras=256)),
+    "excentricidade": _metrica(lambda d: t1.get_eccentricity(d["csr"], d["origem"], desenhar=False)),
+    "diametro": _metrica(lambda d: t1.get_diameter(d["csr"], metodo="limites", desenhar=False)),
+    "densidade": _metrica(lambda d: t1.get_density(d["csr"])),
+    "euleriano": _metrica(lambda d: t1.has_eulerian(d["csr"])),
+    "hamiltoniano": _metrica(
+        lambda d: t1.has_hamiltonian(d["nx"], tempo_limite=TEMPO_LIMITE), usa=("nx",), operacoes="nos",
+        orcamento=TEMPO_LIMITE,
+    ),
+    "cliques": _metrica(lambda d: t1.get_all_cliques(d["csr"], resumo=True, desenhar=False)),
+    "clique_maximo": _metrica(lambda d: t1.get_clique_maximo(d["csr"], desenhar=False)),
+    "componentes": _metrica(lambda d: t1.get_totally_connected(d["csr"], desenhar=False)),
+    "maior_componente": _metrica(lambda d: t1.get_bigger_component(d["csr"], desenhar=False)),
+    "isomorfismo": _metrica(
+        lambda d: t1.check_isomorphic(d["csr"], d["permutado"], desenhar=False, tempo_limite=TEMPO_LIMITE),
+        usa=("permutado",), orcamento=TEMPO_LIMITE,
+    ),
+    "pontes": _metrica(lambda d: t1.get_bridges(d["csr"], desenhar=False)),
+    "direcionado": _metrica(lambda d: t1.get_directed_summary(d["direcionado"], desenhar=False), usa=("direcionado",)),
+    # trabalho_2: bloco de centralidades de codigo_trabalho_2.py
+    "centralidades_matriz": _metrica(lambda d: Centralidades.de_arestas(d["arestas"])),
+    "centralidade_grau": _metrica(lambda d: d["centralidades"].grau(), usa=("centralidades",), operacoes="nos"),
+    "centralidade_autovetor": _metrica(lambda d: d["centralidades"].autovetor(), usa=("centralidades",)),
+    "centralidade_katz": _metrica(
+        lambda d: d["centralidades"].katz(alpha=d["alpha_katz"]), usa=("centralidades",)
+    ),
+    "centralidade_proximidade": _metrica(
+        lambda d: d["centralidades"].proximidade(), usa=("centralidades",), limite=30_000, operacoes="nos"
+    ),
+    "intermediacao": _metrica(
+        lambda d: intermediacao(d["centralidades"], processos=1), usa=("centralidades",), limite=30_000,
+        operacoes="nos",
+    ),
+    "intermediacao_amostrada": _metrica(
+        lambda d: intermediacao(d["centralidades"], k=256, seed=0, processos=1), usa=("centralidades",), operacoes=256
+    ),
+    "intermediacao_rk": _metrica(lambda d: intermediacao_rk(d["centralidades"], seed=0), usa=("centralidades",)),
+    "ranking_top_k": _metrica(lambda d: top_k(d["graus"], 10), usa=("graus",), operacoes="nos"),
+}
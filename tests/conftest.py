@@ -0,0 +1,53 @@
+import os
+import random
+import sys
+
+import matplotlib
+import networkx as nx
+import pytest
+
+matplotlib.use("Agg")
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(RAIZ, "trabalho_1"), os.path.join(RAIZ, "trabalho_2"), os.path.join(RAIZ, "benchmarks")]
+
+SEMENTES = range(8)
+
+
+# Os testes comparam as estruturas próprias (CSR, união-busca, buscas vetorizadas) com o
+# NetworkX em grafos aleatórios pequenos, com várias componentes, nós isolados e rótulos que
+# não coincidem com os índices densos.
+
+
+def grafo_aleatorio(semente, n_min=20, n_max=60, p_min=0.03, p_max=0.15):
+    rng = random.Random(semente)
+    n = rng.randint(n_min, n_max)
+    grafo = nx.gnp_random_graph(n, rng.uniform(p_min, p_max), seed=semente)
+    return nx.relabel_nodes(grafo, {v: 3 * v + 7 for v in grafo})
+
+
+@pytest.fixture(params=SEMENTES)
+def grafo(request):
+    """Grafo não direcionado esparso, em geral desconexo."""
+    return grafo_aleatorio(request.param)
+
+
+@pytest.fixture(params=SEMENTES)
+def grafo_denso(request):
+    """Grafo não direcionado com muitos triângulos, para os testes de cliques."""
+    return grafo_aleatorio(request.param, n_min=15, n_max=35, p_min=0.2, p_max=0.5)
+
+
+@pytest.fixture(params=SEMENTES)
+def digrafo(request):
+    """Grafo direcionado esparso, com várias componentes fortes."""
+    rng = random.Random(request.param)
+    grafo = nx.gnp_random_graph(rng.randint(20, 60), rng.uniform(0.03, 0.12), seed=request.param, directed=True)
+    return nx.relabel_nodes(grafo, {v: 3 * v + 7 for v in grafo})
+
+
+@pytest.fixture(params=SEMENTES)
+def grafo_conexo(request):
+    """Grafo não direcionado conexo, para as medidas que exigem conexidade."""
+    rng = random.Random(request.param)
+    return nx.connected_watts_strogatz_graph(rng.randint(20, 50), 4, 0.3, seed=request.param)
@@ -0,0 +1,31 @@
+from executar import comparar
+
+
+def _medicao(tempo, memoria=10.0, repeticoes=3):
+    return {"estado": "ok", "tempos": [tempo] * repeticoes, "tempo_min": tempo, "memoria_pico_mb": memoria}
+
+
+def _situacoes(resultados, base):
+    return {c["chave"]: c["situacao"] for c in comparar(resultados, base)}
+
+
+def test_tempo_relativo_acima_do_piso():
+    base = {"lenta": _medicao(1.0), "rapida": _medicao(1.0), "igual": _medicao(1.0)}
+    atual = {"lenta": _medicao(1.5), "rapida": _medicao(0.5), "igual": _medicao(1.1)}
+    assert _situacoes(atual, base) == {"lenta": "regressao", "rapida": "melhoria", "igual": "estavel"}
+
+
+def test_tempos_curtos_nao_sao_comparados():
+    base = {"curta": _medicao(0.01), "diferenca_pequena": _medicao(0.06), "memoria": _medicao(0.01, 10.0)}
+    atual = {"curta": _medicao(0.04), "diferenca_pequena": _medicao(0.068), "memoria": _medicao(0.01, 20.0)}
+    comparacoes = {c["chave"]: c for c in comparar(atual, base)}
+    assert all(c["tempo"] is None for c in comparacoes.values())
+    assert {chave: c["situacao"] for chave, c in comparacoes.items()} == {
+        "curta": "estavel", "diferenca_pequena": "estavel", "memoria": "regressao"}
+
+
+def test_poucas_repeticoes_e_orcamento_ficam_de_fora():
+    base = {"uma": _medicao(1.0, repeticoes=1), "duas": _medicao(1.0), "orcamento": _medicao(1.0)}
+    atual = {"uma": _medicao(5.0), "duas": _medicao(5.0, repeticoes=2),
+             "orcamento": dict(_medicao(5.0), estado="orcamento")}
+    assert comparar(atual, base) == []
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pytest
+
+from grafo_csr import ler_grafo_csr
+from cache_grafo import abrir_cache, carregar_grafo_csr, salvar_cache
+
+
+def _arestas(grafo):
+    return {frozenset(aresta) for aresta in grafo.edges}
+
+
+def _escrever(caminho, grafo):
+    linhas = ["# FromNodeId\tToNodeId"] + [f"{u}\t{v}" for u, v in grafo.edges]
+    caminho.write_text("\n".join(linhas) + "\n")
+    return str(caminho)
+
+
+def test_leitura_e_cache(tmp_path, grafo):
+    arquivo = _escrever(tmp_path / "arestas.txt", grafo)
+    sem_isolados = grafo.subgraph([v for v in grafo if grafo.degree(v)])
+
+    lido = ler_grafo_csr(arquivo)
+    assert _arestas(lido.para_networkx()) == _arestas(sem_isolados)
+    primeiro = carregar_grafo_csr(arquivo, str(tmp_path / "arestas.csr"))
+    segundo = carregar_grafo_csr(arquivo, str(tmp_path / "arestas.csr"))
+    for csr in (primeiro, segundo):
+        assert _arestas(csr.para_networkx()) == _arestas(sem_isolados)
+    assert np.array_equal(segundo.rotulos, lido.rotulos)
+
+
+def test_cache_desatualizado_e_reconstruido(tmp_path, grafo):
+    arquivo = _escrever(tmp_path / "arestas.txt", grafo)
+    cache = str(tmp_path / "arestas.csr")
+    carregar_grafo_csr(arquivo, cache)
+    assert abrir_cache(cache, arquivo) is not None
+
+    with open(arquivo, "a") as saida:
+        saida.write("1000\t1001\n")
+    assert abrir_cache(cache, arquivo) is None
+    assert carregar_grafo_csr(arquivo, cache).para_networkx().has_edge(1000, 1001)
+    assert abrir_cache(cache, arquivo) is not None
+
+
+def test_cache_truncado_ou_de_outro_formato(tmp_path, grafo):
+    arquivo = _escrever(tmp_path / "arestas.txt", grafo)
+    cache = tmp_path / "arestas.csr"
+    carregar_grafo_csr(arquivo, str(cache))
+    cache.write_bytes(cache.read_bytes()[:40])
+    assert abrir_cache(str(cache), arquivo) is None
+    cache.write_bytes(b"XXXX" + b"\0" * 100)
+    assert abrir_cache(str(cache), arquivo) is None
+
+
+def test_falha_na_escrita_nao_deixa_temporario(tmp_path, grafo, monkeypatch):
+    arquivo = _escrever(tmp_path / "arestas.txt", grafo)
+
+    def falhar(*args):
+        raise OSError("disco cheio")
+    monkeypatch.setattr(os, "replace", falhar)
+    with pytest.raises(OSError, match="disco cheio"):
+        salvar_cache(ler_grafo_csr(arquivo), str(tmp_path / "arestas.csr"), arquivo)
+    assert sorted(os.listdir(tmp_path)) == ["arestas.txt"]
@@ -0,0 +1,56 @@
+import time
+
+import networkx as nx
+import pytest
+
+from grafo_csr import GrafoCSR
+from caminhos import iterar_caminhos_simples, contar_caminhos_simples
+
+
+def _extremos(grafo):
+    nos = list(grafo)
+    return nos[0], nos[-1]
+
+
+@pytest.mark.parametrize("cutoff", [None, 3, 4])
+def test_caminhos_simples(grafo_denso, cutoff):
+    grafo = grafo_denso.subgraph(list(grafo_denso)[:12])
+    origem, destino = _extremos(grafo)
+    esperados = {tuple(c) for c in nx.all_simple_paths(grafo, origem, destino, cutoff=cutoff)}
+    for entrada in (grafo, GrafoCSR.de_networkx(grafo)):
+        assert {tuple(c) for c in iterar_caminhos_simples(entrada, origem, destino, cutoff=cutoff)} == esperados
+        assert contar_caminhos_simples(entrada, origem, destino, cutoff=cutoff) == len(esperados)
+        # Sem memorização (componentes grandes) e com pouca memória para ela
+        assert contar_caminhos_simples(entrada, origem, destino, cutoff=cutoff, max_nos_regioes=0) == len(esperados)
+        assert contar_caminhos_simples(entrada, origem, destino, cutoff=cutoff, max_estados=10) == len(esperados)
+
+
+def test_limites_de_quantidade_e_tempo():
+    completo = nx.complete_graph(12)
+    assert len(list(iterar_caminhos_simples(completo, 0, 11, limite=50))) == 50
+    assert contar_caminhos_simples(completo, 0, 11, limite=50) == 50
+    assert contar_caminhos_simples(completo, 0, 11, limite=50, max_nos_regioes=0) == 50
+    # Com o orçamento esgotado, a contagem é um limite inferior
+    menor = nx.complete_graph(9)
+    total = sum(1 for _ in nx.all_simple_paths(menor, 0, 8))
+    assert contar_caminhos_simples(menor, 0, 8) == total
+    for max_nos_regioes in (64, 0):
+        assert 0 <= contar_caminhos_simples(menor, 0, 8, tempo_limite=0.0, max_nos_regioes=max_nos_regioes) <= total
+
+
+def test_sem_caminho():
+    grafo = nx.Graph([(0, 1), (2, 3)])
+    assert list(iterar_caminhos_simples(grafo, 0, 3)) == []
+    assert contar_caminhos_simples(grafo, 0, 3) == 0
+
+
+def test_contagem_mais_rapida_que_enumeracao_em_grade():
+    grade = nx.grid_2d_graph(4, 7)
+    inicio = time.perf_counter()
+    contagem = contar_caminhos_simples(grade, (0, 0), (3, 6))
+    contando = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    enumerados = sum(1 for _ in iterar_caminhos_simples(grade, (0, 0), (3, 6)))
+    enumerando = time.perf_counter() - inicio
+    assert contagem == enumerados == 29739
+    assert contando * 2 < enumerando
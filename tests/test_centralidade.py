@@ -0,0 +1,35 @@
+import networkx as nx
+import numpy as np
+
+from centralidade import Centralidades
+
+
+def _iguais(obtido, esperado, tolerancia=1e-6):
+    assert obtido.keys() == esperado.keys()
+    assert np.allclose([obtido[no] for no in esperado], list(esperado.values()), atol=tolerancia)
+
+
+def test_matriz_de_arestas_igual_a_do_grafo(grafo):
+    arestas = np.array(list(grafo.edges)).reshape(-1, 2)
+    repetidas = np.concatenate([arestas, arestas[:, ::-1]])
+    de_arestas = Centralidades.de_arestas(repetidas)
+    de_grafo = Centralidades.de_networkx(grafo.subgraph(de_arestas.nos))
+    _iguais(de_arestas.grau(), de_grafo.grau())
+
+
+def test_grau_e_proximidade(grafo):
+    centralidades = Centralidades.de_networkx(grafo)
+    _iguais(centralidades.grau(), nx.degree_centrality(grafo))
+    _iguais(centralidades.proximidade(), nx.closeness_centrality(grafo))
+    _iguais(centralidades.proximidade(lote=3), nx.closeness_centrality(grafo))
+
+
+def test_autovetor_e_katz(grafo_conexo):
+    centralidades = Centralidades.de_networkx(grafo_conexo)
+    _iguais(centralidades.autovetor(), nx.eigenvector_centrality_numpy(grafo_conexo))
+    alpha = 0.5 / max(nx.adjacency_spectrum(grafo_conexo).real)
+    esperado = nx.katz_centrality_numpy(grafo_conexo, alpha=alpha)
+    for metodo in ("linear", "potencia"):
+        valores, convergencia = centralidades.katz(alpha=alpha, metodo=metodo, tol=1e-12)
+        _iguais(valores, esperado)
+        assert convergencia["metodo"] == metodo
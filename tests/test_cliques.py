@@ -0,0 +1,35 @@
+from collections import Counter
+
+import networkx as nx
+import pytest
+
+from grafo_csr import GrafoCSR
+from cliques import iterar_cliques_maximais, histograma_cliques, clique_maximo
+
+
+@pytest.mark.parametrize("processos", [1, 2])
+def test_cliques_maximais(grafo_denso, processos):
+    esperados = {frozenset(c) for c in nx.find_cliques(grafo_denso)}
+    for grafo in (grafo_denso, GrafoCSR.de_networkx(grafo_denso)):
+        obtidos = [frozenset(c) for c in iterar_cliques_maximais(grafo, processos=processos)]
+        assert len(obtidos) == len(set(obtidos))
+        assert set(obtidos) == esperados
+
+
+def test_histograma_e_tamanho_minimo(grafo_denso):
+    esperado = Counter(len(c) for c in nx.find_cliques(grafo_denso))
+    assert histograma_cliques(grafo_denso, processos=1) == dict(sorted(esperado.items()))
+    grandes = {frozenset(c) for c in nx.find_cliques(grafo_denso) if len(c) >= 3}
+    assert {frozenset(c) for c in iterar_cliques_maximais(grafo_denso, tamanho_minimo=3, processos=1)} == grandes
+
+
+def test_limite_de_cliques(grafo_denso):
+    assert len(list(iterar_cliques_maximais(grafo_denso, limite=3, processos=1))) == 3
+
+
+def test_clique_maximo(grafo_denso):
+    tamanho = max(len(c) for c in nx.find_cliques(grafo_denso))
+    for grafo in (grafo_denso, GrafoCSR.de_networkx(grafo_denso)):
+        clique = clique_maximo(grafo)
+        assert len(clique) == tamanho
+        assert all(grafo_denso.has_edge(u, v) for i, u in enumerate(clique) for v in clique[i + 1:])
@@ -0,0 +1,42 @@
+import networkx as nx
+import numpy as np
+
+from grafo_csr import GrafoCSR
+from componentes import UniaoBusca, componentes_de_arestas, componentes_do_grafo, listar_componentes
+
+
+def _particao(resultado):
+    return {frozenset(c.tolist()) for c in listar_componentes(resultado)}
+
+
+def _esperada(grafo):
+    return {frozenset(c) for c in nx.connected_components(grafo)}
+
+
+def test_componentes_do_grafo(grafo):
+    for entrada in (grafo, GrafoCSR.de_networkx(grafo)):
+        resultado = componentes_do_grafo(entrada)
+        assert _particao(resultado) == _esperada(grafo)
+        assert resultado["num_componentes"] == nx.number_connected_components(grafo)
+        maior = frozenset(resultado["maior_componente"].tolist())
+        assert maior in _esperada(grafo)
+        assert len(maior) == max(map(len, nx.connected_components(grafo)))
+        assert resultado["conectado"] == nx.is_connected(grafo)
+
+
+def test_uniao_em_lotes(grafo):
+    arestas = np.array(list(grafo.edges), dtype=np.int64).reshape(-1, 2)
+    uniao = UniaoBusca()
+    uniao.adicionar_nos(list(grafo.nodes))
+    for lote in np.array_split(arestas, 5):
+        uniao.unir_arestas(lote)
+    resultado = uniao.resumo()
+    assert {frozenset(resultado["nos"][resultado["componente"] == c].tolist())
+            for c in range(resultado["num_componentes"])} == _esperada(grafo)
+    assert sorted(resultado["tamanhos"].tolist()) == sorted(map(len, nx.connected_components(grafo)))
+
+
+def test_componentes_de_arestas_com_nos_isolados(grafo):
+    resultado = componentes_de_arestas(np.array(list(grafo.edges)).reshape(-1, 2), nos=grafo.nodes)
+    assert _particao(resultado) == _esperada(grafo)
+
@@ -0,0 +1,54 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from grafo_csr import GrafoCSR
+from distancias import varredura_bfs, resumir_componentes, diametro_e_raio, distancia_media_amostrada
+
+
+def _por_componente(grafo, csr):
+    """Subgrafo do NetworkX de cada componente, na ordem de `csr.lista_componentes()`."""
+    return [grafo.subgraph(csr.rotulo(i) for i in componente.tolist()) for componente in csr.lista_componentes()]
+
+
+@pytest.mark.parametrize("processos", [1, 2])
+def test_varredura_resume_cada_componente(grafo, processos):
+    csr = GrafoCSR.de_networkx(grafo)
+    resumo = resumir_componentes(csr, varredura_bfs(csr, processos=processos))
+    for item, subgrafo in zip(resumo, _por_componente(grafo, csr)):
+        if len(subgrafo) == 1:
+            assert item["diametro"] == 0 and item["distancia_media"] == 0
+            continue
+        assert np.isclose(item["distancia_media"], nx.average_shortest_path_length(subgrafo))
+        assert item["diametro"] == nx.diameter(subgrafo)
+        assert item["raio"] == nx.radius(subgrafo)
+        u, v = (csr.rotulo(i) for i in item["extremos"])
+        assert nx.shortest_path_length(subgrafo, u, v) == item["diametro"]
+
+
+def test_histograma_conta_os_pares_ordenados_distintos(grafo):
+    csr = GrafoCSR.de_networkx(grafo)
+    histograma = varredura_bfs(csr, processos=1)["histograma"]
+    esperado = np.zeros(len(histograma), dtype=np.int64)
+    for _, distancias in nx.all_pairs_shortest_path_length(grafo):
+        for d in distancias.values():
+            esperado[d] += d > 0
+    assert np.array_equal(histograma, esperado)
+
+
+def test_diametro_e_raio_por_limites(grafo):
+    csr = GrafoCSR.de_networkx(grafo)
+    for componente, subgrafo in zip(csr.lista_componentes(), _por_componente(grafo, csr)):
+        resultado = diametro_e_raio(csr, componente)
+        assert resultado["diametro"] == nx.diameter(subgrafo)
+        assert resultado["raio"] == nx.radius(subgrafo)
+        centro = csr.rotulo(resultado["centro"])
+        assert nx.eccentricity(subgrafo, centro) == resultado["raio"]
+
+
+def test_media_amostrada_com_todas_as_origens_e_exata(grafo_conexo):
+    csr = GrafoCSR.de_networkx(grafo_conexo)
+    componente = np.arange(csr.num_nos)
+    for estrategia in ("uniforme", "grau"):
+        resultado = distancia_media_amostrada(csr, componente, amostras=csr.num_nos, estrategia=estrategia, semente=0)
+        assert np.isclose(resultado["media"], nx.average_shortest_path_length(grafo_conexo))
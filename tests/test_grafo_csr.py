@@ -0,0 +1,73 @@
+import networkx as nx
+import numpy as np
+
+from grafo_csr import GrafoCSR, caminho_bfs
+import codigo_trabalho_1
+
+
+def _arestas(grafo):
+    return {frozenset(aresta) for aresta in grafo.edges}
+
+
+def test_conversao_preserva_nos_e_arestas(grafo):
+    csr = GrafoCSR.de_networkx(grafo)
+    assert csr.num_nos == grafo.number_of_nodes()
+    assert csr.num_arestas == grafo.number_of_edges()
+    volta = csr.para_networkx()
+    assert set(volta.nodes) == set(grafo.nodes)
+    assert _arestas(volta) == _arestas(grafo)
+
+
+def test_vizinhos_grau_e_densidade(grafo):
+    csr = GrafoCSR.de_networkx(grafo)
+    for no in grafo:
+        i = csr.indice(no)
+        assert {csr.rotulo(j) for j in csr.vizinhos(i).tolist()} == set(grafo[no])
+        assert csr.grau()[i] == grafo.degree(no)
+    assert np.isclose(csr.densidade(), nx.density(grafo))
+
+
+def test_de_arestas_unifica_repetidas_e_reciprocas():
+    csr = GrafoCSR.de_arestas(np.array([[1, 2], [2, 1], [1, 2], [2, 3], [5, 5]]))
+    assert _arestas(csr.para_networkx()) == _arestas(nx.Graph([(1, 2), (2, 3), (5, 5)]))
+
+
+def test_bfs_e_caminho(grafo):
+    csr = GrafoCSR.de_networkx(grafo)
+    for origem in list(grafo)[:5]:
+        esperado = nx.single_source_shortest_path_length(grafo, origem)
+        distancia = csr.bfs(csr.indice(origem))
+        assert {csr.rotulo(i): int(d) for i, d in enumerate(distancia) if d >= 0} == esperado
+        for destino in list(grafo)[-5:]:
+            caminho = caminho_bfs(csr, csr.indice(origem), csr.indice(destino))
+            if destino not in esperado:
+                assert caminho is None
+                continue
+            assert len(caminho) - 1 == esperado[destino]
+            assert all(grafo.has_edge(csr.rotulo(a), csr.rotulo(b)) for a, b in zip(caminho, caminho[1:]))
+
+
+def test_componentes_na_ordem_do_menor_indice(grafo):
+    csr = GrafoCSR.de_networkx(grafo)
+    rotulo = csr.componentes()
+    esperadas = {frozenset(c) for c in nx.connected_components(grafo)}
+    obtidas = {frozenset(csr.rotulo(i) for i in c.tolist()) for c in csr.lista_componentes()}
+    assert obtidas == esperadas
+    _, primeiro = np.unique(rotulo, return_index=True)
+    assert (np.diff(primeiro) > 0).all()
+
+
+
+def test_rotulos_tupla_e_mistos():
+    grade = nx.grid_2d_graph(3, 3)
+    csr = GrafoCSR.de_networkx(grade)
+    assert csr.rotulos.shape == (9,)
+    assert (0, 0) in csr and (3, 3) not in csr
+    assert all(csr.rotulo(csr.indice(no)) == no for no in grade)
+    assert _arestas(csr.para_networkx()) == _arestas(grade)
+    assert codigo_trabalho_1.get_diameter(grade, desenhar=False)["connected"]["diameter"] == nx.diameter(grade)
+
+    mistos = nx.Graph([(1, "a"), ("a", (2, 3)), ((2, 3), 1.5)])
+    csr = GrafoCSR.de_networkx(mistos)
+    assert csr.rotulos.shape == (4,)
+    assert all(csr.rotulo(csr.indice(no)) == no for no in mistos)
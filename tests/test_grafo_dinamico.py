@@ -0,0 +1,74 @@
+import random
+
+import networkx as nx
+import numpy as np
+
+from grafo_dinamico import GrafoDinamico
+
+
+def _esperada(grafo):
+    return {frozenset(c) for c in nx.connected_components(grafo)}
+
+
+def test_grafo_dinamico_acompanha_insercoes_e_remocoes(grafo):
+    rng = random.Random(len(grafo))
+    dinamico = GrafoDinamico.de_networkx(grafo)
+    referencia = grafo.copy()
+    nos = list(grafo.nodes)
+    for _ in range(10):
+        removidas = rng.sample(list(referencia.edges), min(3, referencia.number_of_edges()))
+        inseridas = [tuple(rng.sample(nos, 2)) for _ in range(3)]
+        dinamico.remover_arestas(removidas)
+        referencia.remove_edges_from(removidas)
+        dinamico.inserir_arestas(inseridas)
+        referencia.add_edges_from(inseridas)
+        assert dinamico.num_arestas == referencia.number_of_edges()
+        assert dinamico.num_componentes == nx.number_connected_components(referencia)
+        assert {frozenset(c) for c in dinamico.componentes()} == _esperada(referencia)
+        assert np.isclose(dinamico.densidade(), nx.density(referencia))
+
+
+def _floresta_valida(dinamico):
+    floresta = nx.Graph()
+    floresta.add_nodes_from(dinamico.adjacencia)
+    floresta.add_edges_from((u, v) for u, vizinhos in dinamico._floresta.items() for v in vizinhos)
+    assert nx.is_forest(floresta)
+    assert all(dinamico.adjacencia[u].issuperset(vizinhos) for u, vizinhos in dinamico._floresta.items())
+    assert nx.number_connected_components(floresta) == dinamico.num_componentes
+
+
+def test_floresta_geradora_em_lotes_aleatorios():
+    rng = random.Random(0)
+    referencia = nx.gnm_random_graph(60, 90, seed=0)
+    dinamico = GrafoDinamico.de_networkx(referencia)
+    for _ in range(40):
+        removidas = rng.sample(list(referencia.edges), min(8, referencia.number_of_edges()))
+        inseridas = [tuple(rng.sample(range(60), 2)) for _ in range(6)]
+        dinamico.aplicar(inseridas=inseridas, removidas=removidas)
+        referencia.remove_edges_from(removidas)
+        referencia.add_edges_from(inseridas)
+        _floresta_valida(dinamico)
+        assert {frozenset(c) for c in dinamico.componentes()} == _esperada(referencia)
+
+
+def test_remover_aresta_fora_da_floresta_nao_busca(monkeypatch):
+    dinamico = GrafoDinamico.de_networkx(nx.cycle_graph(1000))
+    fora = [(u, v) for u, vizinhos in dinamico.adjacencia.items() for v in vizinhos if v not in dinamico._floresta[u]]
+    assert len(fora) == 2  # A única aresta do ciclo fora da floresta, nos dois sentidos
+
+    def sem_busca(u, v):
+        raise AssertionError("a remoção de uma aresta fora da floresta não deve buscar")
+    monkeypatch.setattr(dinamico, "_arvore_menor", sem_busca)
+    dinamico.remover_arestas(fora[:1])
+    assert dinamico.conectado() and dinamico.num_arestas == 999
+
+
+def test_aresta_substituta_mantem_a_componente():
+    ciclo = nx.cycle_graph(10)
+    dinamico = GrafoDinamico.de_networkx(ciclo)
+    for u, v in list(ciclo.edges):
+        dinamico.remover_arestas([(u, v)])
+        ciclo.remove_edge(u, v)
+        _floresta_valida(dinamico)
+        assert dinamico.num_componentes == nx.number_connected_components(ciclo)
+    assert dinamico.num_componentes == 10
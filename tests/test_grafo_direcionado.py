@@ -0,0 +1,65 @@
+import networkx as nx
+import numpy as np
+
+from grafo_direcionado import GrafoDirecionadoCSR
+
+
+def _particao(resultado):
+    nos, componente = resultado["nos"], resultado["componente"]
+    return {frozenset(nos[componente == c].tolist()) for c in range(resultado["num_componentes"])}
+
+
+def test_graus_e_conversao(digrafo):
+    grafo = GrafoDirecionadoCSR.de_networkx(digrafo)
+    assert grafo.num_arestas == digrafo.number_of_edges()
+    for no in digrafo:
+        i = grafo.indice(no)
+        assert grafo.grau_saida()[i] == digrafo.out_degree(no)
+        assert grafo.grau_entrada()[i] == digrafo.in_degree(no)
+    volta = grafo.para_networkx()
+    assert set(volta.edges) == set(digrafo.edges)
+    assert {frozenset(a) for a in grafo.nao_direcionado().para_networkx().edges} == \
+        {frozenset(a) for a in digrafo.to_undirected().edges}
+
+
+def test_de_arestas_mantem_o_sentido():
+    grafo = GrafoDirecionadoCSR.de_arestas(np.array([[1, 2], [1, 2], [2, 1], [2, 3]]))
+    assert set(grafo.para_networkx().edges) == {(1, 2), (2, 1), (2, 3)}
+
+
+def test_componentes_fortes_e_fracas(digrafo):
+    grafo = GrafoDirecionadoCSR.de_networkx(digrafo)
+    fortes = grafo.componentes_fortes()
+    assert _particao(fortes) == {frozenset(c) for c in nx.strongly_connected_components(digrafo)}
+    assert len(fortes["maior_componente"]) == max(map(len, nx.strongly_connected_components(digrafo)))
+    assert _particao(grafo.componentes_fracas()) == {frozenset(c) for c in nx.weakly_connected_components(digrafo)}
+
+
+def test_alcancabilidade(digrafo):
+    grafo = GrafoDirecionadoCSR.de_networkx(digrafo)
+    nos = list(digrafo)
+    for u in nos[::4]:
+        assert set(grafo.alcancaveis(u).tolist()) == nx.descendants(digrafo, u) | {u}
+        assert set(grafo.alcancaveis(u, reverso=True).tolist()) == nx.ancestors(digrafo, u) | {u}
+        for v in nos[1::5]:
+            assert grafo.alcanca(u, v) == nx.has_path(digrafo, u, v)
+
+
+def test_diametro_da_maior_componente_forte(digrafo):
+    resultado = GrafoDirecionadoCSR.de_networkx(digrafo).diametro()
+    maior = digrafo.subgraph(resultado["nos"].tolist())
+    assert nx.is_strongly_connected(maior)
+    assert len(maior) == max(map(len, nx.strongly_connected_components(digrafo)))
+    assert resultado["diametro"] == nx.diameter(maior)
+    assert resultado["raio"] == nx.radius(maior)
+    u, v = resultado["extremos"]
+    assert nx.shortest_path_length(maior, u, v) == resultado["diametro"]
+
+
+def test_rotulos_tupla():
+    digrafo = nx.DiGraph(nx.grid_2d_graph(2, 2))
+    grafo = GrafoDirecionadoCSR.de_networkx(digrafo)
+    assert grafo.rotulos.shape == (4,)
+    assert (0, 0) in grafo and (2, 2) not in grafo
+    assert set(grafo.para_networkx().edges) == set(digrafo.edges)
+    assert grafo.alcanca((0, 0), (1, 1))
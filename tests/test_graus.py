@@ -0,0 +1,58 @@
+import networkx as nx
+import numpy as np
+
+import graus
+from graus import graus_de_arestas, graus_de_arquivo, _arestas_novas
+
+
+def _arestas_com_repeticoes(grafo):
+    arestas = np.array(list(grafo.edges), dtype=np.int64).reshape(-1, 2)
+    return np.concatenate([arestas, arestas[::2, ::-1], arestas[::3]])
+
+
+def _graus_esperados(grafo):
+    return sorted(grau for _, grau in grafo.degree() if grau)
+
+
+def test_arquivo_e_arestas_unificam_repetidas(tmp_path, grafo):
+    arestas = _arestas_com_repeticoes(grafo)
+    arquivo = tmp_path / "arestas.txt"
+    arquivo.write_text("# FromNodeId\tToNodeId\n" + "".join(f"{u}\t{v}\n" for u, v in arestas))
+    assert sorted(graus_de_arestas(arestas).tolist()) == _graus_esperados(grafo)
+    assert sorted(graus_de_arquivo(str(arquivo), unicas=True).tolist()) == _graus_esperados(grafo)
+    assert graus_de_arquivo(str(arquivo)).sum() == 2 * len(arestas)
+
+
+def test_arquivo_conta_cada_linha_por_padrao(tmp_path, grafo):
+    arquivo = tmp_path / "arestas.txt"
+    arquivo.write_text("".join(f"{u}\t{v}\n" for u, v in grafo.edges))
+    assert sorted(graus_de_arquivo(str(arquivo)).tolist()) == _graus_esperados(grafo)
+
+
+def test_identificadores_de_64_bits(tmp_path):
+    grande = 2 ** 40
+    arquivo = tmp_path / "arestas.txt"
+    arquivo.write_text(f"1\t{grande}\n{grande}\t1\n{grande}\t{grande + 1}\n")
+    assert sorted(graus_de_arquivo(str(arquivo), unicas=True).tolist()) == [1, 1, 2]
+
+
+def test_repetidas_entre_blocos(grafo):
+    arestas = _arestas_com_repeticoes(grafo)
+    chaves = None
+    novas = []
+    for bloco in np.array_split(arestas, 7):
+        chaves, pares = _arestas_novas(chaves, bloco)
+        novas.append(pares)
+    novas = np.concatenate(novas)
+    assert {frozenset(par) for par in novas.tolist()} == {frozenset(aresta) for aresta in grafo.edges}
+    assert len(novas) == grafo.number_of_edges()
+
+
+def test_contagem_esparsa_igual_a_densa(tmp_path, grafo, monkeypatch):
+    arestas = _arestas_com_repeticoes(grafo)
+    arquivo = tmp_path / "arestas.txt"
+    arquivo.write_text("".join(f"{u}\t{v}\n" for u, v in arestas))
+    densos = [graus_de_arquivo(str(arquivo), unicas=unicas) for unicas in (False, True)]
+    monkeypatch.setattr(graus, "MAX_ID_DENSO", 50)
+    esparsos = [graus_de_arquivo(str(arquivo), unicas=unicas) for unicas in (False, True)]
+    assert all(np.array_equal(d, e) for d, e in zip(densos, esparsos))
@@ -0,0 +1,56 @@
+import itertools
+import random
+
+import networkx as nx
+import pytest
+
+from hamiltoniano import ciclo_hamiltoniano
+
+
+def _tem_ciclo(grafo):
+    """Força bruta: testa todas as permutações com o primeiro nó fixo."""
+    primeiro, *resto = list(grafo)
+    if len(grafo) < 3:
+        return False
+    for ordem in itertools.permutations(resto):
+        ciclo = (primeiro, *ordem, primeiro)
+        if all(grafo.has_edge(u, v) for u, v in zip(ciclo, ciclo[1:])):
+            return True
+    return False
+
+
+def _valido(grafo, ciclo):
+    assert sorted(ciclo) == sorted(grafo)
+    assert all(grafo.has_edge(u, v) for u, v in zip(ciclo, ciclo[1:] + ciclo[:1]))
+
+
+@pytest.mark.parametrize("max_nos_dp", [16, 0])
+@pytest.mark.parametrize("semente", range(30))
+def test_igual_a_forca_bruta(semente, max_nos_dp):
+    rng = random.Random(semente)
+    grafo = nx.gnp_random_graph(rng.randint(4, 8), rng.uniform(0.3, 0.8), seed=semente)
+    estado, ciclo = ciclo_hamiltoniano(grafo, max_nos_dp=max_nos_dp)
+    assert estado == ("sim" if _tem_ciclo(grafo) else "nao")
+    if ciclo is not None:
+        _valido(grafo, ciclo)
+
+
+@pytest.mark.parametrize("max_nos_dp", [16, 0])
+def test_grafos_conhecidos(max_nos_dp):
+    assert ciclo_hamiltoniano(nx.petersen_graph(), max_nos_dp=max_nos_dp) == ("nao", None)
+    dodecaedro = nx.dodecahedral_graph()
+    estado, ciclo = ciclo_hamiltoniano(dodecaedro, max_nos_dp=max_nos_dp)
+    assert estado == "sim"
+    _valido(dodecaedro, ciclo)
+
+
+def test_podas_sem_busca():
+    assert ciclo_hamiltoniano(nx.path_graph(6))[0] == "nao"  # Grau 1
+    assert ciclo_hamiltoniano(nx.complete_bipartite_graph(3, 5))[0] == "nao"  # Lados desiguais
+    borboleta = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 2)])
+    assert ciclo_hamiltoniano(borboleta)[0] == "nao"  # Articulação
+
+
+def test_orcamento_esgotado():
+    grafo = nx.random_regular_graph(3, 40, seed=1)
+    assert ciclo_hamiltoniano(grafo, max_nos_dp=0, limite_nos=1) == ("desconhecido", None)
@@ -0,0 +1,104 @@
+import json
+import os
+import time
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from instrumentacao import Instrumentacao
+
+
+@pytest.fixture
+def instrumentacao():
+    coletor = Instrumentacao()
+    yield coletor
+    coletor.desativar()
+
+
+def test_desligada_nao_registra(instrumentacao):
+    @instrumentacao.instrumentar()
+    def dobro(x):
+        return 2 * x
+
+    assert dobro(3) == 6
+    with instrumentacao.etapa("fora"):
+        pass
+    assert instrumentacao.eventos == []
+
+
+def test_etapas_aninhadas_e_tamanho_do_grafo(instrumentacao):
+    instrumentacao.ativar()
+
+    @instrumentacao.instrumentar("calculo")
+    def filha(grafo):
+        time.sleep(0.01)
+        return len(grafo)
+
+    with instrumentacao.etapa("mae", "questao", dado=1):
+        time.sleep(0.01)
+        assert filha(nx.path_graph(4)) == 4
+
+    filha_evento, mae = instrumentacao.eventos
+    assert (filha_evento["nome"], filha_evento["profundidade"]) == ("filha", 1)
+    assert (filha_evento["nos"], filha_evento["arestas"]) == (4, 3)
+    assert (mae["nome"], mae["categoria"], mae["profundidade"], mae["dados"]) == ("mae", "questao", 0, {"dado": 1})
+    assert mae["proprio_us"] == pytest.approx(mae["duracao_us"] - filha_evento["duracao_us"])
+    assert instrumentacao.resumo()["filha"]["chamadas"] == 1
+
+
+def test_erro_fica_no_evento(instrumentacao):
+    instrumentacao.ativar()
+    with pytest.raises(ValueError):
+        with instrumentacao.etapa("falha"):
+            raise ValueError("ruim")
+    assert instrumentacao.eventos[0]["erro"] == "ValueError: ruim"
+
+
+def test_gerador_mede_a_iteracao(instrumentacao):
+    instrumentacao.ativar()
+
+    @instrumentacao.instrumentar()
+    def contar(n):
+        for i in range(n):
+            time.sleep(0.002)
+            yield i
+
+    itens = []
+    for item in contar(5):
+        itens.append(item)
+        time.sleep(0.03)  # Tempo do consumidor: fica fora da etapa de iteração
+    assert itens == list(range(5))
+    criacao, iteracao = instrumentacao.eventos
+    assert criacao["nome"] == "contar"
+    assert iteracao["nome"] == "contar:iteracao" and iteracao["dados"] == {"itens": 5}
+    assert 10_000 <= iteracao["duracao_us"] < 100_000
+
+
+def test_pico_de_memoria(instrumentacao):
+    instrumentacao.ativar(memoria=True)
+    with instrumentacao.etapa("aloca"):
+        array = np.ones(2**20)
+        del array
+    evento = instrumentacao.eventos[0]
+    assert evento["memoria_extra"] >= 8 * 2**20
+
+
+def test_perfil_e_saidas(tmp_path, instrumentacao):
+    instrumentacao.ativar(perfilar="soma", diretorio_perfis=str(tmp_path / "perfis"))
+
+    @instrumentacao.instrumentar()
+    def soma(n):
+        return sum(range(n))
+
+    soma(1000)
+    assert os.path.exists(tmp_path / "perfis" / "soma.prof")
+    assert "function calls" in instrumentacao.perfis["soma"]
+
+    log = tmp_path / "log.jsonl"
+    instrumentacao.salvar_log(str(log))
+    assert [json.loads(linha)["nome"] for linha in log.read_text().splitlines()] == ["soma"]
+
+    trace = json.loads(open(instrumentacao.salvar_chrome_trace(str(tmp_path / "trace.json"))).read())
+    fases = sorted(evento["ph"] for evento in trace["traceEvents"])
+    assert fases == ["M", "X"]
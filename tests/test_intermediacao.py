@@ -0,0 +1,36 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from intermediacao import intermediacao, intermediacao_rk, intermediacao_top_k
+
+
+def _iguais(obtido, esperado, tolerancia=1e-6):
+    assert obtido.keys() == esperado.keys()
+    assert np.allclose([obtido[no] for no in esperado], list(esperado.values()), atol=tolerancia)
+
+
+@pytest.mark.parametrize("processos", [1, 2])
+@pytest.mark.parametrize("normalizado", [True, False])
+def test_intermediacao_exata(grafo, processos, normalizado):
+    esperado = nx.betweenness_centrality(grafo, normalized=normalizado)
+    _iguais(intermediacao(grafo, normalizado=normalizado, processos=processos), esperado)
+    _iguais(intermediacao(grafo, normalizado=normalizado, processos=processos, lote=5), esperado)
+
+
+def test_intermediacao_amostrada_com_todas_as_fontes_e_exata(grafo):
+    # Sem rodadas estáveis suficientes, as rodadas esgotam as fontes e o resultado é exato
+    valores, relatorio = intermediacao_top_k(grafo, top=3, lote=8, rodadas_estaveis=10**6, seed=0, processos=1)
+    assert relatorio["exato"]
+    assert relatorio["fontes"] == grafo.number_of_nodes()
+    _iguais(valores, nx.betweenness_centrality(grafo))
+
+
+def test_intermediacao_rk_dentro_do_erro(grafo_conexo):
+    epsilon = 0.05
+    n = grafo_conexo.number_of_nodes()
+    estimativa = intermediacao_rk(grafo_conexo, epsilon=epsilon, delta=0.1, seed=0)
+    exata = nx.betweenness_centrality(grafo_conexo)
+    # A garantia vale na escala dos pares ordenados n(n - 1); a normalização do NetworkX divide por (n - 1)(n - 2)
+    erro = max(abs(estimativa[no] - exata[no]) for no in exata) * (n - 2) / n
+    assert erro <= epsilon
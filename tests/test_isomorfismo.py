@@ -0,0 +1,69 @@
+import os
+
+import networkx as nx
+import pytest
+
+import isomorfismo
+from grafo_csr import GrafoCSR, ler_grafo_csr
+from isomorfismo import classes_isomorfismo, verificar_isomorfismo
+
+DIRETORIO = os.path.join(os.path.dirname(__file__), os.pardir, "trabalho_1")
+
+
+def _aranha(pernas):
+    """Árvore com um centro (nó 0) e caminhos com os comprimentos dados."""
+    grafo = nx.Graph()
+    proximo = 1
+    for comprimento in pernas:
+        anterior = 0
+        for _ in range(comprimento):
+            grafo.add_edge(anterior, proximo)
+            anterior, proximo = proximo, proximo + 1
+    return grafo
+
+
+def _renomeado(grafo, semente=0):
+    nos = list(grafo)
+    embaralhados = list(nos)
+    nx.utils.create_random_state(semente).shuffle(embaralhados)
+    return nx.relabel_nodes(grafo, dict(zip(nos, embaralhados)))
+
+
+def test_gnutella08_e_09_diferem_nos_invariantes():
+    grafos = [ler_grafo_csr(os.path.join(DIRETORIO, f"p2p-Gnutella0{i}.txt")) for i in (8, 9)]
+    resultado = verificar_isomorfismo(*grafos)
+    assert resultado == {"estado": "nao", "etapa": "invariantes", "motivo": "número de nós"}
+
+
+def test_hash_wl_rejeita_mesmos_invariantes():
+    # Mesma sequência de graus, sem triângulos e conexas: só o WL distingue
+    resultado = verificar_isomorfismo(_aranha((1, 2, 3)), _aranha((2, 2, 2)))
+    assert (resultado["estado"], resultado["etapa"]) == ("nao", "wl")
+
+
+def test_vf2pp_pequeno_no_proprio_processo(grafo_conexo, monkeypatch):
+    def sem_processos():
+        raise AssertionError("grafos pequenos não devem criar processos")
+    monkeypatch.setattr(isomorfismo, "_contexto_processos", sem_processos)
+    resultado = verificar_isomorfismo(grafo_conexo, GrafoCSR.de_networkx(_renomeado(grafo_conexo)), tempo_limite=5)
+    assert (resultado["estado"], resultado["etapa"]) == ("sim", "vf2pp")
+
+
+def test_prazo_esgotado_fica_desconhecido(monkeypatch):
+    monkeypatch.setattr(isomorfismo, "MAX_NOS_NO_PROCESSO", 0)
+    grafo = nx.random_regular_graph(3, 300, seed=0)
+    resultado = verificar_isomorfismo(grafo, _renomeado(grafo), tempo_limite=1e-3)
+    assert resultado == {"estado": "desconhecido", "etapa": "vf2pp", "motivo": None}
+
+
+def test_classes_e_indeterminados(monkeypatch):
+    ciclo = nx.cycle_graph(8)
+    grafos = {"a": ciclo, "b": _renomeado(ciclo), "c": nx.path_graph(8), "d": _aranha((1, 2, 3))}
+    classes = classes_isomorfismo(grafos)
+    assert sorted(map(sorted, classes["classes"])) == [["a", "b"], ["c"], ["d"]]
+    assert classes["indeterminados"] == {}
+
+    monkeypatch.setattr(isomorfismo, "_vf2pp", lambda grafo1, grafo2, tempo_limite: None)
+    classes = classes_isomorfismo(grafos, tempo_limite=1)
+    assert sorted(map(sorted, classes["classes"])) == [["a"], ["c"], ["d"]]
+    assert classes["indeterminados"] == {"b": ["a"]}
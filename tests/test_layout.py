@@ -0,0 +1,57 @@
+import os
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from layout import (
+    arestas_indexadas, hash_grafo, layout_forcas, layout_em_cache, _repulsao_exata, _repulsao_barnes_hut
+)
+
+
+@pytest.mark.parametrize("n", [300, 2000])
+def test_barnes_hut_aproxima_a_repulsao_exata(n):
+    pos = np.random.default_rng(n).random((n, 2))
+    exata = _repulsao_exata(pos, 1.0 / n)
+    aproximada = _repulsao_barnes_hut(pos, 1.0 / n, int(np.ceil(np.log(n / 2) / np.log(4))))
+    assert np.linalg.norm(aproximada - exata) <= 0.02 * np.linalg.norm(exata)
+
+
+@pytest.mark.parametrize("limite_exato", [1000, 0])
+def test_posicoes_normalizadas_e_reproduziveis(grafo, limite_exato):
+    nos, pares = arestas_indexadas(grafo)
+    pos = layout_forcas(len(nos), pares, iteracoes=30, seed=3, limite_exato=limite_exato)
+    assert pos.shape == (len(nos), 2)
+    assert np.isfinite(pos).all()
+    assert np.abs(pos).max() == pytest.approx(1.0)
+    assert np.allclose(pos.mean(axis=0), 0, atol=1e-9)
+    assert np.array_equal(pos, layout_forcas(len(nos), pares, iteracoes=30, seed=3, limite_exato=limite_exato))
+
+
+def test_arestas_ficam_curtas():
+    grafo = nx.grid_2d_graph(15, 15)
+    nos, pares = arestas_indexadas(grafo)
+    pos = layout_forcas(len(nos), pares, iteracoes=100, seed=0, limite_exato=0)
+    arestas = np.linalg.norm(pos[pares[:, 0]] - pos[pares[:, 1]], axis=1).mean()
+    aleatorios = np.random.default_rng(0).integers(len(nos), size=(1000, 2))
+    quaisquer = np.linalg.norm(pos[aleatorios[:, 0]] - pos[aleatorios[:, 1]], axis=1).mean()
+    assert arestas < 0.3 * quaisquer
+
+
+def test_hash_independe_da_ordem_das_arestas(grafo):
+    nos, pares = arestas_indexadas(grafo)
+    embaralhados = np.random.default_rng(0).permutation(pares)[:, ::-1]
+    assert hash_grafo(nos, embaralhados) == hash_grafo(nos, pares)
+    if len(pares):
+        assert hash_grafo(nos, pares[1:]) != hash_grafo(nos, pares)
+
+
+def test_layout_em_cache(tmp_path, grafo):
+    primeiro = layout_em_cache(grafo, iteracoes=10, diretorio=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+    segundo = layout_em_cache(grafo, iteracoes=10, diretorio=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+    assert primeiro.keys() == set(grafo)
+    assert all(np.array_equal(primeiro[no], segundo[no]) for no in grafo)
+    layout_em_cache(grafo, iteracoes=10, seed=7, diretorio=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 2
@@ -0,0 +1,47 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from leitura import iterar_blocos_arestas, ler_arestas
+import codigo_trabalho_1
+
+
+def _escrever(caminho, grafo, final="\n"):
+    linhas = ["# Directed graph: teste", "# FromNodeId\tToNodeId"] + [f"{u}\t{v}" for u, v in grafo.edges]
+    caminho.write_text("\n".join(linhas) + final)
+    return str(caminho)
+
+
+@pytest.mark.parametrize("tamanho_bloco", [7, 64, 4 * 1024 * 1024])
+def test_blocos_cortados_no_meio_da_linha(tmp_path, grafo, tamanho_bloco):
+    arquivo = _escrever(tmp_path / "arestas.txt", grafo)
+    blocos = list(iterar_blocos_arestas(arquivo, tamanho_bloco=tamanho_bloco))
+    assert np.concatenate(blocos).tolist() == [list(aresta) for aresta in grafo.edges]
+
+
+def test_ultima_linha_sem_quebra_e_fim_de_linha_windows(tmp_path):
+    arquivo = tmp_path / "arestas.txt"
+    arquivo.write_bytes(b"# comentario\r\n  # indentado 9 9\r\n1\t2\r\n3 4\r\n\r\n10\t20")
+    assert ler_arestas(str(arquivo), tamanho_bloco=5).tolist() == [[1, 2], [3, 4], [10, 20]]
+
+
+def test_limite_de_arestas(tmp_path, grafo):
+    arquivo = _escrever(tmp_path / "arestas.txt", grafo)
+    limite = grafo.number_of_edges() // 2
+    assert ler_arestas(arquivo, max_arestas=limite, tamanho_bloco=16).tolist() == \
+        [list(aresta) for aresta in list(grafo.edges)[:limite]]
+    assert list(iterar_blocos_arestas(arquivo, max_arestas=0)) == []
+
+
+@pytest.mark.parametrize("conteudo", [b"1\t2\n3\n", b"1\t2\n3\tx\n", b"1\t2\t3\n"])
+def test_linha_invalida(tmp_path, conteudo):
+    arquivo = tmp_path / "arestas.txt"
+    arquivo.write_bytes(conteudo)
+    with pytest.raises(ValueError, match="Linha inválida"):
+        ler_arestas(str(arquivo))
+
+
+def test_arquivo_inteiro_vira_o_grafo(tmp_path, grafo):
+    arquivo = _escrever(tmp_path / "arestas.txt", grafo, final="")
+    lido = codigo_trabalho_1.ler_grafo_nao_direcionado(arquivo)
+    assert nx.utils.edges_equal(lido.edges, grafo.edges)
@@ -0,0 +1,65 @@
+import itertools
+
+import networkx as nx
+import pytest
+
+from grafo_csr import GrafoCSR
+from menores_caminhos import ServicoCaminhos, caminho_bidirecional
+import codigo_trabalho_1
+
+
+def _valido(grafo, caminho, origem, destino, comprimento):
+    assert caminho[0] == origem and caminho[-1] == destino
+    assert len(caminho) - 1 == comprimento
+    assert all(grafo.has_edge(u, v) for u, v in zip(caminho, caminho[1:]))
+
+
+def _pares(grafo, quantidade=60):
+    nos = list(grafo)
+    return list(itertools.islice(itertools.product(nos[::3], nos[1::4]), quantidade))
+
+
+def test_busca_bidirecional(grafo):
+    csr = GrafoCSR.de_networkx(grafo)
+    for origem, destino in _pares(grafo):
+        caminho = caminho_bidirecional(csr, csr.indice(origem), csr.indice(destino))
+        if not nx.has_path(grafo, origem, destino):
+            assert caminho is None
+            continue
+        _valido(grafo, [csr.rotulo(i) for i in caminho], origem, destino,
+                nx.shortest_path_length(grafo, origem, destino))
+
+
+@pytest.mark.parametrize("marcos", [0, 4])
+@pytest.mark.parametrize("trabalhadores", [1, 2])
+def test_servico_responde_cada_par(grafo, marcos, trabalhadores):
+    servico = ServicoCaminhos(grafo, marcos=marcos)
+    pares = _pares(grafo)
+    caminhos = servico.caminhos(pares, trabalhadores=trabalhadores)
+    distancias = servico.distancias(pares, trabalhadores=trabalhadores)
+    assert len(caminhos) == len(distancias) == len(pares)
+    for (origem, destino), caminho, distancia in zip(pares, caminhos, distancias):
+        if not nx.has_path(grafo, origem, destino):
+            assert caminho is None
+            assert not servico.alcancavel(origem, destino)
+            continue
+        esperado = nx.shortest_path_length(grafo, origem, destino)
+        _valido(grafo, caminho, origem, destino, esperado)
+        assert distancia == esperado
+
+
+def test_limites_alt_contem_a_distancia(grafo):
+    servico = ServicoCaminhos(grafo, marcos=4)
+    for origem, destino in _pares(grafo):
+        inferior, superior = servico.limites_distancia(origem, destino)
+        if not nx.has_path(grafo, origem, destino):
+            assert (inferior, superior) == (None, None)
+            continue
+        distancia = nx.shortest_path_length(grafo, origem, destino)
+        assert inferior <= distancia
+        assert superior is None or distancia <= superior
+
+
+def test_pares_invalidos_ficam_na_posicao():
+    caminhos = codigo_trabalho_1.get_shortest_paths(nx.path_graph(5), [(0, 4), (0, 99), (1, 3)], trabalhadores=1)
+    assert caminhos == [[0, 1, 2, 3, 4], None, [1, 2, 3]]
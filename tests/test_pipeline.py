@@ -0,0 +1,117 @@
+import json
+import time
+
+import networkx as nx
+import pytest
+
+import pipeline
+from pipeline import ContextoAnalise, executar_questionario
+
+
+def _parametros(grafo):
+    nos = list(grafo)
+    return {
+        "origem_caminhos": nos[0], "destino_caminhos": nos[-1], "limite_caminhos": 50,
+        "origem_menor_caminho": nos[0], "destino_menor_caminho": nos[-1],
+        "vertice_excentricidade": nos[1], "tempo_limite": 5,
+    }
+
+
+def test_respostas_iguais_as_do_networkx(grafo_conexo):
+    relatorio = executar_questionario(
+        grafo_conexo, caminho_relatorio=None, processos=1, grafo_comparacao=grafo_conexo, **_parametros(grafo_conexo)
+    )
+    questoes = relatorio["questoes"]
+    assert list(questoes) == list(pipeline.QUESTOES)
+    assert not [nome for nome, entrada in questoes.items() if "erro" in entrada]
+    assert all(entrada["titulo"] == pipeline.QUESTOES[nome][0] for nome, entrada in questoes.items())
+
+    nos = list(grafo_conexo)
+    resultado = {nome: entrada["resultado"] for nome, entrada in questoes.items()}
+    assert len(resultado["4_menor_caminho"]) - 1 == nx.shortest_path_length(grafo_conexo, nos[0], nos[-1])
+    assert resultado["6_excentricidade"]["excentricidade"] == nx.eccentricity(grafo_conexo, nos[1])
+    assert resultado["5_distancia_media"][0]["distancia_media"] == pytest.approx(
+        nx.average_shortest_path_length(grafo_conexo))
+    assert resultado["7_diametro"][0]["diameter"] == nx.diameter(grafo_conexo)
+    assert resultado["8_densidade"] == pytest.approx(nx.density(grafo_conexo))
+    assert resultado["12_conectividade"] == {"conectado": True, "componentes": 1}
+    assert resultado["13_maior_componente"] == set(grafo_conexo)
+    assert resultado["14_isomorfismo"]["estado"] == "sim"
+    assert resultado["10_cliques"]["total"] == sum(1 for _ in nx.find_cliques(grafo_conexo))
+
+    caminhos = resultado["3_caminhos"]
+    assert caminhos["total"] <= 50 and len(caminhos["amostra"]) == min(caminhos["total"], pipeline.AMOSTRA_CAMINHOS)
+    assert all(c[0] == nos[0] and c[-1] == nos[-1] for c in caminhos["amostra"])
+
+
+def test_relatorio_em_json(tmp_path, grafo):
+    caminho = tmp_path / "relatorio.json"
+    executar_questionario(grafo, caminho_relatorio=str(caminho), processos=1, **_parametros(grafo))
+    relatorio = json.loads(caminho.read_text(encoding="utf-8"))
+    assert relatorio["grafo"] == {"nos": grafo.number_of_nodes(), "arestas": grafo.number_of_edges()}
+    assert relatorio["questoes"]["12_conectividade"]["resultado"]["componentes"] == nx.number_connected_components(grafo)
+
+
+def test_vertices_ausentes_e_parametros_desconhecidos(grafo):
+    relatorio = executar_questionario(grafo, caminho_relatorio=None, processos=1, origem_caminhos=-1,
+                                      vertice_excentricidade=-1, tempo_limite=5)
+    assert relatorio["questoes"]["3_caminhos"]["resultado"] is None
+    assert relatorio["questoes"]["6_excentricidade"]["resultado"] is None
+    with pytest.raises(TypeError):
+        executar_questionario(grafo, caminho_relatorio=None, vertice=1)
+
+
+def test_erro_de_um_fato_chega_so_aos_dependentes(grafo, monkeypatch):
+    def falhar(contexto):
+        raise RuntimeError("falhou")
+    monkeypatch.setitem(pipeline.FATOS, "resumo", (("csr",), falhar))
+    relatorio = executar_questionario(grafo, caminho_relatorio=None, processos=1, **_parametros(grafo))
+    assert relatorio["fatos"]["resumo"]["erro"] == "RuntimeError: falhou"
+    for nome, (_, dependencias, _) in pipeline.QUESTOES.items():
+        entrada = relatorio["questoes"][nome]
+        if "resumo" in dependencias:
+            assert entrada["erro"] == "Dependência com erro: resumo"
+        else:
+            assert "erro" not in entrada
+
+
+def test_contexto_calcula_cada_fato_uma_vez(grafo, monkeypatch):
+    chamadas = []
+    original = pipeline.calcular_conectividade
+    monkeypatch.setattr(pipeline, "calcular_conectividade", lambda csr: chamadas.append(1) or original(csr))
+    contexto = ContextoAnalise(grafo)
+    assert contexto.componentes() is contexto.componentes()
+    assert contexto.conectado() == nx.is_connected(grafo)
+    assert len(chamadas) == 1
+
+
+@pytest.mark.parametrize("dependencias, mensagem", [
+    (("csr", "inexistente"), "desconhecidas"),
+    (("csr", "questao_ciclica"), "circulares"),
+])
+def test_dependencias_invalidas(grafo, monkeypatch, dependencias, mensagem):
+    monkeypatch.setitem(pipeline.FATOS, "ciclico", (dependencias, lambda contexto: None))
+    monkeypatch.setitem(pipeline.QUESTOES, "questao_ciclica", ("Ciclo", ("ciclico",), lambda c, p: None))
+    with pytest.raises(ValueError, match=mensagem):
+        executar_questionario(grafo, caminho_relatorio=None, processos=1, **_parametros(grafo))
+
+
+def test_caminhos_truncados_pelo_tempo(monkeypatch):
+    grafo = nx.complete_graph(12)
+
+    def devagar(*args, **kwargs):
+        yield [0, 11]
+        time.sleep(0.05)
+    monkeypatch.setattr(pipeline, "iterar_caminhos_simples", devagar)
+    parametros = dict(_parametros(grafo), origem_caminhos=0, destino_caminhos=11, tempo_limite=0.05)
+    caminhos = pipeline._caminhos(ContextoAnalise(grafo), {**pipeline.PARAMETROS_PADRAO, **parametros})
+    assert caminhos["total"] == 1
+    assert caminhos["limite_atingido"] and caminhos["tempo_esgotado"]
+
+
+def test_caminhos_completos_nao_truncados():
+    grafo = nx.cycle_graph(6)
+    parametros = dict(_parametros(grafo), origem_caminhos=0, destino_caminhos=3)
+    caminhos = pipeline._caminhos(ContextoAnalise(grafo), {**pipeline.PARAMETROS_PADRAO, **parametros})
+    assert caminhos["total"] == 2
+    assert not caminhos["limite_atingido"] and not caminhos["tempo_esgotado"]
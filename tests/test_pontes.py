@@ -0,0 +1,30 @@
+import networkx as nx
+
+from grafo_csr import GrafoCSR
+from pontes import estrutura_de_cortes
+
+
+def _conjuntos(listas):
+    return {frozenset(lista) for lista in listas}
+
+
+def test_estrutura_de_cortes(grafo):
+    esperadas = {
+        "pontes": {frozenset(aresta) for aresta in nx.bridges(grafo)},
+        "articulacoes": set(nx.articulation_points(grafo)),
+        "biconexas": _conjuntos(nx.biconnected_components(grafo)),
+        "duas_arestas_conexas": _conjuntos(nx.k_edge_components(grafo, 2)),
+    }
+    for entrada in (grafo, GrafoCSR.de_networkx(grafo)):
+        resultado = estrutura_de_cortes(entrada)
+        assert {frozenset(aresta) for aresta in resultado["pontes"]} == esperadas["pontes"]
+        assert set(resultado["articulacoes"]) == esperadas["articulacoes"]
+        assert _conjuntos(resultado["biconexas"]) == esperadas["biconexas"]
+        assert _conjuntos(resultado["duas_arestas_conexas"]) == esperadas["duas_arestas_conexas"]
+
+
+def test_arvore_so_tem_pontes():
+    arvore = nx.random_labeled_tree(40, seed=1)
+    resultado = estrutura_de_cortes(arvore)
+    assert len(resultado["pontes"]) == arvore.number_of_edges()
+    assert all(len(componente) == 1 for componente in resultado["duas_arestas_conexas"])
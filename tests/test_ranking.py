@@ -0,0 +1,13 @@
+import numpy as np
+
+from ranking import top_k
+
+
+def test_top_k(grafo):
+    graus = dict(grafo.degree)
+    esperado = sorted(graus.values(), reverse=True)[:5]
+    assert [valor for _, valor in top_k(graus, 5)] == esperado
+    nos = list(graus)
+    pares = top_k(np.array([graus[no] for no in nos]), 5, nos=nos)
+    assert [valor for _, valor in pares] == esperado
+    assert all(graus[no] == valor for no, valor in pares)
@@ -0,0 +1,331 @@
+import networkx as nx
+import numpy as np
+
+from grafo_csr import GrafoCSR
+from grafo_dinamico import GrafoDinamico
+from distancias import varredura_bfs, resumir_componentes, diametro_e_raio, distancia_media_amostrada
+from hamiltoniano import ciclo_hamiltoniano
+from cliques import clique_maximo, iterar_cliques_maximais
+from graus import graus_do_grafo, distribuicao_graus, distribuicao_de_histograma, perfil_graus
+from pontes import estrutura_de_cortes
+from componentes import componentes_do_grafo, listar_componentes
+from isomorfismo import verificar_isomorfismo
+from menores_caminhos import ServicoCaminhos, caminho_bidirecional
+from grafo_direcionado import GrafoDirecionadoCSR
+from instrumentacao import instrumentar
+
+
+# Funções de cálculo puro: não imprimem nem desenham, apenas retornam resultados estruturados.
+# A exibição no console fica em `codigo_trabalho_1.py` e o desenho em `visualizacao.py`.
+
+
+def como_csr(grafo):
+    """Retorna o grafo em formato `GrafoCSR`, convertendo um `nx.Graph` se necessário."""
+    return grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.de_networkx(grafo)
+
+
+@instrumentar("calculo")
+def calcular_pdf_ccdf(grafo):
+    """
+    Calcula a PDF e a CCDF da distribuição de graus.
+
+    Args:
+        grafo (networkx.Graph | GrafoCSR | GrafoDinamico): O grafo para análise.
+
+    Returns:
+        tuple: (pdf, ccdf), dicionários grau -> probabilidade, ordenados por grau.
+    """
+    if isinstance(grafo, GrafoDinamico):
+        distribuicao = distribuicao_de_histograma(grafo.histograma_graus())  # Mantido a cada atualização
+    else:
+        distribuicao = distribuicao_graus(graus_do_grafo(grafo))
+    graus = distribuicao["graus"].tolist()
+    return dict(zip(graus, distribuicao["pdf"].tolist())), dict(zip(graus, distribuicao["ccdf"].tolist()))
+
+
+@instrumentar("calculo")
+def calcular_menor_caminho(grafo, origem, destino):
+    """
+    Calcula o menor caminho entre dois nós existentes no grafo (BFS bidirecional).
+
+    Returns:
+        list | None: Os nós do caminho, ou None se não houver caminho.
+    """
+    if isinstance(grafo, GrafoCSR):
+        caminho = caminho_bidirecional(grafo, grafo.indice(origem), grafo.indice(destino))
+        return None if caminho is None else [grafo.rotulo(i) for i in caminho]
+    try:
+        return nx.shortest_path(grafo, source=origem, target=destino)
+    except nx.NetworkXNoPath:
+        return None
+
+
+@instrumentar("calculo")
+def calcular_menores_caminhos(grafo, pares, trabalhadores=None, modo="threads", marcos=0, servico=None):
+    """
+    Calcula os menores caminhos de um lote de pares (origem, destino) sobre o mesmo grafo.
+
+    Args:
+        grafo (networkx.Graph | GrafoCSR): O grafo.
+        pares (list): Pares de nós existentes no grafo.
+        trabalhadores (int, opcional): Threads ou processos; ver `ServicoCaminhos.caminhos`.
+        modo (str): "threads" ou "processos".
+        marcos (int): Marcos do índice ALT (0 dispensa o índice).
+        servico (ServicoCaminhos, opcional): Serviço já montado para o grafo, reaproveitado.
+
+    Returns:
+        dict: "caminhos" (um caminho ou None por par) e "servico" (para novas consultas).
+    """
+    servico = servico or ServicoCaminhos(como_csr(grafo), marcos=marcos)
+    return {"caminhos": servico.caminhos(pares, trabalhadores=trabalhadores, modo=modo), "servico": servico}
+
+
+@instrumentar("calculo")
+def calcular_distancia_media(grafo, processos=None, amostras=None, erro_relativo=None,
+                             estrategia="uniforme", tempo_limite=None, resumo=None):
+    """
+    Calcula a distância média de cada componente conexa.
+
+    Sem `amostras` nem `erro_relativo`, o cálculo é exato (ver `distancias.varredura_bfs`);
+    caso contrário é estimado por amostragem (ver `distancias.distancia_media_amostrada`).
+    No modo exato, `resumo` pode trazer o `resumir_componentes` já calculado para o grafo.
+
+    Returns:
+        list: Um dicionário por componente com "vertices" e "distancia_media"; no modo
+        aproximado também "intervalo" (IC de 95%) e "amostras".
+    """
+    csr = como_csr(grafo)
+
+    if amostras is not None or erro_relativo is not None:
+        resultado = []
+        for componente in csr.lista_componentes():
+            estimativa = distancia_media_amostrada(
+                csr, componente, amostras=amostras or len(componente), estrategia=estrategia,
+                erro_relativo=erro_relativo, tempo_limite=tempo_limite
+            )
+            resultado.append({
+                "vertices": csr.rotulos[componente].tolist(),
+                "distancia_media": estimativa["media"],
+                "intervalo": estimativa["intervalo"],
+                "amostras": estimativa["amostras"],
+            })
+        return resultado
+
+    if resumo is None:
+        resumo = resumir_componentes(csr, varredura_bfs(csr, processos))
+    return [
+        {"vertices": csr.rotulos[componente["nos"]].tolist(), "distancia_media": componente["distancia_media"]}
+        for componente in resumo
+    ]
+
+
+@instrumentar("calculo")
+def calcular_excentricidade(grafo, vertice):
+    """
+    Calcula a excentricidade de um vértice existente com uma única BFS.
+
+    Returns:
+        dict: "excentricidade", "mais_distante", "conectado" (se a BFS alcançou o grafo todo)
+        e "componente" (nós alcançados a partir do vértice).
+    """
+    if isinstance(grafo, GrafoCSR):
+        distancia = grafo.bfs(grafo.indice(vertice))
+        alcancados = distancia >= 0
+        return {
+            "excentricidade": int(distancia.max()),
+            "mais_distante": grafo.rotulo(int(np.argmax(distancia))),
+            "conectado": bool(alcancados.all()),
+            "componente": grafo.rotulos[alcancados].tolist(),
+        }
+
+    distancias = nx.single_source_shortest_path_length(grafo, vertice)
+    mais_distante, excentricidade = max(distancias.items(), key=lambda x: x[1])
+    return {
+        "excentricidade": excentricidade,
+        "mais_distante": mais_distante,
+        "conectado": len(distancias) == len(grafo),
+        "componente": [no for no in grafo.nodes if no in distancias],
+    }
+
+
+@instrumentar("calculo")
+def calcular_diametro(grafo, processos=None, metodo="varredura", resumo=None):
+    """
+    Calcula o diâmetro (e, com `metodo="limites"`, o raio) de cada componente conexa.
+
+    Com `metodo="varredura"`, `resumo` pode trazer o `resumir_componentes` já calculado.
+
+    Returns:
+        list: Um dicionário por componente com "vertices", "diameter" e "nodes" (extremos);
+        com `metodo="limites"` também "radius", "center" e "bfs".
+    """
+    csr = como_csr(grafo)
+    if metodo == "limites":
+        resumo = [diametro_e_raio(csr, componente) for componente in csr.lista_componentes()]
+    elif metodo == "varredura":
+        if resumo is None:
+            resumo = resumir_componentes(csr, varredura_bfs(csr, processos))
+    else:
+        raise ValueError(f"Método de diâmetro desconhecido: {metodo!r}")
+
+    resultado = []
+    for componente in resumo:
+        dados = {
+            "vertices": csr.rotulos[componente["nos"]].tolist(),
+            "diameter": componente["diametro"],
+            "nodes": tuple(csr.rotulo(i) for i in componente["extremos"]),
+        }
+        if metodo == "limites":
+            dados.update(radius=componente["raio"], center=csr.rotulo(componente["centro"]), bfs=componente["bfs"])
+        resultado.append(dados)
+    return resultado
+
+
+@instrumentar("calculo")
+def calcular_densidade(grafo):
+    """Densidade do grafo não direcionado."""
+    return grafo.densidade() if isinstance(grafo, (GrafoCSR, GrafoDinamico)) else nx.density(grafo)
+
+
+@instrumentar("calculo")
+def calcular_euleriano(grafo, conectado=None):
+    """
+    True se o grafo possui um ciclo Euleriano (conectado e com todos os graus pares).
+
+    `conectado` pode trazer a conectividade do grafo, se já conhecida.
+    """
+    if isinstance(grafo, GrafoCSR):
+        pares = not np.any(grafo.grau() % 2)
+    else:
+        pares = all(grau % 2 == 0 for _, grau in grafo.degree())
+    if not pares or len(grafo) == 0:
+        return False
+    if conectado is None:
+        conectado = calcular_conectividade(grafo)["conectado"]
+    return conectado
+
+
+@instrumentar("calculo")
+def calcular_hamiltoniano(grafo, tempo_limite=30, limite_nos=2_000_000):
+    """Procura um ciclo Hamiltoniano (ver `hamiltoniano.ciclo_hamiltoniano`)."""
+    if isinstance(grafo, GrafoCSR):
+        grafo = grafo.para_networkx()
+    return ciclo_hamiltoniano(grafo, limite_nos=limite_nos, tempo_limite=tempo_limite)
+
+
+@instrumentar("calculo")
+def calcular_cliques(grafo, tamanho_minimo=1, limite=None, processos=None):
+    """Lista os cliques maximais do grafo (ver `cliques.iterar_cliques_maximais`)."""
+    return list(iterar_cliques_maximais(grafo, tamanho_minimo=tamanho_minimo, limite=limite, processos=processos))
+
+
+@instrumentar("calculo")
+def calcular_clique_maximo(grafo, cliques=None):
+    """
+    Retorna os nós de um clique de tamanho máximo.
+
+    Se os cliques maximais já foram calculados (`cliques`), escolhe o maior deles; caso
+    contrário usa a busca por ramificação e poda de `cliques.clique_maximo`, sem enumerá-los.
+    """
+    if cliques is not None:
+        return max(cliques, key=len)
+    return clique_maximo(grafo)
+
+
+@instrumentar("calculo")
+def calcular_componentes(grafo):
+    """
+    Lista as componentes conexas do grafo.
+
+    Returns:
+        list: Um conjunto de nós por componente.
+    """
+    if isinstance(grafo, GrafoDinamico):
+        return grafo.componentes()
+    return [set(componente.tolist()) for componente in listar_componentes(componentes_do_grafo(grafo))]
+
+
+@instrumentar("calculo")
+def calcular_conectividade(grafo):
+    """
+    Rótulos, tamanhos, maior componente e conectividade em uma única passada de união-busca,
+    sem listar as componentes (ver `componentes.componentes_do_grafo`).
+    """
+    return componentes_do_grafo(grafo)
+
+
+@instrumentar("calculo")
+def calcular_numero_componentes(grafo):
+    """Número de componentes conexas (mantido incrementalmente em um `GrafoDinamico`)."""
+    if isinstance(grafo, GrafoDinamico):
+        return grafo.num_componentes
+    return calcular_conectividade(grafo)["num_componentes"]
+
+
+@instrumentar("calculo")
+def calcular_maior_componente(grafo, componentes=None):
+    """Retorna o conjunto de nós da maior componente conexa (a partir de `componentes`, se já calculadas)."""
+    if componentes is not None:
+        return max(componentes, key=len)
+    if isinstance(grafo, GrafoDinamico):
+        return grafo.maior_componente()
+    return set(calcular_conectividade(grafo)["maior_componente"].tolist())
+
+
+@instrumentar("calculo")
+def calcular_isomorfismo(grafo1, grafo2, tempo_limite=30):
+    """
+    Verifica o isomorfismo em etapas: invariantes, hash de Weisfeiler–Lehman e, só se ambos
+    coincidem, VF2++ com orçamento de tempo (ver `isomorfismo.verificar_isomorfismo`).
+    """
+    return verificar_isomorfismo(grafo1, grafo2, tempo_limite=tempo_limite)
+
+
+@instrumentar("calculo")
+def calcular_pontes(grafo):
+    """
+    Encontra as pontes, as articulações e as componentes biconexas e 2-aresta-conexas.
+
+    Returns:
+        dict: Ver `pontes.estrutura_de_cortes`.
+    """
+    return estrutura_de_cortes(grafo)
+
+
+def como_direcionado(grafo):
+    """Retorna o grafo em formato `GrafoDirecionadoCSR`, convertendo um `nx.DiGraph` se necessário."""
+    return grafo if isinstance(grafo, GrafoDirecionadoCSR) else GrafoDirecionadoCSR.de_networkx(grafo)
+
+
+@instrumentar("calculo")
+def calcular_graus_direcionados(grafo, bins_por_decada=10):
+    """
+    Perfis das distribuições de grau de entrada e de saída de um grafo direcionado.
+
+    Returns:
+        dict: "entrada" e "saida", cada um um perfil de graus (ver `graus.perfil_graus`).
+    """
+    grafo = como_direcionado(grafo)
+    return {
+        "entrada": perfil_graus(grafo.grau_entrada(), bins_por_decada),
+        "saida": perfil_graus(grafo.grau_saida(), bins_por_decada),
+    }
+
+
+@instrumentar("calculo")
+def calcular_componentes_direcionadas(grafo):
+    """
+    Componentes fortemente e fracamente conexas de um grafo direcionado.
+
+    Returns:
+        dict: "fortes" e "fracas", nos formatos de `GrafoDirecionadoCSR.componentes_fortes` e
+        `componentes_do_grafo`.
+    """
+    grafo = como_direcionado(grafo)
+    return {"fortes": grafo.componentes_fortes(), "fracas": grafo.componentes_fracas()}
+
+
+@instrumentar("calculo")
+def calcular_diametro_direcionado(grafo):
+    """Diâmetro e raio direcionados da maior componente forte (ver `GrafoDirecionadoCSR.diametro`)."""
+    return como_direcionado(grafo).diametro()
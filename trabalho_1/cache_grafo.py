@@ -0,0 +1,146 @@
+import contextlib
+import mmap
+import os
+import struct
+import time
+
+import numpy as np
+
+from grafo_csr import GrafoCSR, ler_grafo_csr
+from instrumentacao import instrumentar
+
+
+# Cabeçalho: assinatura, versão, bytes por índice, tamanho e mtime do .txt, nós e entradas de adjacência
+_ASSINATURA = b"GCSR"
+_VERSAO = 1
+_CABECALHO = struct.Struct("<4sIIQqQQ")
+_ALINHAMENTO = 8
+
+
+def caminho_cache_padrao(caminho_arquivo):
+    """Caminho do cache binário associado a um arquivo de arestas (`<arquivo>.csr`)."""
+    return caminho_arquivo + ".csr"
+
+
+def _alinhar(posicao):
+    return -(-posicao // _ALINHAMENTO) * _ALINHAMENTO
+
+
+def _secoes(num_nos, num_entradas, bytes_indice):
+    """Deslocamentos de indptr, indices e rotulos dentro do arquivo de cache."""
+    inicio_indptr = _alinhar(_CABECALHO.size)
+    inicio_indices = _alinhar(inicio_indptr + (num_nos + 1) * bytes_indice)
+    inicio_rotulos = _alinhar(inicio_indices + num_entradas * bytes_indice)
+    return inicio_indptr, inicio_indices, inicio_rotulos
+
+
+def salvar_cache(csr, caminho_cache, caminho_fonte):
+    """
+    Grava um `GrafoCSR` em um arquivo binário que pode ser mapeado em memória depois.
+
+    O cabeçalho guarda o tamanho e a data de modificação do arquivo de origem, usados para
+    detectar quando o cache ficou desatualizado. A escrita é feita em um arquivo temporário
+    renomeado no final, para que uma execução interrompida não deixe um cache corrompido; se
+    a escrita falhar, o temporário é apagado antes de a exceção seguir.
+
+    Args:
+        csr (GrafoCSR): O grafo a ser gravado (rótulos inteiros).
+        caminho_cache (str): Arquivo de cache a ser criado.
+        caminho_fonte (str): Arquivo de arestas do qual o grafo foi lido.
+
+    Returns:
+        None
+    """
+    info = os.stat(caminho_fonte)
+    bytes_indice = csr.indices.dtype.itemsize
+    secoes = _secoes(csr.num_nos, len(csr.indices), bytes_indice)
+    cabecalho = _CABECALHO.pack(
+        _ASSINATURA, _VERSAO, bytes_indice, info.st_size, info.st_mtime_ns, csr.num_nos, len(csr.indices)
+    )
+
+    temporario = f"{caminho_cache}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(cabecalho)
+            for inicio, array in zip(secoes, (csr.indptr, csr.indices, csr.rotulos.astype(np.int64))):
+                arquivo.write(b"\0" * (inicio - arquivo.tell()))
+                arquivo.write(np.ascontiguousarray(array).tobytes())
+        os.replace(temporario, caminho_cache)
+    except BaseException:
+        # Disco cheio, permissão negada ou interrupção: não deixa o temporário para trás
+        with contextlib.suppress(OSError):
+            os.remove(temporario)
+        raise
+
+
+def abrir_cache(caminho_cache, caminho_fonte):
+    """
+    Mapeia um cache binário em memória e monta o `GrafoCSR` sobre ele, sem copiar os arrays.
+
+    Args:
+        caminho_cache (str): Arquivo de cache.
+        caminho_fonte (str): Arquivo de arestas de origem, usado para validar o cache.
+
+    Returns:
+        GrafoCSR | None: O grafo, ou None se o cache não existe, é de outra versão ou está
+        desatualizado em relação ao arquivo de origem.
+    """
+    try:
+        info = os.stat(caminho_fonte)
+        with open(caminho_cache, "rb") as arquivo:
+            if os.fstat(arquivo.fileno()).st_size < _CABECALHO.size:
+                return None
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        return None
+
+    assinatura, versao, bytes_indice, tamanho, mtime_ns, num_nos, num_entradas = _CABECALHO.unpack_from(mapa)
+    if (assinatura, versao) != (_ASSINATURA, _VERSAO) or (tamanho, mtime_ns) != (info.st_size, info.st_mtime_ns):
+        mapa.close()
+        return None
+
+    tipo = np.int32 if bytes_indice == 4 else np.int64
+    inicio_indptr, inicio_indices, inicio_rotulos = _secoes(num_nos, num_entradas, bytes_indice)
+    if len(mapa) < inicio_rotulos + num_nos * 8:
+        mapa.close()
+        return None
+
+    # Os arrays apontam diretamente para as páginas mapeadas (somente leitura)
+    indptr = np.frombuffer(mapa, dtype=tipo, count=num_nos + 1, offset=inicio_indptr)
+    indices = np.frombuffer(mapa, dtype=tipo, count=num_entradas, offset=inicio_indices)
+    rotulos = np.frombuffer(mapa, dtype=np.int64, count=num_nos, offset=inicio_rotulos)
+    return GrafoCSR(indptr, indices, rotulos)
+
+
+@instrumentar("leitura")
+def carregar_grafo_csr(caminho_arquivo, caminho_cache=None):
+    """
+    Carrega um arquivo de arestas SNAP como `GrafoCSR`, usando um cache binário em disco.
+
+    Na primeira execução o arquivo de texto é lido e o cache é gravado; nas seguintes o cache
+    é mapeado em memória com `mmap`. Se o arquivo de texto mudar (tamanho ou data de
+    modificação diferentes), o cache é reconstruído automaticamente.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo de texto.
+        caminho_cache (str, opcional): Arquivo de cache. Padrão: `<caminho_arquivo>.csr`.
+
+    Returns:
+        GrafoCSR: O grafo não direcionado completo.
+    """
+    if caminho_cache is None:
+        caminho_cache = caminho_cache_padrao(caminho_arquivo)
+
+    inicio = time.perf_counter()
+    csr = abrir_cache(caminho_cache, caminho_arquivo)
+    if csr is not None:
+        print(f"Grafo carregado do cache {caminho_cache} em {time.perf_counter() - inicio:.4f} s")
+        return csr
+
+    csr = ler_grafo_csr(caminho_arquivo)
+    try:
+        salvar_cache(csr, caminho_cache, caminho_arquivo)
+        print(f"Cache do grafo gravado em {caminho_cache}")
+    except OSError as e:
+        print(f"Não foi possível gravar o cache do grafo: {e}")
+    return csr
@@ -0,0 +1,268 @@
+import time
+
+import networkx as nx
+
+from grafo_csr import GrafoCSR
+
+
+LIMITE_NOS_REGIOES = 64  # Maior componente contada com memorização por regiões (limita também a recursão)
+MAX_ESTADOS = 1_000_000  # Contagens memorizadas, no máximo (cerca de 200 bytes cada)
+
+
+def _adjacencia(grafo):
+    """
+    Função de vizinhos e tradução de rótulos para `nx.Graph` ou `GrafoCSR`.
+
+    Returns:
+        tuple: (vizinhos(v), para_interno(no), para_externo(v), distâncias BFS a partir de v).
+    """
+    if isinstance(grafo, GrafoCSR):
+        def distancias(v):
+            distancia = grafo.bfs(v)
+            return {int(w): int(d) for w, d in enumerate(distancia) if d >= 0}
+        return (lambda v: grafo.vizinhos(v).tolist()), grafo.indice, grafo.rotulo, distancias
+    return (lambda v: grafo[v]), (lambda no: no), (lambda v: v), (lambda v: nx.single_source_shortest_path_length(grafo, v))
+
+
+def iterar_caminhos_simples(grafo, origem, destino, cutoff=None, limite=None, tempo_limite=None):
+    """
+    Gera, sob demanda, os caminhos simples entre dois nós, sem guardá-los em memória.
+
+    A busca em profundidade é iterativa (pilha explícita) e não entra em vértices a partir dos
+    quais o destino está a mais passos do que o comprimento restante permite.
+
+    Args:
+        grafo (networkx.Graph | GrafoCSR): O grafo.
+        origem: Nó inicial.
+        destino: Nó final.
+        cutoff (int, opcional): Comprimento máximo do caminho, em arestas.
+        limite (int, opcional): Número máximo de caminhos gerados.
+        tempo_limite (float, opcional): Orçamento de tempo, em segundos; ao esgotar, a geração para.
+
+    Yields:
+        list: O próximo caminho simples, como lista de nós.
+    """
+    vizinhos, para_interno, para_externo, distancias = _adjacencia(grafo)
+    origem, destino = para_interno(origem), para_interno(destino)
+    if origem == destino or (limite is not None and limite <= 0):
+        return
+
+    ate_destino = distancias(destino)
+    if origem not in ate_destino:
+        return
+    if cutoff is None:
+        cutoff = len(ate_destino) - 1
+    prazo = None if tempo_limite is None else time.perf_counter() + tempo_limite
+
+    caminho = [origem]
+    no_caminho = {origem}
+    pilha = [iter(vizinhos(origem))]
+    gerados = 0
+    passos = 0
+
+    while pilha:
+        passos += 1
+        if prazo is not None and passos % 1024 == 0 and time.perf_counter() > prazo:
+            return
+
+        w = next(pilha[-1], None)
+        if w is None:
+            pilha.pop()
+            no_caminho.discard(caminho.pop())
+            continue
+        if w in no_caminho or ate_destino.get(w, cutoff + 1) + len(caminho) > cutoff:
+            continue
+
+        if w == destino:
+            yield [para_externo(v) for v in caminho + [w]]
+            gerados += 1
+            if limite is not None and gerados >= limite:
+                return
+            continue
+
+        caminho.append(w)
+        no_caminho.add(w)
+        pilha.append(iter(vizinhos(w)))
+
+
+def _esgotado(prazo, passos):
+    return prazo is not None and passos % 1024 == 0 and time.perf_counter() > prazo
+
+
+class _Interrompida(Exception):
+    """Sinaliza que a contagem atingiu o limite ou esgotou o prazo."""
+
+
+def _bits(mascara):
+    """Itera sobre os índices dos bits ligados de um inteiro."""
+    while mascara:
+        bit = mascara & -mascara
+        yield bit.bit_length() - 1
+        mascara ^= bit
+
+
+def _regiao(adjacencia, v, destino, livres):
+    """
+    Vértices de `livres` alcançáveis a partir de `v` sem atravessar o `destino`, e a distância
+    de `v` ao destino dentro deles. Só esses vértices podem completar um caminho que está em `v`.
+
+    Returns:
+        tuple: (máscara da região, distância até o destino ou None se ele não é alcançável).
+    """
+    alcance = 0
+    fronteira = 1 << v
+    distancia = None
+    nivel = 0
+    while fronteira:
+        if fronteira >> destino & 1:
+            distancia = nivel
+            fronteira ^= 1 << destino  # O destino só pode terminar o caminho
+        if distancia is not None and alcance == livres:
+            break  # Tudo já foi alcançado (comum em grafos densos)
+        novos = 0
+        for u in _bits(fronteira):
+            novos |= adjacencia[u]
+        fronteira = novos & livres & ~alcance
+        alcance |= fronteira
+        nivel += 1
+    return alcance, distancia
+
+
+def _contar_por_regioes(adjacencia, origem, destino, cutoff, limite, prazo, max_estados):
+    """
+    Contagem exata por busca em profundidade com memorização, para componentes pequenas.
+
+    O número de maneiras de completar um caminho que está em `v` depende só de `v`, da região
+    ainda alcançável a partir dele (ver `_regiao`) e do comprimento restante; prefixos
+    diferentes que deixam a mesma região compartilham a contagem. Ramos cuja região não contém
+    o destino, ou o contém longe demais, são descartados sem descer. No máximo `max_estados`
+    contagens são guardadas; depois disso a busca continua sem guardar novas.
+
+    Returns:
+        int: O número de caminhos, ou um limite inferior se `limite` ou o prazo interromperam.
+    """
+    memoria = {}
+    encontrados = 0  # Caminhos já contados, cada um uma única vez: o limite inferior se parar
+    passos = 0
+
+    def contar(v, livres, restante):
+        nonlocal encontrados, passos
+        regiao, distancia = _regiao(adjacencia, v, destino, livres)
+        if distancia is None or distancia > restante:
+            return 0
+        restante = min(restante, bin(regiao).count("1"))
+        chave = (v, regiao, restante)
+        total = memoria.get(chave)
+        if total is not None:
+            encontrados += total
+        else:
+            passos += 1
+            if _esgotado(prazo, passos):
+                raise _Interrompida
+            total = 0
+            for w in _bits(adjacencia[v] & regiao):
+                if w == destino:
+                    total += 1
+                    encontrados += 1
+                else:
+                    total += contar(w, regiao ^ (1 << w), restante - 1)
+            if len(memoria) < max_estados:
+                memoria[chave] = total
+        if limite is not None and encontrados >= limite:
+            raise _Interrompida
+        return total
+
+    try:
+        return contar(origem, ((1 << len(adjacencia)) - 1) ^ (1 << origem), cutoff)
+    except _Interrompida:
+        return encontrados if limite is None else min(encontrados, limite)
+
+
+def _contar_em_profundidade(adjacencia, origem, destino, distancia, cutoff, limite, prazo):
+    """
+    Contagem por busca em profundidade iterativa, sem montar nem guardar caminhos: a mesma
+    busca de `iterar_caminhos_simples`, sobre listas de índices e um vetor de visitados.
+
+    Returns:
+        int: O número de caminhos, ou um limite inferior se `limite` ou o prazo interromperam.
+    """
+    visitado = bytearray(len(adjacencia))
+    visitado[origem] = 1
+    caminho = [origem]
+    pilha = [iter(adjacencia[origem])]
+    total = 0
+    passos = 0
+    while pilha:
+        passos += 1
+        if _esgotado(prazo, passos):
+            break
+        w = next(pilha[-1], None)
+        if w is None:
+            pilha.pop()
+            visitado[caminho.pop()] = 0
+            continue
+        if visitado[w] or distancia[w] + len(caminho) > cutoff:
+            continue
+        if w == destino:
+            total += 1
+            if limite is not None and total >= limite:
+                return limite
+            continue
+        visitado[w] = 1
+        caminho.append(w)
+        pilha.append(iter(adjacencia[w]))
+    return total
+
+
+def contar_caminhos_simples(grafo, origem, destino, cutoff=None, limite=None, tempo_limite=None,
+                            max_nos_regioes=LIMITE_NOS_REGIOES, max_estados=MAX_ESTADOS):
+    """
+    Conta os caminhos simples entre dois nós sem montar nem guardar os caminhos.
+
+    A busca se restringe à componente dos dois nós, renumerada em índices densos. Se ela tem
+    até `max_nos_regioes` vértices, a contagem memoriza, para cada vértice e região ainda
+    alcançável a partir dele, quantos caminhos completam o prefixo (ver `_contar_por_regioes`):
+    prefixos diferentes que chegam ao mesmo estado não são refeitos, e ramos que não alcançam
+    mais o destino são cortados, o que em grades e grafos densos é várias ordens de grandeza
+    mais rápido do que enumerar. Componentes maiores usam a busca em profundidade de
+    `iterar_caminhos_simples`, só que contando.
+
+    A memória é limitada: no máximo `max_estados` contagens guardadas (além da pilha da
+    busca). Com `limite` ou `tempo_limite`, a contagem pode parar antes do fim; o valor
+    retornado é então um limite inferior (no máximo `limite`), como em
+    `iterar_caminhos_simples`.
+
+    Args:
+        grafo (networkx.Graph | GrafoCSR): O grafo.
+        origem: Nó inicial.
+        destino: Nó final.
+        cutoff (int, opcional): Comprimento máximo do caminho, em arestas. Padrão: n - 1.
+        limite (int, opcional): Contagem máxima; ao alcançá-la, a contagem para.
+        tempo_limite (float, opcional): Orçamento de tempo, em segundos.
+        max_nos_regioes (int): Maior componente contada com memorização por regiões.
+        max_estados (int): Número máximo de contagens memorizadas.
+
+    Returns:
+        int: Número de caminhos simples de `origem` a `destino`.
+    """
+    vizinhos, para_interno, _, distancias = _adjacencia(grafo)
+    origem, destino = para_interno(origem), para_interno(destino)
+    if origem == destino or (limite is not None and limite <= 0):
+        return 0
+
+    # Só interessam os vértices da componente dos dois nós
+    ate_destino = distancias(destino)
+    if origem not in ate_destino:
+        return 0
+    if cutoff is None:
+        cutoff = len(ate_destino) - 1
+    prazo = None if tempo_limite is None else time.perf_counter() + tempo_limite
+    nos = list(ate_destino)
+    posicao = {v: i for i, v in enumerate(nos)}
+    listas = [[posicao[w] for w in vizinhos(v) if w != v] for v in nos]
+
+    if len(nos) <= max_nos_regioes:
+        mascaras = [sum(1 << w for w in set(lista)) for lista in listas]
+        return _contar_por_regioes(mascaras, posicao[origem], posicao[destino], cutoff, limite, prazo, max_estados)
+    distancia = [ate_destino[v] for v in nos]
+    return _contar_em_profundidade(listas, posicao[origem], posicao[destino], distancia, cutoff, limite, prazo)
@@ -0,0 +1,347 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from grafo_csr import GrafoCSR
+
+
+MIN_VERTICES_POR_PROCESSO = 256  # Abaixo disso o custo de criar processos não compensa
+BLOCOS_POR_PROCESSO = 8  # Blocos menores equilibram a carga entre os processos
+
+_adjacencia_trabalhador = None
+
+
+def _listas_adjacencia(grafo):
+    """
+    Listas de vizinhos (sem laços) com índices densos, para `nx.Graph` ou `GrafoCSR`.
+
+    Returns:
+        tuple: (lista de conjuntos de vizinhos, lista de rótulos originais).
+    """
+    if isinstance(grafo, GrafoCSR):
+        vizinhos = [set(grafo.vizinhos(i).tolist()) - {i} for i in range(grafo.num_nos)]
+        return vizinhos, [grafo.rotulo(i) for i in range(grafo.num_nos)]
+    nos = list(grafo.nodes)
+    indice = {no: i for i, no in enumerate(nos)}
+    vizinhos = [{indice[w] for w in grafo[no] if w != no} for no in nos]
+    return vizinhos, nos
+
+
+def ordem_degenerescencia(vizinhos):
+    """
+    Remove repetidamente o vértice de menor grau (Batagelj–Zaversnik, com baldes por grau).
+
+    Args:
+        vizinhos (list): Conjunto de vizinhos de cada vértice denso.
+
+    Returns:
+        tuple: (ordem de remoção, número de núcleo (core number) de cada vértice).
+    """
+    n = len(vizinhos)
+    grau = [len(v) for v in vizinhos]
+    baldes = [set() for _ in range(max(grau, default=0) + 1)]
+    for v in range(n):
+        baldes[grau[v]].add(v)
+
+    nucleo = [0] * n
+    removido = [False] * n
+    ordem = []
+    k = 0
+    atual = 0
+    for _ in range(n):
+        atual = max(atual - 1, 0)  # Remover um vértice reduz o grau dos vizinhos em no máximo 1
+        while not baldes[atual]:
+            atual += 1
+        v = baldes[atual].pop()
+        k = max(k, atual)
+        nucleo[v] = k
+        removido[v] = True
+        ordem.append(v)
+        for w in vizinhos[v]:
+            if not removido[w]:
+                baldes[grau[w]].discard(w)
+                grau[w] -= 1
+                baldes[grau[w]].add(w)
+    return ordem, nucleo
+
+
+def _colorir(candidatos, adjacencia):
+    """
+    Coloração gulosa dos candidatos por classes independentes, feita com operações de bits.
+
+    Returns:
+        tuple: (vértices em ordem crescente de cor, cor de cada um). A cor de um vértice é um
+        limite superior do tamanho do clique que ele e os anteriores podem formar.
+    """
+    ordem = []
+    cores = []
+    sem_cor = candidatos
+    cor = 0
+    while sem_cor:
+        cor += 1
+        disponiveis = sem_cor
+        while disponiveis:
+            bit = disponiveis & -disponiveis
+            v = bit.bit_length() - 1
+            sem_cor ^= bit
+            disponiveis &= ~adjacencia[v] & ~bit  # Vizinhos de v não podem ter a mesma cor
+            ordem.append(v)
+            cores.append(cor)
+    return ordem, cores
+
+
+def _expandir(clique, candidatos, adjacencia, melhor, rotulos):
+    """
+    Ramificação e poda no estilo MCQ/MCS de Tomita: ramifica a partir do vértice de maior cor e
+    descarta o ramo quando o tamanho do clique atual mais a cor não supera o melhor encontrado.
+    `melhor` é atualizado no lugar, com os vértices traduzidos por `rotulos`.
+    """
+    ordem, cores = _colorir(candidatos, adjacencia)
+    for i in range(len(ordem) - 1, -1, -1):
+        if len(clique) + cores[i] <= len(melhor):
+            return
+        v = ordem[i]
+        clique.append(v)
+        novos = candidatos & adjacencia[v]
+        if novos:
+            _expandir(clique, novos, adjacencia, melhor, rotulos)
+        elif len(clique) > len(melhor):
+            melhor[:] = [rotulos[u] for u in clique]
+        clique.pop()
+        candidatos &= ~(1 << v)
+
+
+def clique_maximo(grafo):
+    """
+    Encontra um clique de tamanho máximo sem enumerar todos os cliques maximais.
+
+    Os vértices são numerados pela ordem de degenerescência e a adjacência é guardada em
+    máscaras de bits. Um clique guloso inicial dá o primeiro limite inferior; vértices com
+    número de núcleo menor que o tamanho do melhor clique encontrado não podem fazer parte de
+    um clique maior e são descartados (poda por k-core). Para cada vértice restante, a busca
+    por ramificação e poda com limite por coloração gulosa (Tomita) considera apenas os
+    vizinhos que vêm depois dele na ordem, de modo que cada clique é examinado uma única vez.
+
+    Args:
+        grafo (networkx.Graph | GrafoCSR): O grafo a ser analisado.
+
+    Returns:
+        list: Os nós de um clique máximo (vazia se o grafo não tem vértices).
+    """
+    vizinhos, rotulos = _listas_adjacencia(grafo)
+    if not vizinhos:
+        return []
+    ordem, nucleo = ordem_degenerescencia(vizinhos)
+    posicao = {v: i for i, v in enumerate(ordem)}
+
+    # Clique guloso: cada vértice com os seus vizinhos posteriores de maior núcleo
+    melhor = []
+    for v in reversed(ordem):
+        if nucleo[v] + 1 <= len(melhor):
+            continue
+        clique = [v]
+        for w in sorted((w for w in vizinhos[v] if posicao[w] > posicao[v]), key=lambda w: -nucleo[w]):
+            if all(w in vizinhos[u] for u in clique):
+                clique.append(w)
+        if len(clique) > len(melhor):
+            melhor = clique
+
+    # Poda por k-core: um clique com mais de len(melhor) vértices exige núcleo >= len(melhor)
+    mantidos = [v for v in ordem if nucleo[v] >= len(melhor)]
+    indice = {v: i for i, v in enumerate(mantidos)}
+    adjacencia = [0] * len(mantidos)
+    for v, i in indice.items():
+        for w in vizinhos[v]:
+            if w in indice:
+                adjacencia[i] |= 1 << indice[w]
+
+    for i in range(len(mantidos) - 1, -1, -1):
+        if nucleo[mantidos[i]] + 1 <= len(melhor):
+            continue
+        posteriores = adjacencia[i] >> (i + 1) << (i + 1)
+        if posteriores.bit_count() + 1 <= len(melhor):
+            continue
+        _expandir([i], posteriores, adjacencia, melhor, mantidos)
+
+    return [rotulos[v] for v in melhor]
+
+
+def _bits(mascara):
+    """Itera sobre os índices dos bits ligados de um inteiro."""
+    while mascara:
+        bit = mascara & -mascara
+        yield bit.bit_length() - 1
+        mascara ^= bit
+
+
+def _adjacencia_por_posicao(grafo):
+    """
+    Renumera os vértices pela ordem de degenerescência.
+
+    Returns:
+        tuple: (conjunto de vizinhos de cada posição, rótulo original de cada posição).
+    """
+    vizinhos, rotulos = _listas_adjacencia(grafo)
+    ordem, _ = ordem_degenerescencia(vizinhos)
+    posicao = {v: i for i, v in enumerate(ordem)}
+    return [{posicao[w] for w in vizinhos[v]} for v in ordem], [rotulos[v] for v in ordem]
+
+
+def _vizinhanca_local(adjacencia, i):
+    """
+    Subgrafo induzido pelos vizinhos da posição `i`, em máscaras de bits locais.
+
+    Máscaras do tamanho da vizinhança (e não do grafo todo) mantêm as operações de bits baratas
+    em grafos grandes e esparsos.
+
+    Returns:
+        tuple: (posições dos vizinhos, máscaras locais de adjacência, máscara dos vizinhos
+        posteriores a `i`, máscara dos anteriores).
+    """
+    vizinhos = sorted(adjacencia[i])
+    local = {w: k for k, w in enumerate(vizinhos)}
+    mascaras = []
+    for w in vizinhos:
+        mascara = 0
+        for u in adjacencia[w] & adjacencia[i]:
+            mascara |= 1 << local[u]
+        mascaras.append(mascara)
+    anteriores = (1 << sum(1 for w in vizinhos if w < i)) - 1
+    return vizinhos, mascaras, ((1 << len(vizinhos)) - 1) & ~anteriores, anteriores
+
+
+def _bron_kerbosch(clique, candidatos, excluidos, adjacencia, tamanho_minimo):
+    """
+    Bron–Kerbosch com pivô de Tomita sobre máscaras de bits.
+
+    Yields:
+        list: Cada clique maximal (posições) que estende `clique` com vértices de `candidatos`.
+    """
+    if not candidatos:
+        if not excluidos and len(clique) >= tamanho_minimo:
+            yield list(clique)
+        return
+    if len(clique) + candidatos.bit_count() < tamanho_minimo:
+        return
+    # Pivô: o vértice com mais vizinhos entre os candidatos
+    pivo = max(_bits(candidatos | excluidos), key=lambda u: (candidatos & adjacencia[u]).bit_count())
+    for v in _bits(candidatos & ~adjacencia[pivo]):
+        clique.append(v)
+        yield from _bron_kerbosch(clique, candidatos & adjacencia[v], excluidos & adjacencia[v], adjacencia, tamanho_minimo)
+        clique.pop()
+        candidatos &= ~(1 << v)
+        excluidos |= 1 << v
+
+
+def _cliques_do_bloco(adjacencia, inicio, fim, tamanho_minimo, limite, resumo):
+    """
+    Subproblemas de Eppstein das posições `inicio` a `fim - 1`: cada vértice com os vizinhos
+    posteriores como candidatos e os anteriores como excluídos, de modo que cada clique maximal
+    é gerado exatamente uma vez, pelo seu vértice de menor posição.
+
+    Returns:
+        list | Counter: Os cliques (posições), no máximo `limite`, ou o histograma de tamanhos.
+    """
+    saida = Counter() if resumo else []
+    for i in range(inicio, fim):
+        vizinhos, mascaras, posteriores, anteriores = _vizinhanca_local(adjacencia, i)
+        for clique in _bron_kerbosch([], posteriores, anteriores, mascaras, tamanho_minimo - 1):
+            if resumo:
+                saida[len(clique) + 1] += 1
+                continue
+            saida.append([i] + [vizinhos[k] for k in clique])
+            if limite is not None and len(saida) >= limite:
+                return saida
+    return saida
+
+
+def _iniciar_trabalhador(adjacencia):
+    """Guarda, uma vez por processo, a adjacência usada por todos os blocos."""
+    global _adjacencia_trabalhador
+    _adjacencia_trabalhador = adjacencia
+
+
+def _cliques_do_bloco_trabalhador(inicio, fim, tamanho_minimo, limite, resumo):
+    return _cliques_do_bloco(_adjacencia_trabalhador, inicio, fim, tamanho_minimo, limite, resumo)
+
+
+def _executar_blocos(adjacencia, tamanho_minimo, limite, resumo, processos):
+    """
+    Resolve os subproblemas por blocos de posições, no processo atual ou em um pool de processos.
+
+    Yields:
+        list | Counter: O resultado de cada bloco, na ordem das posições.
+    """
+    n = len(adjacencia)
+    if processos is None:
+        processos = os.cpu_count() or 1
+    processos = max(1, min(processos, n // MIN_VERTICES_POR_PROCESSO))
+
+    if processos == 1:
+        # Um bloco por vértice: o gerador só avança até onde o consumidor pedir
+        for i in range(n):
+            yield _cliques_do_bloco(adjacencia, i, i + 1, tamanho_minimo, limite, resumo)
+        return
+
+    cortes = [n * k // (processos * BLOCOS_POR_PROCESSO) for k in range(processos * BLOCOS_POR_PROCESSO + 1)]
+    executor = ProcessPoolExecutor(processos, initializer=_iniciar_trabalhador, initargs=(adjacencia,))
+    try:
+        futuros = [
+            executor.submit(_cliques_do_bloco_trabalhador, inicio, fim, tamanho_minimo, limite, resumo)
+            for inicio, fim in zip(cortes, cortes[1:]) if fim > inicio
+        ]
+        for futuro in futuros:
+            yield futuro.result()
+    finally:
+        # Se o consumidor parou antes (limite atingido), os blocos pendentes são descartados
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iterar_cliques_maximais(grafo, tamanho_minimo=1, limite=None, processos=None):
+    """
+    Gera os cliques maximais sob demanda, sem guardá-los em memória.
+
+    Usa o Bron–Kerbosch de Eppstein: os vértices são tomados na ordem de degenerescência e cada
+    um resolve um subproblema com pivô de Tomita restrito aos seus vizinhos posteriores, o que
+    limita o tamanho de cada subproblema à degenerescência do grafo. Os subproblemas são
+    independentes e, em grafos grandes, divididos em blocos entre processos.
+
+    Args:
+        grafo (networkx.Graph | GrafoCSR): O grafo a ser analisado.
+        tamanho_minimo (int): Só gera cliques com pelo menos esse número de vértices.
+        limite (int, opcional): Número máximo de cliques gerados.
+        processos (int, opcional): Número de processos. Padrão: número de núcleos. Com 1, ou em
+            grafos pequenos, tudo roda no processo atual.
+
+    Yields:
+        list: O próximo clique maximal, como lista de nós.
+    """
+    if limite is not None and limite <= 0:
+        return
+    adjacencia, rotulos = _adjacencia_por_posicao(grafo)
+    gerados = 0
+    for bloco in _executar_blocos(adjacencia, tamanho_minimo, limite, False, processos):
+        for clique in bloco:
+            yield [rotulos[i] for i in clique]
+            gerados += 1
+            if limite is not None and gerados >= limite:
+                return
+
+
+def histograma_cliques(grafo, tamanho_minimo=1, processos=None):
+    """
+    Conta os cliques maximais por tamanho, sem montar a lista de cliques.
+
+    Args:
+        grafo (networkx.Graph | GrafoCSR): O grafo a ser analisado.
+        tamanho_minimo (int): Só conta cliques com pelo menos esse número de vértices.
+        processos (int, opcional): Número de processos (ver `iterar_cliques_maximais`).
+
+    Returns:
+        dict: Tamanho do clique -> número de cliques maximais desse tamanho, ordenado por tamanho.
+    """
+    adjacencia, _ = _adjacencia_por_posicao(grafo)
+    total = Counter()
+    for bloco in _executar_blocos(adjacencia, tamanho_minimo, None, True, processos):
+        total.update(bloco)
+    return dict(sorted(total.items()))
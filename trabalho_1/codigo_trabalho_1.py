@@ -1,145 +1,177 @@
+import time
 import networkx as nx
-from collections import Counter
-import matplotlib.pyplot as plt
 
+from leitura import iterar_blocos_arestas, relatar_vazao
+from caminhos import iterar_caminhos_simples, contar_caminhos_simples
+from cliques import iterar_cliques_maximais, histograma_cliques
+from graus import comparar_distribuicoes
+from analise import (
+    calcular_pdf_ccdf, calcular_menor_caminho, calcular_menores_caminhos, calcular_distancia_media,
+    calcular_excentricidade, calcular_diametro, calcular_densidade, calcular_euleriano, calcular_hamiltoniano,
+    calcular_clique_maximo, calcular_componentes, calcular_numero_componentes, calcular_maior_componente,
+    calcular_isomorfismo, calcular_pontes, calcular_graus_direcionados, calcular_componentes_direcionadas,
+    calcular_diametro_direcionado, como_direcionado
+)
+from grafo_direcionado import ler_grafo_direcionado_csr
+import visualizacao
+from instrumentacao import INSTRUMENTACAO, instrumentar
 
-def get_pdf_and_ccdf(graph):
+# Os cálculos ficam em `analise.py` e os desenhos em `visualizacao.py`. As funções abaixo
+# calculam, exibem o resultado no console e só desenham quando `desenhar` é True (grafos
+# `GrafoCSR` e `GrafoDinamico`, usados para grafos grandes, nunca são desenhados).
+
+
+def _deve_desenhar(graph, desenhar):
+    return desenhar and isinstance(graph, nx.Graph)
+
+
+@instrumentar("questao")
+def get_pdf_and_ccdf(graph, desenhar=True, max_exibidos=30):
     """
     Calcula e exibe a PDF (Probability Distribution Function) e a CCDF (Complementary Cumulative Distribution Function) do grafo.
     Plota os resultados como gráficos para melhor visualização.
 
     Args:
-        graph (networkx.Graph): O grafo para análise.
+        graph (networkx.Graph | GrafoCSR | GrafoDinamico): O grafo para análise.
+        desenhar (bool): Se True, plota a PDF e a CCDF.
+        max_exibidos (int): Acima desse número de graus distintos, exibe apenas um resumo.
 
     Returns:
-        None
-    """
-    # Obter os graus
-    degrees = [degree for _, degree in graph.degree()]
-    
-    # Contar frequências dos graus
-    degree_counts = Counter(degrees)
-    
-    # Calcular PDF
-    total_nodes = len(graph)
-    pdf = {k: v / total_nodes for k, v in degree_counts.items()}
-    
-    # Calcular CCDF
-    sorted_degrees = sorted(pdf.keys())
-    cumulative = 0
-    ccdf = {}
-    for degree in reversed(sorted_degrees):
-        cumulative += pdf[degree]
-        ccdf[degree] = cumulative
-    ccdf = dict(sorted(ccdf.items()))  # Ordenar por grau
-    
+        tuple: (pdf, ccdf), dicionários grau -> probabilidade.
+    """
+    pdf, ccdf = calcular_pdf_ccdf(graph)
+
     # Exibir no console
-    print("\n--- PDF ---")
-    print(pdf)
-    print("\n--- CCDF ---")
-    print(ccdf)
-    
-    # Plotar PDF e CCDF
-    plt.figure(figsize=(12, 5))
-    
-    # PDF
-    plt.subplot(1, 2, 1)
-    plt.bar(pdf.keys(), pdf.values(), color='blue', alpha=0.7)
-    plt.title("PDF (Distribuição de Graus)")
-    plt.xlabel("Grau")
-    plt.ylabel("Probabilidade")
-    
-    # CCDF
-    plt.subplot(1, 2, 2)
-    plt.plot(ccdf.keys(), ccdf.values(), marker='o', color='red')
-    plt.title("CCDF (Distribuição Cumulativa)")
-    plt.xlabel("Grau")
-    plt.ylabel("Probabilidade Acumulada")
-    
-    plt.tight_layout()
-    plt.show()
-
-
-def get_all_paths(graph, start_node, end_node):
+    if len(pdf) <= max_exibidos:
+        print("\n--- PDF ---")
+        print(pdf)
+        print("\n--- CCDF ---")
+        print(ccdf)
+    else:
+        graus = list(pdf)
+        print(f"\n{len(pdf)} graus distintos, de {graus[0]} a {graus[-1]}.")
+        print(f"Grau mais frequente: {max(pdf, key=pdf.get)} ({max(pdf.values()):.4f} dos nós)")
+
+    if desenhar:
+        visualizacao.desenhar_pdf_ccdf(pdf, ccdf)
+    return pdf, ccdf
+
+
+@instrumentar("questao")
+def comparar_graus(grafos, bins_por_decada=10, desenhar=True):
+    """
+    Compara as distribuições de graus de vários grafos e ajusta uma lei de potência a cada uma.
+
+    Os graus são calculados com `np.bincount` direto dos arrays; caminhos de arquivo são lidos
+    em blocos, sem montar o grafo (ver `graus.comparar_distribuicoes`).
+
+    Args:
+        grafos (dict): Nome -> `nx.Graph`, `GrafoCSR`, array de arestas ou caminho de arquivo.
+        bins_por_decada (int): Intervalos por década da PDF log-binada.
+        desenhar (bool): Se True, sobrepõe as distribuições em escala log-log.
+
+    Returns:
+        dict: Nome -> perfil de graus (ver `graus.perfil_graus`).
+    """
+    perfis = comparar_distribuicoes(grafos, bins_por_decada=bins_por_decada)
+    for nome, perfil in perfis.items():
+        print(f"\n{nome}: {perfil['nos']} nós, grau médio {perfil['grau_medio']:.2f}, grau máximo {perfil['grau_maximo']}")
+        ajuste = perfil["lei_potencia"]
+        if ajuste is None:
+            print("  Poucos nós para ajustar uma lei de potência.")
+        else:
+            print(f"  Lei de potência: alpha = {ajuste['alpha']:.3f} ± {ajuste['erro']:.3f} "
+                  f"(xmin = {ajuste['xmin']}, KS = {ajuste['ks']:.4f}, {ajuste['n_cauda']} nós na cauda)")
+
+    if desenhar:
+        visualizacao.desenhar_distribuicoes(perfis)
+    return perfis
+
+
+@instrumentar("questao")
+def get_all_paths(graph, start_node, end_node, cutoff=None, limite=None, tempo_limite=None,
+                  streaming=False, somente_contar=False, max_desenhados=10, desenhar=True):
     """
     Encontra e exibe todos os caminhos simples entre dois nós em um grafo, destacando-os graficamente.
 
+    Os caminhos são gerados sob demanda (ver `caminhos.iterar_caminhos_simples`), limitados por
+    comprimento (`cutoff`), quantidade (`limite`) e tempo (`tempo_limite`). Apenas os primeiros
+    `max_desenhados` caminhos são desenhados.
+
     Args:
-        graph (networkx.Graph): O grafo para análise.
+        graph (networkx.Graph | GrafoCSR): O grafo para análise.
         start_node: O nó inicial.
         end_node: O nó final.
+        cutoff (int, opcional): Comprimento máximo dos caminhos, em arestas.
+        limite (int, opcional): Número máximo de caminhos.
+        tempo_limite (float, opcional): Orçamento de tempo, em segundos.
+        streaming (bool): Se True, retorna um gerador de caminhos, sem exibir nem desenhar.
+        somente_contar (bool): Se True, apenas conta os caminhos, sem montá-los
+            (ver `caminhos.contar_caminhos_simples`), e retorna a contagem.
+        max_desenhados (int): Número máximo de caminhos destacados no gráfico.
+        desenhar (bool): Se True, destaca os caminhos no desenho do grafo.
 
     Returns:
-        list: Uma lista contendo todos os caminhos simples entre os nós, se existirem.
+        list | generator | int: Os caminhos simples entre os nós, um gerador deles (`streaming`)
+        ou o número de caminhos (`somente_contar`).
     """
     try:
         # Verificar se os nós estão presentes no grafo
         if start_node not in graph or end_node not in graph:
             print(f"Os nós {start_node} ou {end_node} não estão presentes no grafo.")
-            return []
+            return iter(()) if streaming else 0 if somente_contar else []
 
-        # Obter todos os caminhos simples entre os nós fornecidos
-        all_paths = list(nx.all_simple_paths(graph, source=start_node, target=end_node))
+        if somente_contar:
+            inicio = time.perf_counter()
+            total = contar_caminhos_simples(
+                graph, start_node, end_node, cutoff=cutoff, limite=limite, tempo_limite=tempo_limite
+            )
+            interrompida = (limite is not None and total >= limite) or \
+                (tempo_limite is not None and time.perf_counter() - inicio >= tempo_limite)
+            print(f"\nNúmero de caminhos simples de {start_node} para {end_node}: "
+                  f"{'pelo menos ' if interrompida else ''}{total}")
+            return total
+
+        # Gerar os caminhos simples entre os nós fornecidos sob demanda
+        caminhos = iterar_caminhos_simples(
+            graph, start_node, end_node, cutoff=cutoff, limite=limite, tempo_limite=tempo_limite
+        )
+        if streaming:
+            return caminhos
+
+        # Exibir os caminhos no console à medida que são encontrados
+        all_paths = []
+        for idx, path in enumerate(caminhos, start=1):
+            if idx == 1:
+                print(f"\nTodos os caminhos simples de {start_node} para {end_node}:")
+            print(f" {idx}. {' -> '.join(map(str, path))}")
+            all_paths.append(path)
 
         if not all_paths:
             # Se não houver caminhos, informa ao usuário e retorna uma lista vazia
             print(f"\nNão há caminhos simples de {start_node} para {end_node}.")
             return []
 
-        # Exibir todos os caminhos encontrados no console
-        print(f"\nTodos os caminhos simples de {start_node} para {end_node}:")
-        for idx, path in enumerate(all_paths, start=1):
-            print(f" {idx}. {' -> '.join(map(str, path))}")
-
-        # Gerar posições para os nós no gráfico
-        pos = nx.spring_layout(graph)  # Layout para o grafo
-        plt.figure(figsize=(10, 8))
-
-        # Definir cores dos nós
-        colors_nodes = []
-        for node in graph.nodes:
-            if node == start_node:
-                colors_nodes.append("red")  # Nó inicial em vermelho
-            elif node == end_node:
-                colors_nodes.append("yellow")  # Nó final em azul
-            else:
-                colors_nodes.append("lightgray")  # Outros nós em laranja
-
-        # Desenhar o grafo inteiro
-        nx.draw(
-            graph, pos, with_labels=True, node_color=colors_nodes,
-            edge_color="gray", node_size=800, font_size=10
-        )
-
-        # Destaque os caminhos encontrados
-        for path in all_paths:
-            path_edges = list(zip(path, path[1:]))  # Transformar o caminho em pares de arestas
-            nx.draw_networkx_edges(graph, pos, edgelist=path_edges, edge_color="blue", width=2)
-            # Destacar os nós no caminho (sem sobrescrever os nós inicial e final)
-            nx.draw_networkx_nodes(
-                graph, pos, nodelist=[node for node in path if node not in [start_node, end_node]],
-                node_color="lightgray", node_size=900
-            )
-
-        # Exibir o título no gráfico
-        plt.title(f"Todos os caminhos simples de {start_node} para {end_node}")
-        plt.show()
-
+        if _deve_desenhar(graph, desenhar):
+            visualizacao.desenhar_caminhos(graph, start_node, end_node, all_paths, max_desenhados)
         return all_paths
     except nx.NetworkXError as e:
         # Tratar erros relacionados ao grafo (exemplo: nós inexistentes)
         print(f"Erro ao buscar caminhos: {e}")
         return []
 
-def get_shortest_path(graph, start_node, end_node):
+@instrumentar("questao")
+def get_shortest_path(graph, start_node, end_node, desenhar=True):
     """
     Encontra e exibe o menor caminho entre dois nós em um grafo.
-    Destaca o caminho encontrado no grafo graficamente.
+    Destaca o caminho encontrado no grafo graficamente (exceto para grafos `GrafoCSR`,
+    usados para grafos grandes, em que o caminho é calculado por BFS sobre os arrays).
 
     Args:
-        graph (networkx.Graph): O grafo para análise.
+        graph (networkx.Graph | GrafoCSR): O grafo para análise.
         start_node: O nó inicial.
         end_node: O nó final.
+        desenhar (bool): Se True, destaca o caminho no desenho do grafo.
 
     Returns:
         list: Lista dos nós no menor caminho, se existir.
@@ -152,82 +184,112 @@ def get_shortest_path(graph, start_node, end_node):
         print(f"Erro: O nó {end_node} não está no grafo.")
         return None
 
-    try:
-        # Encontrar o menor caminho
-        shortest_path = nx.shortest_path(graph, source=start_node, target=end_node)
-        print(f"O menor caminho de {start_node} para {end_node} é: {shortest_path}")
-
-        # Plotar o grafo com o menor caminho destacado
-        pos = nx.spring_layout(graph, seed=42)  # Usar seed para layout consistente
-        plt.figure(figsize=(10, 8))
-
-        # Configurar cores dos nós
-        node_colors = []
-        for node in graph.nodes:
-            if node == start_node:
-                node_colors.append("red")  # Nó inicial em vermelho
-            elif node == end_node:
-                node_colors.append("blue")  # Nó final em azul
-            elif node in shortest_path:
-                node_colors.append("orange")  # Nós do caminho em laranja
-            else:
-                node_colors.append("lightgray")  # Outros nós em cinza claro
-
-        # Desenhar o grafo completo
-        nx.draw(
-            graph, pos, with_labels=True, node_color=node_colors,
-            edge_color="gray", node_size=800, font_size=10
-        )
+    shortest_path = calcular_menor_caminho(graph, start_node, end_node)
+    if shortest_path is None:
+        # Tratar o caso onde não há caminho entre os nós
+        print(f"Não existe caminho entre os vértices {start_node} e {end_node}.")
+        return None
+    print(f"O menor caminho de {start_node} para {end_node} é: {shortest_path}")
 
-        # Destaque para as arestas do menor caminho
-        path_edges = list(zip(shortest_path, shortest_path[1:]))  # Arestas no caminho
-        nx.draw_networkx_edges(graph, pos, edgelist=path_edges, edge_color="red", width=2)
+    if _deve_desenhar(graph, desenhar):
+        visualizacao.desenhar_menor_caminho(graph, start_node, end_node, shortest_path)
+    return shortest_path
 
-        plt.title(f"Menor Caminho de {start_node} para {end_node}")
-        plt.show()
+@instrumentar("questao")
+def get_shortest_paths(graph, pairs, trabalhadores=None, modo="threads", marcos=0, max_exibidos=10):
+    """
+    Encontra os menores caminhos de vários pares de nós sobre o mesmo grafo, sem desenhar.
 
-        return shortest_path
+    O grafo é convertido uma única vez para `GrafoCSR` e as componentes são rotuladas, então
+    pares em componentes diferentes são descartados sem busca; os demais são respondidos por
+    BFS bidirecional, divididos entre threads ou processos.
 
-    except nx.NetworkXNoPath:
-        # Tratar o caso onde não há caminho entre os nós
-        print(f"Não existe caminho entre os vértices {start_node} e {end_node}.")
-        return None
+    Args:
+        graph (networkx.Graph | GrafoCSR): O grafo para análise.
+        pairs (list): Pares (origem, destino).
+        trabalhadores (int, opcional): Threads ou processos. Padrão: número de núcleos.
+        modo (str): "threads" ou "processos".
+        marcos (int): Marcos do índice ALT (limites de distância sem busca).
+        max_exibidos (int): Quantos caminhos exibir no console.
 
-def get_average_path(graph):
+    Returns:
+        list: Um caminho (lista de nós) ou None por par, na ordem dos pares.
+    """
+    posicoes = [i for i, (u, v) in enumerate(pairs) if u in graph and v in graph]
+    if len(posicoes) < len(pairs):
+        print(f"Erro: {len(pairs) - len(posicoes)} pares com nós que não estão no grafo (sem caminho).")
+    validos = [pairs[i] for i in posicoes]
+
+    inicio = time.perf_counter()
+    encontrados = calcular_menores_caminhos(graph, validos, trabalhadores=trabalhadores, modo=modo, marcos=marcos)["caminhos"]
+    decorrido = time.perf_counter() - inicio
+    caminhos = [None] * len(pairs)
+    for i, caminho in zip(posicoes, encontrados):
+        caminhos[i] = caminho
+    sem_caminho = sum(caminho is None for caminho in encontrados)
+    print(f"{len(validos)} consultas de menor caminho em {decorrido:.3f} s ({sem_caminho} sem caminho).")
+    for (u, v), caminho in list(zip(validos, encontrados))[:max_exibidos]:
+        print(f"  {u} -> {v}: {caminho if caminho is not None else 'sem caminho'}")
+    return caminhos
+
+@instrumentar("questao")
+def get_average_path(graph, processos=None, amostras=None, erro_relativo=None, estrategia="uniforme", tempo_limite=None):
     """
     Calcula e exibe a distância média entre todos os pares de vértices em um grafo.
     Para grafos desconectados, calcula a distância média em cada componente conectada separadamente.
 
+    No modo exato, todas as componentes saem de uma única varredura BFS (uma busca por vértice),
+    dividida entre processos (ver `distancias.varredura_bfs`). Se `amostras` ou `erro_relativo`
+    forem informados, a média de cada componente é estimada a partir de BFS em origens sorteadas,
+    com intervalo de confiança de 95% (ver `distancias.distancia_media_amostrada`).
+
     Args:
-        graph (networkx.Graph): O grafo a ser analisado.
+        graph (networkx.Graph | GrafoCSR): O grafo a ser analisado.
+        processos (int, opcional): Número de processos da varredura exata. Padrão: número de núcleos.
+        amostras (int, opcional): Máximo de origens sorteadas por componente no modo aproximado.
+        erro_relativo (float, opcional): Erro relativo alvo; a amostragem para ao atingi-lo.
+        estrategia (str): "uniforme" ou "grau" (amostragem estratificada por grau).
+        tempo_limite (float, opcional): Orçamento de tempo, em segundos, por componente.
 
     Returns:
-        None
+        list: A distância média de cada componente (ver `analise.calcular_distancia_media`).
     """
-    try:
-        if nx.is_connected(graph):
-            # Grafo conectado: calcula a distância média global
-            average_distance = nx.average_shortest_path_length(graph)
-            print(f"A distância média entre todos os pares de vértices no grafo conectado é: {average_distance:.4f}")
-        else:
-            # Grafo desconectado: calcula a distância média por componente conectada
-            print("O grafo não é conectado. Calculando a distância média para cada componente conectada:")
-            for i, component in enumerate(nx.connected_components(graph), start=1):
-                subgraph = graph.subgraph(component)
-                avg_dist = nx.average_shortest_path_length(subgraph)
-                print(f"- Componente {i} (vértices: {list(component)}): distância média = {avg_dist:.4f}")
-    except nx.NetworkXError as e:
-        print(f"Erro ao calcular a distância média: {e}")
+    resumo = calcular_distancia_media(
+        graph, processos=processos, amostras=amostras, erro_relativo=erro_relativo,
+        estrategia=estrategia, tempo_limite=tempo_limite
+    )
+
+    if amostras is not None or erro_relativo is not None:
+        if len(resumo) > 1:
+            print("O grafo não é conectado. Estimando a distância média para cada componente conectada:")
+        for i, estimativa in enumerate(resumo, start=1):
+            inferior, superior = estimativa["intervalo"]
+            descricao = "no grafo conectado" if len(resumo) == 1 else f"na componente {i} ({len(estimativa['vertices'])} vértices)"
+            print(f"Distância média estimada {descricao}: {estimativa['distancia_media']:.4f} "
+                  f"(IC 95%: {inferior:.4f} a {superior:.4f}, {estimativa['amostras']} origens)")
+        return resumo
+
+    if len(resumo) == 1:
+        # Grafo conectado: distância média global
+        print(f"A distância média entre todos os pares de vértices no grafo conectado é: {resumo[0]['distancia_media']:.4f}")
+    else:
+        # Grafo desconectado: distância média por componente conectada
+        print("O grafo não é conectado. Calculando a distância média para cada componente conectada:")
+        for i, componente in enumerate(resumo, start=1):
+            print(f"- Componente {i} (vértices: {componente['vertices']}): distância média = {componente['distancia_media']:.4f}")
+    return resumo
 
 
-def get_eccentricity(graph, vertex):
+@instrumentar("questao")
+def get_eccentricity(graph, vertex, desenhar=True):
     """
     Calcula, exibe e destaca graficamente a excentricidade de um vértice em um grafo.
-    Destaca o vértice inicial e o vértice mais distante graficamente.
+    Destaca o vértice inicial e o vértice mais distante graficamente (exceto para `GrafoCSR`).
 
     Args:
-        graph (networkx.Graph): O grafo no qual o vértice está localizado.
+        graph (networkx.Graph | GrafoCSR): O grafo no qual o vértice está localizado.
         vertex: O vértice cuja excentricidade será calculada.
+        desenhar (bool): Se True, destaca os dois vértices no desenho do grafo.
 
     Returns:
         tuple: A excentricidade do vértice e o nó mais distante, se existir.
@@ -238,57 +300,16 @@ def get_eccentricity(graph, vertex):
             print(f"Erro: O vértice {vertex} não está presente no grafo.")
             return None
 
-        # Preparar para desenhar o grafo
-        pos = nx.spring_layout(graph, seed=42)  # Layout consistente para o grafo
-        plt.figure(figsize=(10, 8))
-
-        eccentricity = None
-        farthest_node = None
-
-        if nx.is_connected(graph):
-            # Para grafos conectados
-            eccentricity = nx.eccentricity(graph, v=vertex)
-            farthest_node = max(nx.shortest_path_length(graph, source=vertex).items(), key=lambda x: x[1])[0]
+        # Uma única BFS a partir do vértice dá a excentricidade, o nó mais distante e a componente
+        resultado = calcular_excentricidade(graph, vertex)
+        eccentricity, farthest_node = resultado["excentricidade"], resultado["mais_distante"]
+        if resultado["conectado"]:
             print(f"A excentricidade do vértice {vertex} no grafo conectado é: {eccentricity}")
-
-            # Configurar cores para destaque
-            node_colors = [
-                "red" if node == vertex else 
-                "blue" if node == farthest_node else 
-                "lightgray" 
-                for node in graph.nodes
-            ]
-
         else:
-            # Para grafos desconectados, localizar a componente conectada relevante
-            for component in nx.connected_components(graph):
-                if vertex in component:
-                    subgraph = graph.subgraph(component)
-                    eccentricity = nx.eccentricity(subgraph, v=vertex)
-                    farthest_node = max(nx.shortest_path_length(subgraph, source=vertex).items(), key=lambda x: x[1])[0]
-                    print(f"A excentricidade do vértice {vertex} na componente {list(component)} é: {eccentricity}")
-
-                    # Configurar cores para destaque
-                    node_colors = [
-                        "red" if node == vertex else 
-                        "blue" if node == farthest_node else 
-                        "lightgray" 
-                        for node in graph.nodes
-                    ]
-                    break
-            else:
-                print(f"O vértice {vertex} não foi encontrado em nenhuma componente conectada do grafo.")
-                return None
-
-        # Desenhar o grafo com destaque para os nós
-        nx.draw(
-            graph, pos, with_labels=True, node_color=node_colors,
-            edge_color="gray", node_size=800, font_size=10
-        )
-
-        plt.title(f"Excentricidade do Vértice {vertex}")
-        plt.show()
+            print(f"A excentricidade do vértice {vertex} na componente {resultado['componente']} é: {eccentricity}")
 
+        if _deve_desenhar(graph, desenhar):
+            visualizacao.desenhar_excentricidade(graph, vertex, farthest_node)
         return eccentricity, farthest_node
 
     except nx.NetworkXError as e:
@@ -299,69 +320,46 @@ def get_eccentricity(graph, vertex):
 
 
 
-def get_diameter(graph):
+@instrumentar("questao")
+def get_diameter(graph, processos=None, metodo="varredura", desenhar=True):
     """
     Calcula, exibe e destaca graficamente o diâmetro de um grafo.
     Para grafos desconectados, calcula o diâmetro de cada componente conectada.
 
+    Com `metodo="varredura"`, as excentricidades de todos os vértices saem de uma única
+    varredura BFS paralela (ver `distancias.varredura_bfs`). Com `metodo="limites"`, o diâmetro
+    e o raio exatos são obtidos por limites de excentricidade (ver `distancias.diametro_e_raio`),
+    com poucas BFS por componente; nesse caso cada componente também informa "radius",
+    "center" e "bfs" (número de buscas usadas). Grafos `GrafoCSR` não são desenhados.
+
     Args:
-        graph (networkx.Graph): O grafo para o qual o diâmetro será calculado.
+        graph (networkx.Graph | GrafoCSR): O grafo para o qual o diâmetro será calculado.
+        processos (int, opcional): Número de processos da varredura. Padrão: número de núcleos.
+        metodo (str): "varredura" (todas as excentricidades) ou "limites" (BoundingDiameters).
+        desenhar (bool): Se True, destaca os caminhos que realizam o diâmetro.
 
     Returns:
         dict: Um dicionário com o diâmetro e os nós correspondentes para cada componente conectada.
     """
     try:
-        pos = nx.spring_layout(graph, seed=42)  # Layout fixo para o grafo
-        plt.figure(figsize=(10, 8))
+        resumo = calcular_diametro(graph, processos=processos, metodo=metodo)
 
         diameter_data = {}  # Para armazenar o diâmetro de cada componente conectada
+        for idx, componente in enumerate(resumo, start=1):
+            diameter = componente["diameter"]
+            node1, node2 = componente["nodes"]
+            chave = "connected" if len(resumo) == 1 else idx
+            if len(resumo) == 1:
+                print(f"Diâmetro do grafo conectado: {diameter} (Entre {node1} e {node2})")
+            else:
+                print(f"Diâmetro da componente {idx} ({componente['vertices']}): {diameter} (Entre {node1} e {node2})")
+            diameter_data[chave] = {k: v for k, v in componente.items() if k != "vertices"}
 
-        if nx.is_connected(graph):
-            # Para grafos conectados
-            diameter = nx.diameter(graph)
-            eccentricity = nx.eccentricity(graph)
-            farthest_nodes = max(eccentricity.items(), key=lambda x: x[1])
-            node1 = farthest_nodes[0]
-            node2 = max(nx.shortest_path_length(graph, source=node1).items(), key=lambda x: x[1])[0]
-            
-            print(f"Diâmetro do grafo conectado: {diameter} (Entre {node1} e {node2})")
-            diameter_data["connected"] = {"diameter": diameter, "nodes": (node1, node2)}
-
-            # Destacar graficamente
-            node_colors = [
-                "red" if node in [node1, node2] else "lightgray" for node in graph.nodes
-            ]
-            path_edges = list(zip(nx.shortest_path(graph, node1, node2), nx.shortest_path(graph, node1, node2)[1:]))
-            nx.draw(graph, pos, with_labels=True, node_color=node_colors, edge_color="gray", node_size=800, font_size=10)
-            nx.draw_networkx_edges(graph, pos, edgelist=path_edges, edge_color="blue", width=2)
-
-        else:
-            # Para grafos desconectados
-            components = nx.connected_components(graph)
-            for idx, component in enumerate(components, start=1):
-                subgraph = graph.subgraph(component)
-                diameter = nx.diameter(subgraph)
-                eccentricity = nx.eccentricity(subgraph)
-                farthest_nodes = max(eccentricity.items(), key=lambda x: x[1])
-                node1 = farthest_nodes[0]
-                node2 = max(nx.shortest_path_length(subgraph, source=node1).items(), key=lambda x: x[1])[0]
-
-                print(f"Diâmetro da componente {idx} ({list(component)}): {diameter} (Entre {node1} e {node2})")
-                diameter_data[idx] = {"diameter": diameter, "nodes": (node1, node2)}
-
-                # Destacar graficamente
-                node_colors = [
-                    "red" if node in [node1, node2] else 
-                    "lightgray" 
-                    for node in graph.nodes
-                ]
-                path_edges = list(zip(nx.shortest_path(subgraph, node1, node2), nx.shortest_path(subgraph, node1, node2)[1:]))
-                nx.draw(graph, pos, with_labels=True, node_color=node_colors, edge_color="gray", node_size=800, font_size=10)
-                nx.draw_networkx_edges(graph, pos, edgelist=path_edges, edge_color=f"C{idx % 10}", width=2)
-
-        plt.title("Diâmetro do Grafo e Componentes Conectadas")
-        plt.show()
+            if metodo == "limites":
+                print(f"  Raio: {componente['radius']} (centro {componente['center']}), calculados com {componente['bfs']} BFS")
 
+        if _deve_desenhar(graph, desenhar):
+            visualizacao.desenhar_diametro(graph, diameter_data)
         return diameter_data
 
     except nx.NetworkXError as e:
@@ -369,26 +367,29 @@ def get_diameter(graph):
         return None
 
 
+@instrumentar("questao")
 def get_density(graph):
     """
     Calcula e exibe a densidade do grafo.
 
     Args:
-        graph (networkx.Graph): O grafo para o qual a densidade será calculada.
+        graph (networkx.Graph | GrafoCSR | GrafoDinamico): O grafo para o qual a densidade será calculada.
 
     Returns:
-        None
+        float: A densidade do grafo.
     """
     try:
         # Calcular a densidade do grafo
-        density = nx.density(graph)
+        density = calcular_densidade(graph)
 
         # Exibir o resultado com formatação clara
         print(f"A densidade do grafo é: {density:.4f}")
+        return density
     except nx.NetworkXError as e:
         print(f"Erro ao calcular a densidade: {e}")
 
 
+@instrumentar("questao")
 def has_eulerian(graph):
     """
     Verifica se o grafo possui um ciclo Euleriano e exibe o resultado.
@@ -396,13 +397,14 @@ def has_eulerian(graph):
     Um ciclo Euleriano é um ciclo que percorre todas as arestas do grafo exatamente uma vez.
 
     Args:
-        graph (networkx.Graph): O grafo a ser analisado.
+        graph (networkx.Graph | GrafoCSR): O grafo a ser analisado.
 
     Returns:
-        None
+        bool: True se o grafo possui um ciclo Euleriano.
     """
     # Verificar se o grafo possui um ciclo Euleriano
-    if nx.is_eulerian(graph):
+    euleriano = calcular_euleriano(graph)
+    if euleriano:
         print("\nO grafo possui um ciclo Euleriano.")
         print("Condições atendidas: Grafo é conectado e todos os vértices têm grau par.")
     else:
@@ -410,319 +412,254 @@ def has_eulerian(graph):
         print("Verifique se o grafo atende as condições:")
         print("1. O grafo deve ser conectado.")
         print("2. Todos os vértices devem ter grau par.")
+    return euleriano
 
 
-def has_hamiltonian(graph):
+@instrumentar("questao")
+def has_hamiltonian(graph, tempo_limite=30, limite_nos=2_000_000):
     """
     Verifica se o grafo possui um ciclo Hamiltoniano.
-    
+
     Um ciclo Hamiltoniano é um ciclo que visita cada vértice exatamente uma vez e retorna ao vértice inicial.
-    
+    A busca usa podas por grau e conectividade, Held–Karp para grafos pequenos e um orçamento
+    de tempo e de nós para grafos grandes (ver `hamiltoniano.ciclo_hamiltoniano`).
+
     Parâmetros:
-    graph (nx.Graph): O grafo a ser analisado.
-    
+    graph (nx.Graph | GrafoCSR): O grafo a ser analisado.
+    tempo_limite (float, opcional): Orçamento de tempo da busca, em segundos.
+    limite_nos (int): Máximo de nós da árvore de busca expandidos.
+
     Retorno:
-    None. Apenas imprime se o ciclo Hamiltoniano existe ou não.
-    """
-    
-    def hamiltonian_path(visited, current, start):
-        """
-        Função recursiva para verificar a existência de um ciclo Hamiltoniano.
-
-        Parâmetros:
-        visited (set): Conjunto de nós já visitados.
-        current (int): Nó atualmente sendo analisado.
-        start (int): Nó de início para fechar o ciclo.
-
-        Retorno:
-        bool: Verdadeiro se um ciclo Hamiltoniano for encontrado.
-        """
-        # Caso base: Se todos os nós forem visitados, verifica se há aresta de retorno ao nó inicial
-        if len(visited) == len(graph.nodes):
-            return start in graph.neighbors(current)  # Verifica a conexão com o início do ciclo
-        
-        # Explora os vizinhos do nó atual
-        for neighbor in graph.neighbors(current):
-            if neighbor not in visited:  # Se o vizinho ainda não foi visitado
-                # Chamada recursiva com o vizinho adicionado aos visitados
-                if hamiltonian_path(visited | {neighbor}, neighbor, start):
-                    return True
-        return False
-
-    # Tenta iniciar um ciclo Hamiltoniano a partir de cada nó no grafo
-    for node in graph.nodes:
-        if hamiltonian_path({node}, node, node):  # Conjunto inicial contém apenas o nó de partida
-            print("O grafo possui um ciclo Hamiltoniano.")
-            return
-    
-    # Se nenhum ciclo Hamiltoniano for encontrado
-    print("O grafo NÃO possui um ciclo Hamiltoniano.")
-
-
-def get_all_cliques(grafo):
+    tuple: (estado, ciclo), em que estado é "sim", "nao" ou "desconhecido" (orçamento esgotado)
+    e ciclo é a lista de vértices do ciclo encontrado, ou None.
+    """
+    estado, ciclo = calcular_hamiltoniano(graph, tempo_limite=tempo_limite, limite_nos=limite_nos)
+    if estado == "sim":
+        print("O grafo possui um ciclo Hamiltoniano.")
+        print(f"Ciclo encontrado: {' -> '.join(map(str, ciclo + ciclo[:1]))}")
+    elif estado == "nao":
+        print("O grafo NÃO possui um ciclo Hamiltoniano.")
+    else:
+        print("Não foi possível determinar se o grafo possui um ciclo Hamiltoniano (orçamento de busca esgotado).")
+    return estado, ciclo
+
+
+@instrumentar("questao")
+def get_all_cliques(grafo, tamanho_minimo=1, limite=None, processos=None, resumo=False,
+                    max_exibidos=20, max_desenhados=10, desenhar=True):
     """
     Identifica, exibe e destaca todos os cliques de um grafo de forma gráfica.
 
     Um clique é um subconjunto de vértices completamente conectado, ou seja,
     cada par de vértices do subconjunto possui uma aresta entre si.
 
+    Os cliques maximais são gerados sob demanda pelo Bron–Kerbosch de Eppstein, com os
+    subproblemas divididos entre processos (ver `cliques.iterar_cliques_maximais`). Apenas os
+    primeiros `max_exibidos` cliques são impressos e os primeiros `max_desenhados` desenhados.
+
     Args:
-        grafo (nx.Graph): O grafo a ser analisado.
+        grafo (nx.Graph | GrafoCSR): O grafo a ser analisado.
+        tamanho_minimo (int): Considera apenas cliques com pelo menos esse número de vértices.
+        limite (int, opcional): Número máximo de cliques.
+        processos (int, opcional): Número de processos. Padrão: número de núcleos.
+        resumo (bool): Se True, retorna apenas o número de cliques de cada tamanho
+            (ver `cliques.histograma_cliques`), sem listar nem desenhar os cliques.
+        max_exibidos (int): Número máximo de cliques impressos no console.
+        max_desenhados (int): Número máximo de cliques destacados no gráfico.
+        desenhar (bool): Se True, destaca os cliques no desenho do grafo.
 
     Returns:
-        list: Uma lista contendo todos os cliques no grafo.
-    """
-    # Obter a posição dos nós para visualização
-    pos = nx.spring_layout(grafo, seed=42)  # Layout consistente com seed para repetibilidade
-    
-    # Identificar todos os cliques no grafo
-    cliques = list(nx.find_cliques(grafo))
-    
-    print(f"Encontrados {len(cliques)} cliques no grafo:")
-    print(cliques)
-
-    # Configurar o tamanho da figura
-    plt.figure(figsize=(10, 8))
-    
-    # Desenhar o grafo base
-    nx.draw_networkx(
-        grafo, 
-        pos, 
-        with_labels=True, 
-        node_color="lightgray", 
-        edge_color="gray", 
-        node_size=800, 
-        font_size=10
-    )
-    
-    # Destaque de cada clique
-    for i, clique in enumerate(cliques):
-        # Subgrafo do clique
-        clique_subgrafo = grafo.subgraph(clique)
-        
-        # Destaque os nós do clique
-        nx.draw_networkx_nodes(
-            grafo, 
-            pos, 
-            nodelist=clique, 
-            node_color=f"C{i % 10}",  # Escolher cores cíclicas baseadas no índice
-            node_size=900
-        )
-        
-        # Destaque as arestas do clique
-        nx.draw_networkx_edges(
-            grafo, 
-            pos, 
-            edgelist=clique_subgrafo.edges(), 
-            edge_color=f"C{i % 10}", 
-            width=2
-        )
-    
-    # Adicionar título ao gráfico
-    plt.title("Grafos com Destaque para os Cliques")
-    # Exibir o gráfico
-    plt.show()
+        list | dict: Os cliques no grafo, ou o histograma tamanho -> quantidade (`resumo`).
+    """
+    if resumo:
+        histograma = histograma_cliques(grafo, tamanho_minimo=tamanho_minimo, processos=processos)
+        print(f"Encontrados {sum(histograma.values())} cliques no grafo. Quantidade por tamanho:")
+        print(histograma)
+        return histograma
+
+    # Identificar os cliques no grafo, exibindo os primeiros à medida que são encontrados
+    cliques = []
+    for clique in iterar_cliques_maximais(grafo, tamanho_minimo=tamanho_minimo, limite=limite, processos=processos):
+        if len(cliques) < max_exibidos:
+            print(f" {len(cliques) + 1}. {clique}")
+        cliques.append(clique)
+
+    print(f"Encontrados {len(cliques)} cliques no grafo.")
+    if len(cliques) > max_exibidos:
+        print(f"(exibidos os {max_exibidos} primeiros)")
+
+    if _deve_desenhar(grafo, desenhar):
+        visualizacao.desenhar_cliques(grafo, cliques[:max_desenhados])
 
     # Retornar os cliques identificados
     return cliques
 
-def get_clique_maximo(grafo):
+@instrumentar("questao")
+def get_clique_maximo(grafo, desenhar=True):
     """
     Retorna o tamanho do clique máximo e os nós que o compõem.
+    O clique é encontrado por ramificação e poda, sem listar todos os cliques maximais
+    (ver `cliques.clique_maximo`). Plota o grafo com destaque para o clique máximo quando
+    `desenhar` é True.
     """
-    cliques = list(nx.find_cliques(grafo))  # Encontra todos os cliques
-    clique_maximo = max(cliques, key=len)  # Seleciona o maior clique
+    clique_maximo = calcular_clique_maximo(grafo)  # Busca direta pelo maior clique
     print(f"Tamanho do clique máximo: {len(clique_maximo)}")
-    
-
-    """
-    Plota o grafo com destaque para o clique máximo.
-    """
-    pos = nx.spring_layout(grafo)  # Layout para posicionar os nós
-    plt.figure(figsize=(8, 6))
-
-    # Desenhar o grafo inteiro
-    nx.draw_networkx(grafo, pos, with_labels=True, node_color="lightblue", edge_color="gray", node_size=800, font_size=10)
-    
-    # Destaque o clique máximo
-    nx.draw_networkx_nodes(grafo, pos, nodelist=clique_maximo, node_color="orange")
-    clique_subgrafo = grafo.subgraph(clique_maximo)
-    nx.draw_networkx_edges(grafo, pos, edgelist=clique_subgrafo.edges(), edge_color="orange", width=2)
 
-    plt.title("Grafo com Destaque para o Clique Máximo")
-    plt.show()
+    if _deve_desenhar(grafo, desenhar):
+        visualizacao.desenhar_clique_maximo(grafo, clique_maximo)
+    return clique_maximo
 
 
-def get_totally_connected(grafo):
+@instrumentar("questao")
+def get_totally_connected(grafo, desenhar=True):
     """
     Verifica se o grafo é totalmente conectado e retorna o número de componentes conexos.
+    Plota o grafo, destacando cada componente conexo com uma cor diferente, quando `desenhar` é True.
+    Em um `GrafoDinamico` o número de componentes é mantido a cada lote de alterações; nos
+    demais casos sai de uma única passada de união-busca sobre as arestas (ver `componentes.py`),
+    que também aceita o caminho de um arquivo de arestas, lido em blocos sem montar o grafo.
     """
-    totalmente_conectado = nx.is_connected(grafo)  # Verifica se o grafo é conectado
-    numero_componentes = nx.number_connected_components(grafo)  # Número de componentes conexos
+    numero_componentes = calcular_numero_componentes(grafo)  # Número de componentes conexos
 
-    print(f"O grafo é totalmente conectado? {'Sim' if totalmente_conectado else 'Não'}")
+    print(f"O grafo é totalmente conectado? {'Sim' if numero_componentes == 1 else 'Não'}")
     print(f"Número de componentes conexos: {numero_componentes}")
-    
-    """
-    Plota o grafo, destacando cada componente conexo com uma cor diferente.
-    """
-    pos = nx.spring_layout(grafo)  # Layout para posicionar os nós
-    plt.figure(figsize=(8, 6))
-    
-    # Obter as componentes conexas
-    componentes = list(nx.connected_components(grafo))
-    
-    # Desenhar o grafo com cores para cada componente
-    for i, componente in enumerate(componentes):
-        subgrafo = grafo.subgraph(componente)
-        nx.draw_networkx(subgrafo, pos, node_color=f"C{i % 10}", with_labels=True, node_size=800, font_size=10)
 
-    plt.title("Componentes Conexos no Grafo")
-    plt.show()
+    if _deve_desenhar(grafo, desenhar):
+        visualizacao.desenhar_componentes(grafo, calcular_componentes(grafo))
+    return numero_componentes
 
-def check_isomorphic(grafo1, grafo2):
+@instrumentar("questao")
+def check_isomorphic(grafo1, grafo2, desenhar=True, tempo_limite=30):
     """
     Verifica se dois grafos são isomórficos e exibe suas representações gráficas.
 
     Dois grafos são isomórficos se existe uma correspondência entre seus nós e arestas,
-    preservando a estrutura do grafo.
+    preservando a estrutura do grafo. Invariantes baratos (número de nós e de arestas,
+    sequência de graus, componentes, triângulos) e o hash de Weisfeiler–Lehman descartam a
+    maioria dos pares sem busca; só se todos coincidem roda o VF2++, limitado a `tempo_limite`
+    segundos (ver `isomorfismo.verificar_isomorfismo`).
 
     Args:
-        grafo1 (networkx.Graph): O primeiro grafo para análise.
-        grafo2 (networkx.Graph): O segundo grafo para análise.
+        grafo1 (networkx.Graph | GrafoCSR): O primeiro grafo para análise.
+        grafo2 (networkx.Graph | GrafoCSR): O segundo grafo para análise.
+        desenhar (bool): Se True, desenha os dois grafos lado a lado.
+        tempo_limite (float, opcional): Orçamento de tempo do VF2++, em segundos.
 
     Returns:
-        bool: True se os grafos são isomórficos, False caso contrário.
+        bool | None: True se os grafos são isomórficos, False caso contrário, ou None se o
+        VF2++ esgotou o orçamento.
     """
     # Verificar se os grafos são isomórficos
-    is_isomorphic = nx.is_isomorphic(grafo1, grafo2)
-    print(f"Os grafos são isomórficos? {'Sim' if is_isomorphic else 'Não'}")
-
-    # Configurar layout consistente para os dois grafos
-    pos1 = nx.spring_layout(grafo1, seed=42)
-    pos2 = nx.spring_layout(grafo2, seed=42)
-
-    # Desenhar o primeiro grafo
-    plt.figure(figsize=(12, 6))
-    plt.subplot(121)
-    nx.draw(
-        grafo1,
-        pos1,
-        with_labels=True,
-        node_color="lightblue",
-        edge_color="gray",
-        node_size=800,
-        font_size=10,
-    )
-    plt.title("p2p-Gnutella09")
-
-    # Desenhar o segundo grafo
-    plt.subplot(122)
-    nx.draw(
-        grafo2,
-        pos2,
-        with_labels=True,
-        node_color="lightgreen",
-        edge_color="gray",
-        node_size=800,
-        font_size=10,
-    )
-    plt.title("p2p-Gnutella08")
-
-    # Exibir gráficos
-    plt.suptitle("Comparação de Grafos")
-    plt.tight_layout()
-    plt.show()
+    resultado = calcular_isomorfismo(grafo1, grafo2, tempo_limite=tempo_limite)
+    if resultado["estado"] == "desconhecido":
+        print("Não foi possível determinar se os grafos são isomórficos (orçamento de busca esgotado).")
+        is_isomorphic = None
+    else:
+        is_isomorphic = resultado["estado"] == "sim"
+        print(f"Os grafos são isomórficos? {'Sim' if is_isomorphic else 'Não'}")
+        if resultado["motivo"]:
+            print(f"Decidido por: {resultado['motivo']}")
 
+    if _deve_desenhar(grafo1, desenhar) and _deve_desenhar(grafo2, desenhar):
+        visualizacao.desenhar_isomorfismo(grafo1, grafo2)
     return is_isomorphic
 
 
-def get_bigger_component(graph):
+@instrumentar("questao")
+def get_bigger_component(graph, desenhar=True):
     """
     Retorna o conjunto de nós da maior componente conexa e plota o grafo com destaque.
 
     Args:
-        graph (networkx.Graph): O grafo para análise.
+        graph (networkx.Graph | GrafoCSR | GrafoDinamico | str): O grafo para análise, ou o
+            caminho de um arquivo de arestas (componentes por união-busca, lido em blocos).
+        desenhar (bool): Se True, destaca a maior componente no desenho do grafo.
 
     Returns:
-        None
+        set: Os nós da maior componente conexa.
     """
-    componentes = list(nx.connected_components(graph))  # Lista de componentes conexas
-    maior_componente = max(componentes, key=len)  # Seleciona a maior componente
-    
+    maior_componente = calcular_maior_componente(graph)  # Seleciona a maior componente
     print(f"\nNós na maior componente conexa: {maior_componente}")
-    
-    # Plotar o grafo com destaque para a maior componente
-    pos = nx.spring_layout(graph)  # Layout para posicionar os nós
-    plt.figure(figsize=(8, 6))
 
-    # Desenhar o grafo inteiro
-    nx.draw_networkx(graph, pos, with_labels=True, node_color="lightgray", edge_color="gray", node_size=800, font_size=10)
-    
-    # Destaque para a maior componente
-    subgrafo = graph.subgraph(maior_componente)
-    nx.draw_networkx_nodes(subgrafo, pos, node_color="orange", node_size=800)
-    nx.draw_networkx_edges(subgrafo, pos, edge_color="orange", width=2)
+    if _deve_desenhar(graph, desenhar):
+        visualizacao.desenhar_maior_componente(graph, maior_componente)
+    return maior_componente
 
-    plt.title("Maior Componente Conexa no Grafo")
-    plt.tight_layout()
-    plt.show()
 
-
-def get_bridges(graph):
+@instrumentar("questao")
+def get_bridges(graph, desenhar=True, max_exibidas=50):
     """
     Identifica e destaca visualmente as pontes (bridges) em um grafo.
 
     Uma ponte é uma aresta cuja remoção desconecta uma parte do grafo.
+    As pontes saem de uma única busca em profundidade iterativa, em tempo linear, que também
+    encontra as articulações e as componentes biconexas e 2-aresta-conexas
+    (ver `pontes.estrutura_de_cortes`).
 
     Args:
-        graph (networkx.Graph): O grafo para análise.
+        graph (networkx.Graph | GrafoCSR): O grafo para análise.
+        desenhar (bool): Se True, destaca as pontes no desenho do grafo.
+        max_exibidas (int): Número máximo de pontes impressas no console.
 
     Returns:
         list: Uma lista de tuplas representando as pontes no grafo.
     """
     try:
         # Identificar as pontes no grafo
-        bridges = list(nx.bridges(graph))
-        print(f"\nPontes encontradas: {bridges}")
-
-        # Configurar a posição dos nós
-        pos = nx.spring_layout(graph, seed=42)  # Layout consistente para melhor visualização
-        
-        # Configurar o tamanho da figura
-        plt.figure(figsize=(10, 8))
-
-        # Desenhar o grafo base
-        nx.draw_networkx(
-            graph, 
-            pos, 
-            with_labels=True, 
-            node_color="lightblue", 
-            edge_color="gray", 
-            node_size=800, 
-            font_size=10
-        )
-
-        # Destaque as pontes no grafo
-        nx.draw_networkx_edges(
-            graph,
-            pos,
-            edgelist=bridges,
-            edge_color="red",
-            width=2,
-        )
-
-        # Adicionar título e legenda
-        plt.title("Grafo com Pontes Destacadas")
-        plt.show()
+        estrutura = calcular_pontes(graph)
+        bridges = estrutura["pontes"]
+        if len(bridges) <= max_exibidas:
+            print(f"\nPontes encontradas: {bridges}")
+        else:
+            print(f"\n{len(bridges)} pontes encontradas. As {max_exibidas} primeiras: {bridges[:max_exibidas]}")
+        print(f"Articulações: {len(estrutura['articulacoes'])}; componentes biconexas: {len(estrutura['biconexas'])}; "
+              f"componentes 2-aresta-conexas: {len(estrutura['duas_arestas_conexas'])}")
 
+        if _deve_desenhar(graph, desenhar):
+            visualizacao.desenhar_pontes(graph, bridges)
         return bridges
 
     except nx.NetworkXError as e:
         print(f"Erro ao identificar as pontes: {e}")
         return []
 
-def ler_grafo_nao_direcionado(caminho_arquivo):
+@instrumentar("questao")
+def get_directed_summary(graph, desenhar=True):
+    """
+    Exibe a análise direcionada do grafo: graus de entrada e de saída, componentes fortemente
+    e fracamente conexas e o diâmetro direcionado da maior componente forte.
+
+    Args:
+        graph (networkx.DiGraph | GrafoDirecionadoCSR): O grafo direcionado.
+        desenhar (bool): Se True, sobrepõe as distribuições de grau de entrada e de saída.
+
+    Returns:
+        dict: "graus", "componentes" e "diametro" (ver as funções `calcular_*_direcionad*`).
+    """
+    # Convertido uma vez: as três análises compartilham as componentes fortes e a versão não direcionada
+    graph = como_direcionado(graph)
+    graus = calcular_graus_direcionados(graph)
+    nomes = {"entrada": "Grau de entrada", "saida": "Grau de saída"}
+    for sentido, perfil in graus.items():
+        print(f"{nomes[sentido]}: médio {perfil['grau_medio']:.2f}, máximo {perfil['grau_maximo']}")
+
+    componentes = calcular_componentes_direcionadas(graph)
+    fortes, fracas = componentes["fortes"], componentes["fracas"]
+    print(f"{fortes['num_componentes']} componentes fortemente conexas (maior: {len(fortes['maior_componente'])} nós).")
+    print(f"{fracas['num_componentes']} componentes fracamente conexas (maior: {len(fracas['maior_componente'])} nós).")
+
+    diametro = calcular_diametro_direcionado(graph)
+    print(f"Diâmetro direcionado da maior componente forte: {diametro['diametro']} "
+          f"(de {diametro['extremos'][0]} para {diametro['extremos'][1]}), raio {diametro['raio']}, "
+          f"{diametro['bfs']} buscas.")
+
+    if desenhar:
+        visualizacao.desenhar_distribuicoes({nomes[sentido]: perfil for sentido, perfil in graus.items()})
+    return {"graus": graus, "componentes": componentes, "diametro": diametro}
+
+
+@instrumentar("leitura")
+def ler_grafo_nao_direcionado(caminho_arquivo, max_arestas=None):
     """
     Lê um arquivo de texto no formato de pares de nós e cria um grafo não direcionado.
 
@@ -733,91 +670,122 @@ def ler_grafo_nao_direcionado(caminho_arquivo):
     0	2
     ...
 
+    O arquivo é lido em blocos grandes e convertido de forma vetorizada (ver `leitura.py`);
+    as arestas de cada bloco são inseridas no grafo em lote.
+
     Parâmetros:
     caminho_arquivo (str): Caminho para o arquivo de texto.
+    max_arestas (int, opcional): Limite de arestas a ler. None lê o arquivo inteiro.
 
     Retorno:
     nx.Graph: Grafo não direcionado criado a partir do arquivo.
     """
     grafo = nx.Graph()  # Cria um grafo não direcionado
-    quantidade_linha=0
-
-    with open(caminho_arquivo, 'r') as arquivo:
-        for linha in arquivo:
-            if quantidade_linha == 100: # Limita a leitura do arquivo
-                break
-            # Ignora comentários ou linhas em branco
-            linha = linha.strip()
-            if linha.startswith("#") or not linha:
-                continue
-            
-            # Divide a linha em nós de origem e destino
-            origem, destino = map(int, linha.split())
-            grafo.add_edge(origem, destino)  # Adiciona uma aresta não direcionada
-            quantidade_linha = quantidade_linha+1
-    
+    quantidade_arestas = 0
+
+    inicio = time.perf_counter()
+    for bloco in iterar_blocos_arestas(caminho_arquivo, max_arestas=max_arestas):
+        grafo.add_edges_from(bloco.tolist())  # Adiciona o lote de arestas não direcionadas
+        quantidade_arestas += len(bloco)
+    relatar_vazao(caminho_arquivo, quantidade_arestas, time.perf_counter() - inicio)
+
     return grafo
 
 
+@instrumentar("leitura")
+def ler_grafo_direcionado(caminho_arquivo, max_arestas=None):
+    """
+    Lê um arquivo de texto no formato de pares de nós e cria um grafo direcionado, preservando
+    o sentido FromNodeId -> ToNodeId (os arquivos SNAP do Gnutella são direcionados).
+
+    Para grafos grandes, `grafo_direcionado.ler_grafo_direcionado_csr` lê o mesmo arquivo para
+    arrays CSR/CSC, sem criar um `nx.DiGraph`.
+
+    Parâmetros:
+    caminho_arquivo (str): Caminho para o arquivo de texto.
+    max_arestas (int, opcional): Limite de arestas a ler. None lê o arquivo inteiro.
+
+    Retorno:
+    nx.DiGraph: Grafo direcionado criado a partir do arquivo.
+    """
+    grafo = nx.DiGraph()
+    quantidade_arestas = 0
+
+    inicio = time.perf_counter()
+    for bloco in iterar_blocos_arestas(caminho_arquivo, max_arestas=max_arestas):
+        grafo.add_edges_from(bloco.tolist())  # Adiciona o lote de arestas direcionadas
+        quantidade_arestas += len(bloco)
+    relatar_vazao(caminho_arquivo, quantidade_arestas, time.perf_counter() - inicio)
+
+    return grafo
+
 def mostrar_grafo(grafo):
     print("Desenhando o grafo....")
-    nx.draw(grafo, with_labels=True, node_color="lightblue", edge_color="gray", node_size=800, font_size=10)
-    plt.title("Exemplo de Grafo")
-    plt.show()
+    visualizacao.desenhar_grafo(grafo, "Exemplo de Grafo")
+
+
+if __name__ == "__main__":
+    print("*************************** Respostas do Trabalho 1 ***************************")
+    print("\n Aluno: Abraão Lenon Moreira de Oliveira")
+    print("\n 1) Escolha dos datasets.")
+    print("Datasets escolhidos: ")
+    print("https://snap.stanford.edu/data/p2p-Gnutella09.html")
+    print("https://snap.stanford.edu/data/p2p-Gnutella08.html")
 
+    print("Lendo os datasets......")
 
-print("*************************** Respostas do Trabalho 1 ***************************")
-print("\n Aluno: Abraão Lenon Moreira de Oliveira")
-print("\n 1) Escolha dos datasets.")
-print("Datasets escolhidos: ")
-print("https://snap.stanford.edu/data/p2p-Gnutella09.html")
-print("https://snap.stanford.edu/data/p2p-Gnutella08.html")
+    graph = ler_grafo_nao_direcionado("/home/abraaolenon/Desktop/Mestrado/p2p-Gnutella09.txt", max_arestas=100)
+    graph08 = ler_grafo_nao_direcionado("/home/abraaolenon/Desktop/Mestrado/p2p-Gnutella08.txt", max_arestas=100)
 
-print("Lendo os datasets......")
 
-graph = ler_grafo_nao_direcionado("/home/abraaolenon/Desktop/Mestrado/p2p-Gnutella09.txt")
-graph08 = ler_grafo_nao_direcionado("/home/abraaolenon/Desktop/Mestrado/p2p-Gnutella08.txt")
+    print("\n 2) Quanto à distribuição dos graus dos grafos, calcular: PDF (Probability Distribution Function) e a CCDF (Complementary Cumulative Distribution Function).")
+    get_pdf_and_ccdf(graph)
+    comparar_graus({"p2p-Gnutella09": graph, "p2p-Gnutella08": graph08})
 
+    print("\n 3) A partir da escolha de 2 vértices, determinar todos os possíveis caminhos entre eles.")
+    get_all_paths(graph, 21, 4)
 
-print("\n 2) Quanto à distribuição dos graus dos grafos, calcular: PDF (Probability Distribution Function) e a CCDF (Complementary Cumulative Distribution Function).")
-get_pdf_and_ccdf(graph)
+    print("\n 4) A partir da escolha de 2 vértices, determinar o menor caminho.")
+    get_shortest_path(graph, 703, 11)
 
-print("\n 3) A partir da escolha de 2 vértices, determinar todos os possíveis caminhos entre eles.")
-get_all_paths(graph, 21, 4)
+    print("\n 5) Determinar a distância média entre todos os pares de vértices.")
+    get_average_path(graph)
 
-print("\n 4) A partir da escolha de 2 vértices, determinar o menor caminho.")
-get_shortest_path(graph, 703, 11)
+    print("\n 6) A partir da escolha de um vértice, determinar a excentricidade")
+    get_eccentricity(graph, 1)
 
-print("\n 5) Determinar a distância média entre todos os pares de vértices.")
-get_average_path(graph)
+    print("\n 7) Determinar o diâmetro da rede.")
+    get_diameter(graph)
 
-print("\n 6) A partir da escolha de um vértice, determinar a excentricidade")
-get_eccentricity(graph, 1)
+    print("\n 8) Determinar a densidade dos grafos.")
+    get_density(graph)
 
-print("\n 7) Determinar o diâmetro da rede.")
-get_diameter(graph)
+    print("\n 9) Verificar a existência de ciclos Eulerianos e Hamiltonianos nos Grafos.")
+    has_eulerian(graph)
+    has_hamiltonian(graph)
 
-print("\n 8) Determinar a densidade dos grafos.")
-get_density(graph)
+    print("\n 10) Retornar todos os cliques em um grafo.")
+    get_all_cliques(graph)
 
-print("\n 9) Verificar a existência de ciclos Eulerianos e Hamiltonianos nos Grafos.")
-has_eulerian(graph)
-has_hamiltonian(graph)
+    print("\n 11) Retornar o clique máximo em um grafo.")
+    get_clique_maximo(graph)
 
-print("\n 10) Retornar todos os cliques em um grafo.")
-get_all_cliques(graph)
+    print("\n 12) Identificar se o grafo é totalmente conectado e retornar o número de componentes.")
+    get_totally_connected(graph)
 
-print("\n 11) Retornar o clique máximo em um grafo.")
-get_clique_maximo(graph)
+    print("\n 13) Retornar o conjunto de nós da maior componente.")
+    get_bigger_component(graph)
 
-print("\n 12) Identificar se o grafo é totalmente conectado e retornar o número de componentes.")
-get_totally_connected(graph)
+    print("\n 14) Verificar se dois Grafos são Isomórficos.")
+    check_isomorphic(graph, graph08)
 
-print("\n 13) Retornar o conjunto de nós da maior componente.")
-get_bigger_component(graph)
+    print("\n 15) Verificar a existência de bridges nos grafos.")
+    get_bridges(graph)
 
-print("\n 14) Verificar se dois Grafos são Isomórficos.")
-check_isomorphic(graph, graph08)
+    print("\n Análise direcionada (sentido das arestas preservado).")
+    get_directed_summary(ler_grafo_direcionado_csr("/home/abraaolenon/Desktop/Mestrado/p2p-Gnutella09.txt", max_arestas=100))
 
-print("\n 15) Verificar a existência de bridges nos grafos.")
-get_bridges(graph)
+    # Com GRAFOS_INSTRUMENTACAO (ou GRAFOS_TRACE, GRAFOS_LOG...) definida, mostra onde o tempo foi gasto
+    if INSTRUMENTACAO.ativa:
+        print("\n Tempo por etapa.")
+        INSTRUMENTACAO.imprimir_resumo()
@@ -0,0 +1,235 @@
+import time
+
+import numpy as np
+import networkx as nx
+
+from leitura import iterar_blocos_arestas, relatar_vazao
+from grafo_csr import GrafoCSR, rotulos_dos_nos
+
+
+class UniaoBusca:
+    """
+    Conjuntos disjuntos sobre identificadores inteiros não negativos, guardados em arrays.
+
+    As arestas chegam em lotes e cada lote é unido de forma vetorizada, sem laço Python por
+    aresta. Entre um lote e outro a floresta fica totalmente comprimida (`pai[x]` é a raiz de
+    x), então as raízes das pontas saem de uma única indexação. Em cada rodada, toda raiz com
+    uma aresta para uma raiz maior (por tamanho, desempatado pelo identificador) é pendurada
+    na maior delas (união por tamanho) e os caminhos são comprimidos por saltos de ponteiro.
+    Como ao menos metade das raízes envolvidas é absorvida por rodada, bastam O(log n)
+    rodadas. O custo de um lote de k arestas é O(k log n), mais O(n) na recompressão final.
+
+    Atributos:
+        pai (numpy.ndarray): Raiz de cada identificador.
+        tamanho (numpy.ndarray): Número de nós de cada conjunto, válido nas raízes.
+        presente (numpy.ndarray): Identificadores que apareceram em alguma aresta ou em
+            `adicionar_nos` (os demais não contam como componente).
+    """
+
+    def __init__(self, n=0):
+        self.pai = np.arange(n, dtype=np.int64)
+        self.tamanho = np.ones(n, dtype=np.int64)
+        self.presente = np.zeros(n, dtype=bool)
+
+    def __len__(self):
+        return len(self.pai)
+
+    def _crescer(self, n):
+        """Aumenta os arrays para comportar os identificadores 0..n-1 (dobrando a capacidade)."""
+        atual = len(self.pai)
+        if n <= atual:
+            return
+        novo = max(n, 2 * atual)
+        self.pai = np.concatenate([self.pai, np.arange(atual, novo, dtype=np.int64)])
+        self.tamanho = np.concatenate([self.tamanho, np.ones(novo - atual, dtype=np.int64)])
+        self.presente = np.concatenate([self.presente, np.zeros(novo - atual, dtype=bool)])
+
+    def adicionar_nos(self, nos):
+        """Marca nós (inclusive isolados) como presentes."""
+        nos = np.asarray(nos, dtype=np.int64).ravel()
+        if nos.size:
+            if nos.min() < 0:
+                raise ValueError("Os identificadores de nó devem ser inteiros não negativos.")
+            self._crescer(int(nos.max()) + 1)
+            self.presente[nos] = True
+
+    def unir_arestas(self, arestas):
+        """
+        Une as pontas de um lote de arestas.
+
+        Args:
+            arestas (numpy.ndarray): Array (k, 2) de identificadores inteiros não negativos.
+
+        Returns:
+            UniaoBusca: A própria estrutura, para encadear chamadas.
+        """
+        arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+        if not len(arestas):
+            return self
+        self.adicionar_nos(arestas)
+
+        raizes = self.pai[arestas]
+        n = len(self.pai)
+        absorvidas = []
+        while True:
+            raizes = raizes[raizes[:, 0] != raizes[:, 1]]
+            if not len(raizes):
+                break
+            # União por tamanho: cada raiz aponta para a maior (tamanho, id) entre as raízes
+            # ligadas a ela por uma aresta menor; a ordem estrita impede ciclos
+            chave = self.tamanho[raizes] * n + raizes
+            inverter = chave[:, 0] > chave[:, 1]
+            menor = np.where(inverter, raizes[:, 1], raizes[:, 0])
+            chave_maior = np.where(inverter, chave[:, 0], chave[:, 1])
+            ligadas, posicao = np.unique(menor, return_inverse=True)
+            melhor = np.zeros(len(ligadas), dtype=np.int64)
+            np.maximum.at(melhor, posicao, chave_maior)
+            tamanhos = self.tamanho[ligadas]
+            self.pai[ligadas] = melhor % n
+
+            # Compressão de caminho por saltos de ponteiro: cada raiz ligada passa a apontar
+            # direto para a raiz final em O(log profundidade) passos vetorizados
+            while True:
+                salto = self.pai[self.pai[ligadas]]
+                if np.array_equal(salto, self.pai[ligadas]):
+                    break
+                self.pai[ligadas] = salto
+            np.add.at(self.tamanho, self.pai[ligadas], tamanhos)
+            raizes = self.pai[raizes]
+            absorvidas.append(ligadas)
+
+        if absorvidas:
+            # Raízes absorvidas em rodadas anteriores ainda apontam para raízes intermediárias
+            absorvidas = np.concatenate(absorvidas)
+            while True:
+                salto = self.pai[self.pai[absorvidas]]
+                if np.array_equal(salto, self.pai[absorvidas]):
+                    break
+                self.pai[absorvidas] = salto
+            # Os demais nós apontam para raízes antigas, que agora apontam para a final: um salto basta
+            self.pai = self.pai[self.pai]
+        return self
+
+    def resumo(self):
+        """
+        Componentes dos nós presentes, numeradas na ordem da sua raiz.
+
+        Returns:
+            dict: "nos" (identificadores presentes, em ordem crescente), "componente" (rótulo da
+            componente de cada nó, alinhado com "nos"), "tamanhos" (número de nós de cada
+            componente), "num_componentes", "maior_componente" (array com os nós da maior) e
+            "conectado".
+        """
+        nos = np.flatnonzero(self.presente)
+        raizes, componente = np.unique(self.pai[nos], return_inverse=True)
+        tamanhos = self.tamanho[raizes]
+        maior = nos[componente == np.argmax(tamanhos)] if len(raizes) else nos
+        return {
+            "nos": nos,
+            "componente": componente,
+            "tamanhos": tamanhos,
+            "num_componentes": len(raizes),
+            "maior_componente": maior,
+            "conectado": len(raizes) == 1,
+        }
+
+
+def _com_rotulos(resultado, rotulos):
+    """Troca os índices densos de `resultado` pelos identificadores originais dos nós."""
+    resultado["nos"] = rotulos[resultado["nos"]]
+    resultado["maior_componente"] = rotulos[resultado["maior_componente"]]
+    return resultado
+
+
+def _componentes_densas(n, origem, destino):
+    uniao = UniaoBusca(n)
+    uniao.presente[:] = True
+    uniao.unir_arestas(np.column_stack([origem, destino]))
+    return uniao.resumo()
+
+
+def componentes_de_arestas(arestas, nos=None):
+    """
+    Calcula as componentes conexas diretamente de um array de arestas, sem montar um grafo.
+
+    Os identificadores são renumerados para 0..n-1 antes da união, então a memória não depende
+    do maior identificador.
+
+    Args:
+        arestas (numpy.ndarray): Array (m, 2) de identificadores inteiros.
+        nos (iterable, opcional): Nós adicionais, que contam como componentes isoladas se não
+            aparecerem em nenhuma aresta.
+
+    Returns:
+        dict: Ver `UniaoBusca.resumo`; "nos" e "maior_componente" trazem os identificadores
+        originais.
+    """
+    arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+    extras = np.empty(0, dtype=np.int64) if nos is None else np.asarray(list(nos), dtype=np.int64)
+    rotulos, densos = np.unique(np.concatenate([arestas.ravel(), extras]), return_inverse=True)
+    pares = densos[:arestas.size].reshape(-1, 2)
+    return _com_rotulos(_componentes_densas(len(rotulos), pares[:, 0], pares[:, 1]), rotulos)
+
+
+def componentes_de_arquivo(caminho_arquivo, max_arestas=None):
+    """
+    Calcula as componentes conexas de um arquivo de arestas lido em blocos, sem guardar as arestas.
+
+    A memória usada é proporcional ao maior identificador de nó, não ao número de arestas, o
+    que permite processar arquivos grandes demais para virar um grafo na memória.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo de texto.
+        max_arestas (int, opcional): Limite de arestas a ler. None lê o arquivo inteiro.
+
+    Returns:
+        dict: Ver `UniaoBusca.resumo`.
+    """
+    uniao = UniaoBusca()
+    total = 0
+    inicio = time.perf_counter()
+    for bloco in iterar_blocos_arestas(caminho_arquivo, max_arestas=max_arestas):
+        uniao.unir_arestas(bloco)
+        total += len(bloco)
+    relatar_vazao(caminho_arquivo, total, time.perf_counter() - inicio)
+    return uniao.resumo()
+
+
+def componentes_do_grafo(grafo):
+    """
+    Componentes conexas de um `nx.Graph`, `GrafoCSR`, array de arestas ou arquivo de arestas,
+    em uma única passada de união-busca.
+
+    Returns:
+        dict: Ver `UniaoBusca.resumo`; "nos" e "maior_componente" trazem os identificadores
+        originais dos nós.
+    """
+    if isinstance(grafo, GrafoCSR):
+        origem = np.repeat(np.arange(grafo.num_nos), np.diff(grafo.indptr))
+        metade = origem < grafo.indices
+        return _com_rotulos(_componentes_densas(grafo.num_nos, origem[metade], grafo.indices[metade]), grafo.rotulos)
+    if isinstance(grafo, nx.Graph):
+        nos = list(grafo.nodes)
+        indice = {no: i for i, no in enumerate(nos)}
+        pares = np.fromiter(
+            (indice[no] for aresta in grafo.edges for no in aresta),
+            dtype=np.int64, count=2 * grafo.number_of_edges()
+        ).reshape(-1, 2)
+        return _com_rotulos(_componentes_densas(len(nos), pares[:, 0], pares[:, 1]), rotulos_dos_nos(nos))
+    if isinstance(grafo, str):
+        return componentes_de_arquivo(grafo)
+    return componentes_de_arestas(grafo)
+
+
+def listar_componentes(resultado):
+    """
+    Separa os nós de um resultado de `componentes_do_grafo` em uma lista por componente.
+
+    Returns:
+        list: Um array de nós por componente, na ordem dos rótulos.
+    """
+    if not resultado["num_componentes"]:
+        return []
+    ordem = np.argsort(resultado["componente"], kind="stable")
+    cortes = np.cumsum(resultado["tamanhos"])[:-1]
+    return np.split(resultado["nos"][ordem], cortes)
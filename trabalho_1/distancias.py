@@ -0,0 +1,355 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from statistics import NormalDist
+
+import numpy as np
+
+from grafo_csr import GrafoCSR
+
+
+MIN_ORIGENS_POR_PROCESSO = 512  # Abaixo disso o custo de criar processos não compensa
+
+# Grafo montado sobre a memória compartilhada, um por processo trabalhador
+_memoria_trabalhador = None
+_grafo_trabalhador = None
+
+
+def _varrer(csr, origens):
+    """
+    Executa uma BFS a partir de cada origem e acumula as estatísticas da varredura.
+
+    Returns:
+        tuple: (somas das distâncias, nós alcançados, excentricidades, nós mais distantes,
+        histograma de distâncias), os quatro primeiros alinhados com `origens`.
+    """
+    somas = np.zeros(len(origens), dtype=np.int64)
+    alcancados = np.zeros(len(origens), dtype=np.int64)
+    excentricidades = np.zeros(len(origens), dtype=np.int64)
+    mais_distantes = np.zeros(len(origens), dtype=np.int64)
+    histograma = np.zeros(1, dtype=np.int64)
+
+    for posicao, origem in enumerate(origens):
+        distancia = csr.bfs(origem)
+        alcancadas = distancia[distancia > 0]
+        somas[posicao] = alcancadas.sum()
+        alcancados[posicao] = alcancadas.size
+        mais_distantes[posicao] = np.argmax(distancia)
+        excentricidades[posicao] = distancia[mais_distantes[posicao]]
+
+        contagem = np.bincount(alcancadas)
+        if contagem.size > histograma.size:
+            histograma = np.concatenate([histograma, np.zeros(contagem.size - histograma.size, dtype=np.int64)])
+        histograma[:contagem.size] += contagem
+
+    return somas, alcancados, excentricidades, mais_distantes, histograma
+
+
+def _iniciar_trabalhador(nome_memoria, num_nos, num_entradas, tipo):
+    """Anexa o processo trabalhador ao bloco de memória compartilhada com o CSR."""
+    global _memoria_trabalhador, _grafo_trabalhador
+    _memoria_trabalhador = SharedMemory(name=nome_memoria)
+    tipo = np.dtype(tipo)
+    indptr = np.ndarray((num_nos + 1,), dtype=tipo, buffer=_memoria_trabalhador.buf)
+    indices = np.ndarray((num_entradas,), dtype=tipo, buffer=_memoria_trabalhador.buf,
+                         offset=(num_nos + 1) * tipo.itemsize)
+    _grafo_trabalhador = GrafoCSR(indptr, indices, np.arange(num_nos))
+
+
+def _varrer_trabalhador(origens):
+    return _varrer(_grafo_trabalhador, origens)
+
+
+def _somar_histogramas(histogramas):
+    total = np.zeros(max(len(h) for h in histogramas), dtype=np.int64)
+    for histograma in histogramas:
+        total[:len(histograma)] += histograma
+    return total
+
+
+def varredura_bfs(csr, processos=None, origens=None):
+    """
+    Executa uma única BFS a partir de cada nó e coleta, na mesma passada, tudo o que as métricas
+    de distância precisam: soma das distâncias, nós alcançados, excentricidade, nó mais distante
+    e o histograma de distâncias.
+
+    As origens são divididas em um bloco por processo. A adjacência é copiada uma única vez
+    para um bloco de memória compartilhada, que todos os processos leem sem copiar.
+
+    Args:
+        csr (GrafoCSR): O grafo.
+        processos (int, opcional): Número de processos. Padrão: número de núcleos. Com 1, ou com
+            poucas origens, a varredura roda no processo atual.
+        origens (numpy.ndarray, opcional): Índices densos das origens. Padrão: todos os nós.
+
+    Returns:
+        dict: Arrays alinhados com `origens` ("origens", "somas", "alcancados", "excentricidades",
+        "mais_distantes") e "histograma", em que histograma[d] é o número de pares ordenados
+        (origem, destino) à distância d.
+    """
+    origens = np.arange(csr.num_nos) if origens is None else np.asarray(origens, dtype=np.int64)
+    if processos is None:
+        processos = os.cpu_count() or 1
+    processos = max(1, min(processos, len(origens) // MIN_ORIGENS_POR_PROCESSO))
+
+    if processos == 1:
+        partes = [_varrer(csr, origens)]
+    else:
+        indptr = np.ascontiguousarray(csr.indptr)
+        indices = np.ascontiguousarray(csr.indices, dtype=indptr.dtype)
+        memoria = SharedMemory(create=True, size=max(1, indptr.nbytes + indices.nbytes))
+        try:
+            memoria.buf[:indptr.nbytes] = indptr.tobytes()
+            memoria.buf[indptr.nbytes:indptr.nbytes + indices.nbytes] = indices.tobytes()
+            argumentos = (memoria.name, csr.num_nos, len(indices), indptr.dtype.str)
+            with ProcessPoolExecutor(processos, initializer=_iniciar_trabalhador, initargs=argumentos) as executor:
+                partes = list(executor.map(_varrer_trabalhador, np.array_split(origens, processos)))
+        finally:
+            memoria.close()
+            memoria.unlink()
+
+    somas, alcancados, excentricidades, mais_distantes, histogramas = zip(*partes)
+    return {
+        "origens": origens,
+        "somas": np.concatenate(somas),
+        "alcancados": np.concatenate(alcancados),
+        "excentricidades": np.concatenate(excentricidades),
+        "mais_distantes": np.concatenate(mais_distantes),
+        "histograma": _somar_histogramas(histogramas),
+    }
+
+
+def resumir_componentes(csr, varredura):
+    """
+    Agrupa o resultado de `varredura_bfs` (feita sobre todos os nós) por componente conexa.
+
+    Args:
+        csr (GrafoCSR): O grafo varrido.
+        varredura (dict): Resultado de `varredura_bfs`.
+
+    Returns:
+        list: Um dicionário por componente, na ordem de `csr.lista_componentes()`, com "nos"
+        (índices densos), "distancia_media", "diametro", "raio" e "extremos" (par de índices
+        densos que realiza o diâmetro).
+    """
+    por_origem = np.empty(csr.num_nos, dtype=np.int64)
+    por_origem[varredura["origens"]] = np.arange(len(varredura["origens"]))
+
+    resumo = []
+    for componente in csr.lista_componentes():
+        posicoes = por_origem[componente]
+        pares = varredura["alcancados"][posicoes].sum()
+        excentricidades = varredura["excentricidades"][posicoes]
+        mais_excentrico = int(np.argmax(excentricidades))
+        resumo.append({
+            "nos": componente,
+            "distancia_media": varredura["somas"][posicoes].sum() / pares if pares else 0,
+            "diametro": int(excentricidades[mais_excentrico]),
+            "raio": int(excentricidades.min()),
+            "extremos": (int(componente[mais_excentrico]),
+                         int(varredura["mais_distantes"][posicoes[mais_excentrico]])),
+        })
+    return resumo
+
+
+def diametro_e_raio(csr, componente, entrada=None):
+    """
+    Calcula o diâmetro e o raio exatos de uma componente conexa sem calcular todas as
+    excentricidades, usando o algoritmo BoundingDiameters (Takes e Kosters, 2011).
+
+    Cada BFS a partir de um nó v com excentricidade e(v) limita a excentricidade de todo nó w:
+    max(e(v) - d(v, w), d(v, w)) <= e(w) <= e(v) + d(v, w). Nós cujos limites já não podem
+    alterar o diâmetro nem o raio são descartados, e as buscas alternam entre o candidato de
+    maior limite superior e o de menor limite inferior (empates vão para o de maior grau).
+    Em grafos reais costumam bastar poucas dezenas de BFS.
+
+    Em um grafo direcionado, `csr` traz as arestas de saída, `entrada` as de entrada e a
+    componente precisa ser fortemente conexa; a excentricidade é a de saída. Cada nó escolhido
+    faz uma BFS para frente, d(v, w), e outra para trás, d(w, v), e os limites passam a ser
+    max(e(v) - d(v, w), d(w, v)) <= e(w) <= e(v) + d(w, v).
+
+    Args:
+        csr (GrafoCSR): O grafo (ou as suas arestas de saída).
+        componente (numpy.ndarray): Índices densos dos nós de uma componente conexa (fortemente
+            conexa, no caso direcionado).
+        entrada (GrafoCSR, opcional): Arestas de entrada de um grafo direcionado.
+
+    Returns:
+        dict: "nos", "diametro", "raio", "extremos" (par de índices densos que realiza o
+        diâmetro), "centro" (índice denso de um nó de excentricidade mínima) e "bfs"
+        (número de buscas executadas).
+    """
+    n = len(componente)
+    grau = np.diff(csr.indptr)[componente]
+    limite_inferior = np.zeros(n, dtype=np.int64)
+    limite_superior = np.full(n, n, dtype=np.int64)
+    candidatos = np.ones(n, dtype=bool)
+
+    diametro_inferior, diametro_superior = -1, n
+    raio_inferior, raio_superior = 0, n
+    extremos, centro = (int(componente[0]), int(componente[0])), int(componente[0])
+    buscas = 0
+    pelo_maior = True
+
+    while candidatos.any() and (diametro_inferior != diametro_superior or raio_inferior != raio_superior):
+        # Alterna entre o maior limite superior e o menor limite inferior; empate pelo maior grau
+        posicoes = np.flatnonzero(candidatos)
+        chave = limite_superior[posicoes] if pelo_maior else -limite_inferior[posicoes]
+        empatados = posicoes[chave == chave.max()]
+        escolhido = int(empatados[np.argmax(grau[empatados])])
+        pelo_maior = not pelo_maior
+
+        distancia = csr.bfs(componente[escolhido])[componente].astype(np.int64)
+        buscas += 1
+        if entrada is None:
+            ate = distancia
+        else:
+            ate = entrada.bfs(componente[escolhido])[componente].astype(np.int64)
+            buscas += 1
+        mais_distante = int(np.argmax(distancia))
+        excentricidade = int(distancia[mais_distante])
+
+        limite_inferior = np.maximum(limite_inferior, np.maximum(excentricidade - distancia, ate))
+        limite_superior = np.minimum(limite_superior, excentricidade + ate)
+        limite_inferior[escolhido] = limite_superior[escolhido] = excentricidade
+
+        if excentricidade > diametro_inferior:
+            diametro_inferior = excentricidade
+            extremos = (int(componente[escolhido]), int(componente[mais_distante]))
+
+        # Nós cujos limites coincidiram têm excentricidade exata e também atualizam os limites
+        exatos = np.flatnonzero(limite_inferior == limite_superior)
+        maior = int(exatos[np.argmax(limite_inferior[exatos])])
+        if limite_inferior[maior] > diametro_inferior:
+            diametro_inferior = int(limite_inferior[maior])
+            extremos = (int(componente[maior]), None)  # O outro extremo sai de uma BFS no final
+        menor = int(exatos[np.argmin(limite_inferior[exatos])])
+        if limite_inferior[menor] < raio_superior:
+            raio_superior = int(limite_inferior[menor])
+            centro = int(componente[menor])
+
+        # Descarta nós com excentricidade conhecida ou que não afetam diâmetro nem raio
+        candidatos &= limite_inferior != limite_superior
+        candidatos &= ~((limite_superior <= diametro_inferior) & (limite_inferior >= raio_superior))
+        restantes = candidatos.any()
+        diametro_superior = max(diametro_inferior, int(limite_superior[candidatos].max())) if restantes else diametro_inferior
+        raio_inferior = min(raio_superior, int(limite_inferior[candidatos].min())) if restantes else raio_superior
+
+    if extremos[1] is None:
+        distancia = csr.bfs(extremos[0])[componente]
+        buscas += 1
+        extremos = (extremos[0], int(componente[np.argmax(distancia)]))
+
+    return {
+        "nos": componente,
+        "diametro": max(diametro_inferior, 0),
+        "raio": raio_superior if buscas else 0,
+        "extremos": extremos,
+        "centro": centro,
+        "bfs": buscas,
+    }
+
+
+def _estimar_media(grupos, tamanhos):
+    """
+    Média estratificada das distâncias médias por origem e a variância do estimador.
+
+    Args:
+        grupos (list): Para cada estrato, lista das distâncias médias das origens sorteadas.
+        tamanhos (list): Número total de nós de cada estrato.
+
+    Returns:
+        tuple: (média estimada, variância). Estratos ainda sem amostras ficam de fora da média e
+        a variância é None enquanto algum estrato não esgotado tiver menos de duas amostras.
+    """
+    total = sum(tamanho for valores, tamanho in zip(grupos, tamanhos) if valores)
+    media = 0.0
+    variancia = 0.0
+    for valores, tamanho in zip(grupos, tamanhos):
+        if len(valores) < min(2, tamanho):
+            variancia = None
+        if not valores:
+            continue
+        peso = tamanho / total
+        media += peso * np.mean(valores)
+        if variancia is not None and len(valores) < tamanho:
+            # Correção para população finita: o estrato é amostrado sem reposição
+            variancia += peso ** 2 * np.var(valores, ddof=1) / len(valores) * (1 - len(valores) / tamanho)
+    return media, variancia
+
+
+def distancia_media_amostrada(csr, componente, amostras=256, estrategia="uniforme", erro_relativo=None,
+                              confianca=0.95, tempo_limite=None, estratos=4, semente=None):
+    """
+    Estima a distância média entre os pares de uma componente a partir de BFS em origens sorteadas.
+
+    Cada BFS a partir de uma origem s dá a distância média de s a todos os outros nós da
+    componente; a média desses valores sobre todas as origens é exatamente a distância média da
+    componente. As origens são sorteadas sem reposição, de modo uniforme ou estratificado por
+    grau (os nós, ordenados por grau, são divididos em `estratos` faixas de mesmo tamanho e as
+    amostras são distribuídas proporcionalmente). O intervalo de confiança usa a aproximação
+    normal com correção para população finita.
+
+    A amostragem para quando `amostras` origens foram usadas, quando a meia-largura do intervalo
+    dividida pela média fica abaixo de `erro_relativo` ou quando `tempo_limite` se esgota. Se
+    todas as origens forem usadas, o resultado é exato.
+
+    Args:
+        csr (GrafoCSR): O grafo.
+        componente (numpy.ndarray): Índices densos dos nós de uma componente conexa.
+        amostras (int): Número máximo de origens.
+        estrategia (str): "uniforme" ou "grau".
+        erro_relativo (float, opcional): Erro relativo alvo para parada antecipada.
+        confianca (float): Nível de confiança do intervalo.
+        tempo_limite (float, opcional): Orçamento de tempo em segundos.
+        estratos (int): Número de faixas de grau na estratégia "grau".
+        semente (int, opcional): Semente do sorteio.
+
+    Returns:
+        dict: "media", "intervalo" (limites inferior e superior), "erro_relativo" (meia-largura
+        relativa obtida), "amostras" (origens usadas), "populacao" e "exato".
+    """
+    n = len(componente)
+    if n < 2:
+        return {"media": 0.0, "intervalo": (0.0, 0.0), "erro_relativo": 0.0, "amostras": n, "populacao": n, "exato": True}
+
+    gerador = np.random.default_rng(semente)
+    if estrategia == "uniforme":
+        faixas = [gerador.permutation(componente)]
+    elif estrategia == "grau":
+        por_grau = componente[np.argsort(np.diff(csr.indptr)[componente], kind="stable")]
+        faixas = [gerador.permutation(faixa) for faixa in np.array_split(por_grau, min(estratos, n)) if len(faixa)]
+    else:
+        raise ValueError(f"Estratégia de amostragem desconhecida: {estrategia!r}")
+
+    tamanhos = [len(faixa) for faixa in faixas]
+    grupos = [[] for _ in faixas]
+    z = NormalDist().inv_cdf((1 + confianca) / 2)
+    inicio = time.perf_counter()
+    usadas = 0
+    meia_largura = float("inf")
+
+    while usadas < min(amostras, n):
+        # Alocação proporcional: sorteia no estrato com menor fração já amostrada
+        estrato = min((len(g) / t, h) for h, (g, t) in enumerate(zip(grupos, tamanhos)) if len(g) < t)[1]
+        distancia = csr.bfs(faixas[estrato][len(grupos[estrato])])[componente]
+        grupos[estrato].append(distancia.sum() / (n - 1))
+        usadas += 1
+
+        media, variancia = _estimar_media(grupos, tamanhos)
+        if variancia is not None:
+            meia_largura = z * variancia ** 0.5
+            if erro_relativo is not None and meia_largura <= erro_relativo * media:
+                break
+        if tempo_limite is not None and time.perf_counter() - inicio >= tempo_limite:
+            break
+
+    return {
+        "media": float(media),
+        "intervalo": (float(media - meia_largura), float(media + meia_largura)),
+        "erro_relativo": float(meia_largura / media) if media else 0.0,
+        "amostras": usadas,
+        "populacao": n,
+        "exato": usadas == n,
+    }
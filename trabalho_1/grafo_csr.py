@@ -0,0 +1,297 @@
+import numpy as np
+import networkx as nx
+
+from leitura import ler_arestas
+from instrumentacao import instrumentar
+
+
+def rotulos_dos_nos(nos):
+    """
+    Array 1-D com os identificadores originais dos nós, um elemento por nó.
+
+    Nós todos inteiros viram um array de inteiros; qualquer outro caso (tuplas, como em
+    `nx.grid_2d_graph`, textos, tipos mistos, inteiros grandes demais para 64 bits) vira um
+    array de objetos preenchido elemento a elemento, para que o NumPy não transforme tuplas
+    em linhas de uma matriz.
+
+    Args:
+        nos (list): Os nós, na ordem dos índices densos.
+
+    Returns:
+        numpy.ndarray: Array (n,) de inteiros ou de objetos.
+    """
+    if not nos:
+        return np.empty(0, dtype=np.int64)
+    if all(isinstance(no, (int, np.integer)) and not isinstance(no, bool) for no in nos):
+        rotulos = np.array(nos)
+        if rotulos.ndim == 1 and rotulos.dtype.kind in "iu":
+            return rotulos
+    rotulos = np.empty(len(nos), dtype=object)
+    for i, no in enumerate(nos):
+        rotulos[i] = no
+    return rotulos
+
+
+class GrafoCSR:
+    """
+    Grafo não direcionado armazenado em formato CSR (Compressed Sparse Row).
+
+    Os nós são renumerados para o intervalo denso 0..n-1. Os vizinhos do nó i ficam em
+    `indices[indptr[i]:indptr[i + 1]]` e `rotulos[i]` guarda o identificador original do nó.
+    Cada aresta {u, v} aparece duas vezes (u -> v e v -> u); laços aparecem uma vez.
+
+    Atributos:
+        indptr (numpy.ndarray): Deslocamentos (n + 1) do início da lista de vizinhos de cada nó.
+        indices (numpy.ndarray): Vizinhos concatenados, ordenados dentro de cada nó.
+        rotulos (numpy.ndarray): Identificador original de cada nó denso.
+    """
+
+    def __init__(self, indptr, indices, rotulos):
+        self.indptr = indptr
+        self.indices = indices
+        self.rotulos = rotulos
+        self._indice_por_rotulo = None
+        self._ordenado = None
+        self._componentes = None
+
+    # ------------------------------------------------------------------ construção
+
+    @classmethod
+    def de_arestas(cls, arestas):
+        """
+        Constrói o grafo a partir de um array (m, 2) de arestas com identificadores originais.
+
+        Arestas repetidas (inclusive nos dois sentidos) são unificadas, como em `nx.Graph`.
+
+        Args:
+            arestas (numpy.ndarray): Pares (origem, destino) de inteiros.
+
+        Returns:
+            GrafoCSR: O grafo compacto.
+        """
+        arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+        rotulos, densos = np.unique(arestas, return_inverse=True)
+        densos = densos.reshape(-1, 2)
+        return cls._de_pares(densos[:, 0], densos[:, 1], rotulos)
+
+    @classmethod
+    def de_networkx(cls, grafo):
+        """
+        Constrói o grafo compacto a partir de um `nx.Graph`, preservando a ordem dos nós.
+
+        Args:
+            grafo (networkx.Graph): O grafo de origem.
+
+        Returns:
+            GrafoCSR: O grafo compacto.
+        """
+        nos = list(grafo.nodes)
+        indice = {no: i for i, no in enumerate(nos)}
+        pares = np.fromiter(
+            (indice[no] for aresta in grafo.edges for no in aresta),
+            dtype=np.int64, count=2 * grafo.number_of_edges()
+        ).reshape(-1, 2)
+        return cls._de_pares(pares[:, 0], pares[:, 1], rotulos_dos_nos(nos))
+
+    @classmethod
+    def _de_pares(cls, origem, destino, rotulos):
+        n = len(rotulos)
+        # Simetriza e remove duplicatas usando a chave origem * n + destino
+        chaves = np.unique(np.concatenate([origem * n + destino, destino * n + origem]))
+        tipo = np.int32 if max(n, len(chaves)) < np.iinfo(np.int32).max else np.int64
+        indices = (chaves % max(n, 1)).astype(tipo)
+        indptr = np.zeros(n + 1, dtype=tipo)
+        np.cumsum(np.bincount(chaves // max(n, 1), minlength=n), out=indptr[1:])
+        return cls(indptr, indices, rotulos)
+
+    def para_networkx(self):
+        """
+        Converte o grafo compacto de volta para um `nx.Graph` com os identificadores originais.
+
+        Returns:
+            networkx.Graph: O grafo equivalente.
+        """
+        grafo = nx.Graph()
+        grafo.add_nodes_from(self.rotulos.tolist())
+        origem = np.repeat(np.arange(self.num_nos), np.diff(self.indptr))
+        metade = origem <= self.indices
+        grafo.add_edges_from(zip(self.rotulos[origem[metade]].tolist(), self.rotulos[self.indices[metade]].tolist()))
+        return grafo
+
+    # ------------------------------------------------------------------ consultas básicas
+
+    @property
+    def num_nos(self):
+        return len(self.indptr) - 1
+
+    @property
+    def num_arestas(self):
+        lacos = int(np.count_nonzero(self._lacos()))
+        return (len(self.indices) - lacos) // 2 + lacos
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelos arrays do grafo, em bytes."""
+        return self.indptr.nbytes + self.indices.nbytes + self.rotulos.nbytes
+
+    def __len__(self):
+        return self.num_nos
+
+    def __contains__(self, no):
+        try:
+            self.indice(no)
+        except KeyError:
+            return False
+        return True
+
+    def indice(self, no):
+        """
+        Retorna o índice denso de um nó a partir do seu identificador original.
+
+        Raises:
+            KeyError: Se o nó não pertence ao grafo.
+        """
+        if self._rotulos_ordenados():
+            # Rótulos inteiros ordenados (caso de `de_arestas`): busca binária, sem dicionário
+            if isinstance(no, (int, np.integer)) and not isinstance(no, bool):
+                posicao = int(np.searchsorted(self.rotulos, no))
+                if posicao < self.num_nos and self.rotulos[posicao] == no:
+                    return posicao
+            raise KeyError(no)
+        if self._indice_por_rotulo is None:
+            self._indice_por_rotulo = {rotulo: i for i, rotulo in enumerate(self.rotulos.tolist())}
+        return self._indice_por_rotulo[no]
+
+    def _rotulos_ordenados(self):
+        if self._ordenado is None:
+            self._ordenado = self.rotulos.dtype.kind in "iu" and bool(np.all(self.rotulos[:-1] < self.rotulos[1:]))
+        return self._ordenado
+
+    def rotulo(self, i):
+        """Retorna o identificador original do nó denso `i`."""
+        return self.rotulos[i].item() if hasattr(self.rotulos[i], "item") else self.rotulos[i]
+
+    def vizinhos(self, i):
+        """Retorna os vizinhos (índices densos) do nó denso `i`."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def _lacos(self):
+        origem = np.repeat(np.arange(self.num_nos), np.diff(self.indptr))
+        return origem == self.indices
+
+    def grau(self):
+        """
+        Calcula o grau de todos os nós (laços contam duas vezes, como no NetworkX).
+
+        Returns:
+            numpy.ndarray: Grau de cada nó denso.
+        """
+        graus = np.diff(self.indptr).astype(np.int64)
+        origem = np.repeat(np.arange(self.num_nos), np.diff(self.indptr))
+        np.add.at(graus, origem[self._lacos()], 1)
+        return graus
+
+    def densidade(self):
+        """Densidade do grafo não direcionado, igual a `nx.density`."""
+        n = self.num_nos
+        return 0.0 if n <= 1 else 2 * self.num_arestas / (n * (n - 1))
+
+    # ------------------------------------------------------------------ buscas
+
+    def _vizinhos_de(self, fronteira):
+        """Concatena as listas de vizinhos de um conjunto de nós sem laços em Python."""
+        inicio = self.indptr[fronteira]
+        comprimentos = self.indptr[fronteira + 1] - inicio
+        total = int(comprimentos.sum())
+        deslocamento = np.repeat(inicio - np.cumsum(comprimentos) + comprimentos, comprimentos)
+        return self.indices[deslocamento + np.arange(total)], comprimentos
+
+    def bfs(self, origem, predecessores=False):
+        """
+        Busca em largura a partir do nó denso `origem`, processando um nível inteiro por vez.
+
+        Args:
+            origem (int): Índice denso do nó inicial.
+            predecessores (bool): Se True, também retorna o predecessor de cada nó na árvore da busca.
+
+        Returns:
+            numpy.ndarray: Distância de cada nó à origem (-1 se inalcançável), ou a tupla
+            (distâncias, predecessores) quando `predecessores` é True.
+        """
+        distancia = np.full(self.num_nos, -1, dtype=np.int32)
+        anterior = np.full(self.num_nos, -1, dtype=np.int64) if predecessores else None
+        distancia[origem] = 0
+        fronteira = np.array([origem], dtype=np.int64)
+        nivel = 0
+        while fronteira.size:
+            nivel += 1
+            vizinhos, comprimentos = self._vizinhos_de(fronteira)
+            novos = distancia[vizinhos] < 0
+            if predecessores:
+                pais = np.repeat(fronteira, comprimentos)[novos]
+                fronteira, primeiro = np.unique(vizinhos[novos], return_index=True)
+                anterior[fronteira] = pais[primeiro]
+            else:
+                fronteira = np.unique(vizinhos[novos])
+            distancia[fronteira] = nivel
+        if predecessores:
+            return distancia, anterior
+        return distancia
+
+    def componentes(self):
+        """
+        Rotula as componentes conexas, numeradas na ordem do menor índice denso de cada uma.
+
+        Os rótulos saem de uma única passada de união-busca sobre as arestas (ver
+        `componentes.componentes_do_grafo`) e ficam guardados para as próximas chamadas.
+
+        Returns:
+            numpy.ndarray: Rótulo da componente de cada nó denso.
+        """
+        if self._componentes is None:
+            from componentes import componentes_do_grafo  # componentes importa este módulo
+
+            rotulo = componentes_do_grafo(self)["componente"]
+            _, primeiro = np.unique(rotulo, return_index=True)
+            renumeracao = np.empty(len(primeiro), dtype=np.int64)
+            renumeracao[np.argsort(primeiro)] = np.arange(len(primeiro))
+            self._componentes = renumeracao[rotulo]
+        return self._componentes
+
+    def lista_componentes(self):
+        """Retorna a lista de componentes, cada uma como array de índices densos."""
+        if self.num_nos == 0:
+            return []
+        rotulo = self.componentes()
+        ordem = np.argsort(rotulo, kind="stable")
+        cortes = np.cumsum(np.bincount(rotulo))[:-1]
+        return np.split(ordem, cortes)
+
+
+@instrumentar("leitura")
+def ler_grafo_csr(caminho_arquivo, max_arestas=None):
+    """
+    Lê um arquivo de arestas SNAP diretamente para um `GrafoCSR`, sem criar um `nx.Graph`.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo de texto.
+        max_arestas (int, opcional): Limite de arestas a ler. None lê o arquivo inteiro.
+
+    Returns:
+        GrafoCSR: O grafo não direcionado em formato compacto.
+    """
+    return GrafoCSR.de_arestas(ler_arestas(caminho_arquivo, max_arestas=max_arestas))
+
+
+def caminho_bfs(csr, origem, destino):
+    """
+    Retorna o menor caminho (índices densos) entre dois nós, ou None se não houver.
+    """
+    distancia, anterior = csr.bfs(origem, predecessores=True)
+    if distancia[destino] < 0:
+        return None
+    caminho = [destino]
+    while caminho[-1] != origem:
+        caminho.append(int(anterior[caminho[-1]]))
+    return caminho[::-1]
+
@@ -0,0 +1,267 @@
+import time
+from collections import Counter, deque
+
+import numpy as np
+
+from leitura import iterar_blocos_arestas, relatar_vazao
+
+
+class GrafoDinamico:
+    """
+    Grafo não direcionado que recebe lotes de inserções e remoções de arestas e mantém, de
+    forma incremental, o número de componentes, o tamanho da maior componente, a densidade e o
+    histograma de graus.
+
+    As componentes ficam em uma estrutura de conjuntos disjuntos com união por tamanho: cada nó
+    aponta para o identificador da sua componente e cada componente guarda os seus membros. Na
+    união, os membros da componente menor passam para a maior (custo amortizado O(log n) por
+    nó). Como uma remoção pode dividir uma componente, o que a união-busca por ponteiros não
+    permite desfazer, o grafo mantém também uma floresta geradora: as arestas que uniram duas
+    componentes na inserção. Remover uma aresta fora da floresta nunca desconecta nada e custa
+    O(1). Remover uma aresta da floresta divide a árvore em duas; duas buscas intercaladas
+    pela floresta acham a menor delas, e as arestas dos seus nós são percorridas atrás de uma
+    substituta que volte a ligar os dois lados. Se ela existe, entra na floresta e a
+    componente não muda; senão, os nós do lado menor formam uma nova componente. Em ambos os
+    casos o custo é proporcional ao lado menor (nós e arestas), nunca à componente inteira.
+
+    Atributos:
+        adjacencia (dict): Nó -> conjunto de vizinhos.
+    """
+
+    def __init__(self):
+        self.adjacencia = {}
+        self._grau = {}
+        self._floresta = {}  # Nó -> vizinhos pelas arestas da floresta geradora
+        self._histograma = Counter()  # Grau -> número de nós
+        self._componente = {}  # Nó -> identificador da componente
+        self._membros = {}  # Identificador -> conjunto de nós
+        self._tamanhos = Counter()  # Tamanho de componente -> número de componentes
+        self._proximo_id = 0
+        self._num_arestas = 0
+
+    # ------------------------------------------------------------------ construção
+
+    @classmethod
+    def de_networkx(cls, grafo):
+        """Cria o grafo dinâmico com os nós e as arestas de um `nx.Graph`."""
+        dinamico = cls()
+        dinamico.adicionar_nos(grafo.nodes)
+        dinamico.inserir_arestas(grafo.edges)
+        return dinamico
+
+    @classmethod
+    def de_arquivo(cls, caminho_arquivo, max_arestas=None):
+        """Cria o grafo dinâmico a partir de um arquivo de arestas SNAP, lido em blocos."""
+        dinamico = cls()
+        total = 0
+        inicio = time.perf_counter()
+        for bloco in iterar_blocos_arestas(caminho_arquivo, max_arestas=max_arestas):
+            dinamico.inserir_arestas(bloco.tolist())
+            total += len(bloco)
+        relatar_vazao(caminho_arquivo, total, time.perf_counter() - inicio)
+        return dinamico
+
+    # ------------------------------------------------------------------ atualizações
+
+    def _mudar_grau(self, no, delta):
+        grau = self._grau[no]
+        self._histograma[grau] -= 1
+        if not self._histograma[grau]:
+            del self._histograma[grau]
+        self._grau[no] = grau + delta
+        self._histograma[grau + delta] += 1
+
+    def _mudar_tamanho(self, antigo, novo):
+        if antigo:
+            self._tamanhos[antigo] -= 1
+            if not self._tamanhos[antigo]:
+                del self._tamanhos[antigo]
+        if novo:
+            self._tamanhos[novo] += 1
+
+    def _nova_componente(self, nos):
+        identificador = self._proximo_id
+        self._proximo_id += 1
+        self._membros[identificador] = nos
+        for no in nos:
+            self._componente[no] = identificador
+        self._mudar_tamanho(0, len(nos))
+        return identificador
+
+    def adicionar_nos(self, nos):
+        """Adiciona nós isolados (nós já existentes são ignorados)."""
+        for no in nos:
+            if no not in self.adjacencia:
+                self.adjacencia[no] = set()
+                self._floresta[no] = set()
+                self._grau[no] = 0
+                self._histograma[0] += 1
+                self._nova_componente({no})
+
+    def _unir(self, u, v):
+        """Une as componentes de u e v; a aresta (u, v) passa a fazer parte da floresta geradora."""
+        a, b = self._componente[u], self._componente[v]
+        if a == b:
+            return
+        self._floresta[u].add(v)
+        self._floresta[v].add(u)
+        if len(self._membros[a]) < len(self._membros[b]):
+            a, b = b, a
+        menor = self._membros.pop(b)
+        maior = self._membros[a]
+        self._mudar_tamanho(len(menor), 0)
+        self._mudar_tamanho(len(maior), len(maior) + len(menor))
+        for no in menor:
+            self._componente[no] = a
+        maior |= menor
+
+    def inserir_arestas(self, arestas):
+        """
+        Insere um lote de arestas (pares de nós). Arestas já existentes são ignoradas.
+
+        Custo: O(1) por aresta, mais a migração amortizada dos membros na união de componentes.
+        """
+        for u, v in arestas:
+            self.adicionar_nos((u, v))
+            if v in self.adjacencia[u]:
+                continue
+            self.adjacencia[u].add(v)
+            self.adjacencia[v].add(u)
+            self._num_arestas += 1
+            if u == v:
+                self._mudar_grau(u, 2)  # Laços contam duas vezes, como no NetworkX
+                continue
+            self._mudar_grau(u, 1)
+            self._mudar_grau(v, 1)
+            self._unir(u, v)
+
+    def _arvore_menor(self, u, v):
+        """
+        Buscas em largura intercaladas pela floresta a partir de u e de v, um nó por vez em cada
+        lado, depois que a aresta (u, v) saiu dela. As duas árvores resultantes são disjuntas,
+        então a menor se esgota primeiro, com custo O(árvore menor).
+
+        Returns:
+            set: Os nós da árvore que se esgotou primeiro.
+        """
+        visitados = ({u}, {v})
+        filas = (deque([u]), deque([v]))
+        while True:
+            for lado in (0, 1):
+                if not filas[lado]:
+                    return visitados[lado]
+                x = filas[lado].popleft()
+                for w in self._floresta[x]:
+                    if w not in visitados[lado]:
+                        visitados[lado].add(w)
+                        filas[lado].append(w)
+
+    def _substituta(self, lado):
+        """Uma aresta (x, w) do grafo com x em `lado` e w fora dele, ou None se não há."""
+        for x in lado:
+            for w in self.adjacencia[x]:
+                if w not in lado:
+                    return x, w
+        return None
+
+    def remover_arestas(self, arestas):
+        """
+        Remove um lote de arestas (pares de nós). Arestas inexistentes são ignoradas; os nós
+        permanecem no grafo, como em `nx.Graph.remove_edge`.
+
+        Custo: O(1) por aresta fora da floresta geradora, que são a maioria em grafos com ciclos.
+        Uma aresta da floresta custa ainda a busca da árvore menor e a procura de uma substituta
+        entre as arestas dos seus nós, proporcionais ao lado menor.
+        """
+        for u, v in arestas:
+            if u not in self.adjacencia or v not in self.adjacencia[u]:
+                continue
+            self.adjacencia[u].discard(v)
+            self.adjacencia[v].discard(u)
+            self._num_arestas -= 1
+            if u == v:
+                self._mudar_grau(u, -2)
+                continue
+            self._mudar_grau(u, -1)
+            self._mudar_grau(v, -1)
+            if v not in self._floresta[u]:
+                continue
+
+            self._floresta[u].discard(v)
+            self._floresta[v].discard(u)
+            separados = self._arvore_menor(u, v)
+            substituta = self._substituta(separados)
+            if substituta is not None:
+                x, w = substituta
+                self._floresta[x].add(w)
+                self._floresta[w].add(x)
+                continue
+            restantes = self._membros[self._componente[u]]
+            self._mudar_tamanho(len(restantes), len(restantes) - len(separados))
+            restantes -= separados
+            self._nova_componente(separados)
+
+    def aplicar(self, inseridas=(), removidas=()):
+        """
+        Aplica um lote de alterações: primeiro as remoções, depois as inserções.
+
+        Args:
+            inseridas (iterable): Arestas a inserir (pares de nós ou array (k, 2)).
+            removidas (iterable): Arestas a remover.
+
+        Returns:
+            GrafoDinamico: O próprio grafo, para encadear consultas.
+        """
+        self.remover_arestas(removidas.tolist() if isinstance(removidas, np.ndarray) else removidas)
+        self.inserir_arestas(inseridas.tolist() if isinstance(inseridas, np.ndarray) else inseridas)
+        return self
+
+    # ------------------------------------------------------------------ consultas
+
+    def __len__(self):
+        return len(self.adjacencia)
+
+    def __contains__(self, no):
+        return no in self.adjacencia
+
+    @property
+    def num_nos(self):
+        return len(self.adjacencia)
+
+    @property
+    def num_arestas(self):
+        return self._num_arestas
+
+    @property
+    def num_componentes(self):
+        return len(self._membros)
+
+    def conectado(self):
+        return len(self._membros) == 1
+
+    def tamanho_maior_componente(self):
+        """Tamanho da maior componente (0 se o grafo é vazio)."""
+        return max(self._tamanhos, default=0)
+
+    def maior_componente(self):
+        """Conjunto de nós da maior componente."""
+        if not self._membros:
+            return set()
+        return set(max(self._membros.values(), key=len))
+
+    def componentes(self):
+        """Lista das componentes, cada uma como conjunto de nós."""
+        return [set(membros) for membros in self._membros.values()]
+
+    def densidade(self):
+        """Densidade do grafo não direcionado, igual a `nx.density`."""
+        n = self.num_nos
+        return 0.0 if n <= 1 else 2 * self._num_arestas / (n * (n - 1))
+
+    def histograma_graus(self):
+        """Grau -> número de nós com esse grau, ordenado por grau."""
+        return dict(sorted(self._histograma.items()))
+
+    def grau(self):
+        """Grau de todos os nós, como array."""
+        return np.fromiter(self._grau.values(), dtype=np.int64, count=len(self._grau))
@@ -0,0 +1,302 @@
+import numpy as np
+import networkx as nx
+
+from leitura import ler_arestas
+from grafo_csr import GrafoCSR, rotulos_dos_nos
+from componentes import componentes_do_grafo
+from distancias import diametro_e_raio
+from instrumentacao import instrumentar
+
+
+class GrafoDirecionadoCSR:
+    """
+    Grafo direcionado com as arestas de saída em CSR e as de entrada em CSC.
+
+    As duas listas saem do mesmo array de arestas, lido uma única vez, e compartilham os
+    rótulos: `saida` e `entrada` são `GrafoCSR` sobre os mesmos nós densos 0..n-1, com os
+    sucessores de i em `saida.vizinhos(i)` e os predecessores em `entrada.vizinhos(i)`. Elas
+    servem às buscas (BFS para frente e para trás); a versão não direcionada, para as análises
+    de `GrafoCSR`, é montada sob demanda a partir das mesmas arestas, sem reler o arquivo.
+
+    Atributos:
+        saida (GrafoCSR): Arestas de saída (CSR); `saida.indices` são os destinos.
+        entrada (GrafoCSR): Arestas de entrada (CSC); `entrada.indices` são as origens.
+        rotulos (numpy.ndarray): Identificador original de cada nó denso.
+    """
+
+    def __init__(self, saida, entrada):
+        self.saida = saida
+        self.entrada = entrada
+        self.rotulos = saida.rotulos
+        self._nao_direcionado = None
+        self._fortes = None
+        self._fracas = None
+
+    # ------------------------------------------------------------------ construção
+
+    @classmethod
+    def de_arestas(cls, arestas):
+        """
+        Constrói o grafo a partir de um array (m, 2) de arestas (origem, destino).
+
+        Arestas repetidas no mesmo sentido são unificadas, como em `nx.DiGraph`; u -> v e
+        v -> u são arestas diferentes.
+        """
+        arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+        rotulos, densos = np.unique(arestas, return_inverse=True)
+        densos = densos.reshape(-1, 2)
+        return cls._de_pares(densos[:, 0], densos[:, 1], rotulos)
+
+    @classmethod
+    def de_networkx(cls, grafo):
+        """Constrói o grafo compacto a partir de um `nx.DiGraph`, preservando a ordem dos nós."""
+        nos = list(grafo.nodes)
+        indice = {no: i for i, no in enumerate(nos)}
+        pares = np.fromiter(
+            (indice[no] for aresta in grafo.edges for no in aresta),
+            dtype=np.int64, count=2 * grafo.number_of_edges()
+        ).reshape(-1, 2)
+        return cls._de_pares(pares[:, 0], pares[:, 1], rotulos_dos_nos(nos))
+
+    @classmethod
+    def _de_pares(cls, origem, destino, rotulos):
+        n = max(len(rotulos), 1)
+        chaves = np.unique(origem * n + destino)  # Ordenadas por origem: já é o CSR de saída
+        origem, destino = chaves // n, chaves % n
+        return cls(_comprimir(origem, destino, rotulos), _comprimir(*_ordenar_por(destino, origem), rotulos))
+
+    def para_networkx(self):
+        """Converte o grafo compacto para um `nx.DiGraph` com os identificadores originais."""
+        grafo = nx.DiGraph()
+        grafo.add_nodes_from(self.rotulos.tolist())
+        origem = np.repeat(np.arange(self.num_nos), np.diff(self.saida.indptr))
+        grafo.add_edges_from(zip(self.rotulos[origem].tolist(), self.rotulos[self.saida.indices].tolist()))
+        return grafo
+
+    def nao_direcionado(self):
+        """Versão não direcionada (`GrafoCSR`), montada uma vez a partir das mesmas arestas."""
+        if self._nao_direcionado is None:
+            origem = np.repeat(np.arange(self.num_nos), np.diff(self.saida.indptr))
+            self._nao_direcionado = GrafoCSR._de_pares(origem, self.saida.indices.astype(np.int64), self.rotulos)
+        return self._nao_direcionado
+
+    # ------------------------------------------------------------------ consultas básicas
+
+    @property
+    def num_nos(self):
+        return self.saida.num_nos
+
+    @property
+    def num_arestas(self):
+        return len(self.saida.indices)
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelos arrays das duas direções, em bytes (rótulos contados uma vez)."""
+        return self.saida.nbytes + self.entrada.indptr.nbytes + self.entrada.indices.nbytes
+
+    def __len__(self):
+        return self.num_nos
+
+    def __contains__(self, no):
+        return no in self.nao_direcionado()
+
+    def indice(self, no):
+        """Índice denso de um nó a partir do seu identificador original (KeyError se não existe)."""
+        return self.nao_direcionado().indice(no)
+
+    def rotulo(self, i):
+        return self.saida.rotulo(i)
+
+    def grau_saida(self):
+        """Número de sucessores de cada nó denso."""
+        return np.diff(self.saida.indptr).astype(np.int64)
+
+    def grau_entrada(self):
+        """Número de predecessores de cada nó denso."""
+        return np.diff(self.entrada.indptr).astype(np.int64)
+
+    # ------------------------------------------------------------------ alcançabilidade
+
+    def componentes_fortes(self):
+        """
+        Componentes fortemente conexas pelo algoritmo de Tarjan, iterativo (pilha explícita
+        de chamadas, sem recursão) sobre os arrays do CSR de saída.
+
+        Returns:
+            dict: Mesmas chaves de `componentes_do_grafo` ("nos", "componente", "tamanhos",
+            "num_componentes", "maior_componente", "conectado"); as componentes saem
+            numeradas em ordem topológica reversa (componentes sem saída primeiro).
+        """
+        if self._fortes is None:
+            self._fortes = _tarjan(self.saida.indptr.tolist(), self.saida.indices.tolist())
+        componente = self._fortes
+        tamanhos = np.bincount(componente) if len(componente) else np.zeros(0, dtype=np.int64)
+        maior = np.flatnonzero(componente == np.argmax(tamanhos)) if len(tamanhos) else componente
+        return {
+            "nos": self.rotulos,
+            "componente": componente,
+            "tamanhos": tamanhos,
+            "num_componentes": len(tamanhos),
+            "maior_componente": self.rotulos[maior],
+            "conectado": len(tamanhos) == 1,
+        }
+
+    def componentes_fracas(self):
+        """Componentes fracamente conexas (as da versão não direcionada); ver `componentes_do_grafo`."""
+        if self._fracas is None:
+            self._fracas = componentes_do_grafo(self.nao_direcionado())
+        return self._fracas
+
+    def alcancaveis(self, no, reverso=False):
+        """
+        Nós alcançáveis a partir de `no` (ou, com `reverso`, os que alcançam `no`), incluindo ele.
+
+        Returns:
+            numpy.ndarray: Identificadores originais dos nós.
+        """
+        busca = self.entrada if reverso else self.saida
+        return self.rotulos[busca.bfs(self.indice(no)) >= 0]
+
+    def alcanca(self, origem, destino):
+        """
+        Indica se existe caminho direcionado de `origem` para `destino`.
+
+        Nós da mesma componente forte se alcançam e nós de componentes fracas diferentes não;
+        só os demais casos precisam de uma busca.
+        """
+        u, v = self.indice(origem), self.indice(destino)
+        fortes = self.componentes_fortes()["componente"]
+        if fortes[u] == fortes[v]:
+            return True
+        fracas = self.componentes_fracas()["componente"]
+        if fracas[u] != fracas[v]:
+            return False
+        return bool(self.saida.bfs(u)[v] >= 0)
+
+    def excentricidade(self, no):
+        """
+        Excentricidade de saída: a maior distância de `no` a um nó alcançável a partir dele.
+
+        Returns:
+            dict: "excentricidade", "mais_distante" e "alcancados" (número de nós alcançados,
+            incluindo o próprio nó).
+        """
+        distancia = self.saida.bfs(self.indice(no))
+        mais_distante = int(np.argmax(distancia))
+        return {
+            "excentricidade": int(distancia[mais_distante]),
+            "mais_distante": self.rotulo(mais_distante),
+            "alcancados": int(np.count_nonzero(distancia >= 0)),
+        }
+
+    def diametro(self):
+        """
+        Diâmetro e raio direcionados da maior componente fortemente conexa (fora de uma
+        componente forte há pares sem caminho e o diâmetro é infinito); ver `diametro_e_raio`.
+
+        Returns:
+            dict: "nos" (da componente), "diametro", "raio", "extremos", "centro" (identificadores
+            originais) e "bfs" (buscas para frente e para trás executadas).
+        """
+        if self.num_nos == 0:
+            return {"nos": self.rotulos, "diametro": 0, "raio": 0, "extremos": None, "centro": None, "bfs": 0}
+        componente = self.componentes_fortes()["componente"]
+        maior = np.flatnonzero(componente == np.argmax(np.bincount(componente)))
+        resultado = diametro_e_raio(self.saida, maior, entrada=self.entrada)
+        resultado["nos"] = self.rotulos[maior]
+        resultado["extremos"] = tuple(self.rotulo(i) for i in resultado["extremos"])
+        resultado["centro"] = self.rotulo(resultado["centro"])
+        return resultado
+
+
+def _ordenar_por(chave, valor):
+    ordem = np.argsort(chave, kind="stable")
+    return chave[ordem], valor[ordem]
+
+
+def _comprimir(origem, destino, rotulos):
+    """`GrafoCSR` a partir de pares já ordenados por origem."""
+    n = len(rotulos)
+    tipo = np.int32 if max(n, len(destino)) < np.iinfo(np.int32).max else np.int64
+    indptr = np.zeros(n + 1, dtype=tipo)
+    np.cumsum(np.bincount(origem, minlength=n), out=indptr[1:])
+    return GrafoCSR(indptr, destino.astype(tipo), rotulos)
+
+
+def _tarjan(indptr, indices):
+    """
+    Tarjan iterativo: cada quadro da pilha de chamadas guarda o nó e a posição da próxima
+    aresta a examinar, de modo que a busca é retomada exatamente onde a "chamada" parou.
+
+    Returns:
+        numpy.ndarray: Rótulo da componente forte de cada nó.
+    """
+    n = len(indptr) - 1
+    ordem = [-1] * n  # Ordem de descoberta
+    baixo = [0] * n  # Menor ordem alcançável pela subárvore (low-link)
+    na_pilha = [False] * n
+    componente = [-1] * n
+    pilha = []
+    contador = 0
+    num_componentes = 0
+
+    for raiz in range(n):
+        if ordem[raiz] >= 0:
+            continue
+        ordem[raiz] = baixo[raiz] = contador
+        contador += 1
+        pilha.append(raiz)
+        na_pilha[raiz] = True
+        chamadas = [(raiz, indptr[raiz])]
+
+        while chamadas:
+            v, posicao = chamadas[-1]
+            fim = indptr[v + 1]
+            while posicao < fim:
+                w = indices[posicao]
+                posicao += 1
+                if ordem[w] < 0:
+                    # "Chamada recursiva": guarda onde parar e desce para w
+                    chamadas[-1] = (v, posicao)
+                    ordem[w] = baixo[w] = contador
+                    contador += 1
+                    pilha.append(w)
+                    na_pilha[w] = True
+                    chamadas.append((w, indptr[w]))
+                    break
+                if na_pilha[w] and ordem[w] < baixo[v]:
+                    baixo[v] = ordem[w]
+            else:
+                # Todas as arestas de v examinadas: "retorno" da chamada
+                chamadas.pop()
+                if baixo[v] == ordem[v]:
+                    while True:
+                        w = pilha.pop()
+                        na_pilha[w] = False
+                        componente[w] = num_componentes
+                        if w == v:
+                            break
+                    num_componentes += 1
+                if chamadas:
+                    pai = chamadas[-1][0]
+                    if baixo[v] < baixo[pai]:
+                        baixo[pai] = baixo[v]
+
+    return np.array(componente, dtype=np.int64)
+
+
+@instrumentar("leitura")
+def ler_grafo_direcionado_csr(caminho_arquivo, max_arestas=None):
+    """
+    Lê um arquivo de arestas SNAP para um `GrafoDirecionadoCSR`, preservando o sentido de cada
+    aresta (FromNodeId -> ToNodeId).
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo de texto.
+        max_arestas (int, opcional): Limite de arestas a ler. None lê o arquivo inteiro.
+
+    Returns:
+        GrafoDirecionadoCSR: O grafo direcionado em formato compacto.
+    """
+    return GrafoDirecionadoCSR.de_arestas(ler_arestas(caminho_arquivo, max_arestas=max_arestas))
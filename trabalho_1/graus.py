@@ -0,0 +1,284 @@
+import time
+
+import numpy as np
+import networkx as nx
+
+from leitura import iterar_blocos_arestas, relatar_vazao
+from grafo_csr import GrafoCSR
+from grafo_dinamico import GrafoDinamico
+
+
+MIN_CAUDA = 10  # Menor número de pontos na cauda para ajustar a lei de potência
+MAX_ID_DENSO = 2 ** 26  # Acima desse identificador, os graus de arquivo são somados só para os nós vistos
+_PAR = np.dtype([("menor", np.int64), ("maior", np.int64)])  # Aresta não direcionada como chave ordenável
+
+
+def _acumular_bincount(contagem, ids):
+    """Soma `np.bincount(ids)` a `contagem`, aumentando o array se aparecer um id maior."""
+    parcial = np.bincount(ids)
+    if len(parcial) > len(contagem):
+        contagem = np.concatenate([contagem, np.zeros(len(parcial) - len(contagem), dtype=np.int64)])
+    contagem[:len(parcial)] += parcial
+    return contagem
+
+
+def _acumular_esparso(nos, contagem, ids):
+    """
+    Soma as ocorrências de `ids` às contagens de `nos` (ordenados), guardando só os nós que
+    apareceram: a memória depende do número de nós, não do maior identificador.
+    """
+    novos, quantas = np.unique(ids, return_counts=True)
+    nos, inverso = np.unique(np.concatenate([nos, novos]), return_inverse=True)
+    contagem = np.bincount(inverso, weights=np.concatenate([contagem, quantas]), minlength=len(nos))
+    return nos, contagem.astype(np.int64)
+
+
+def graus_de_arestas(arestas, unicas=True):
+    """
+    Calcula os graus diretamente de um array de arestas, sem montar um grafo.
+
+    Args:
+        arestas (numpy.ndarray): Array (m, 2) de identificadores inteiros não negativos.
+        unicas (bool): Se True, arestas repetidas (inclusive nos dois sentidos) contam uma vez,
+            como em `nx.Graph`. Use False quando o arquivo já lista cada par uma única vez.
+
+    Returns:
+        numpy.ndarray: Grau de cada nó presente nas arestas (laços contam duas vezes).
+    """
+    arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+    if unicas and len(arestas):
+        arestas = np.unique(np.sort(arestas, axis=1), axis=0)
+    contagem = np.bincount(arestas.ravel()) if len(arestas) else np.zeros(0, dtype=np.int64)
+    return contagem[contagem > 0]
+
+
+def _arestas_novas(chaves, bloco):
+    """
+    Separa as arestas de um bloco que ainda não apareceram.
+
+    Cada aresta vira um registro (menor, maior) de 16 bytes, então u-v e v-u coincidem;
+    `chaves` é o array ordenado das já vistas (None antes do primeiro bloco).
+
+    Returns:
+        tuple: (chaves atualizadas, array (k, 2) das arestas novas).
+    """
+    if chaves is None:
+        chaves = np.zeros(0, dtype=_PAR)
+    bloco = np.ascontiguousarray(np.sort(np.asarray(bloco, dtype=np.int64).reshape(-1, 2), axis=1))
+    novas = np.unique(bloco.view(_PAR).ravel())
+    posicao = np.searchsorted(chaves, novas)
+    vistas = posicao < len(chaves)
+    vistas[vistas] = chaves[posicao[vistas]] == novas[vistas]
+    novas = novas[~vistas]
+    # Duas sequências já ordenadas: a ordenação estável (por intercalação) as junta em tempo linear
+    chaves = np.sort(np.concatenate([chaves, novas]), kind="stable")
+    return chaves, novas.view(np.int64).reshape(-1, 2)
+
+
+def graus_de_arquivo(caminho_arquivo, max_arestas=None, unicas=False):
+    """
+    Calcula os graus de um arquivo de arestas lido em blocos, sem montar um grafo.
+
+    Por padrão cada linha conta como uma aresta: a memória usada é proporcional ao maior
+    identificador de nó (ou, acima de `MAX_ID_DENSO`, ao número de nós), não ao número de
+    arestas, o que permite processar arquivos maiores que a memória. Os arquivos SNAP listam cada aresta uma vez; um arquivo direcionado com
+    u -> v e v -> u conta as duas.
+
+    Com `unicas=True`, arestas repetidas (inclusive nos dois sentidos) contam uma vez, como em
+    `nx.Graph` e em `graus_de_arestas`. Para isso todas as arestas distintas já vistas ficam
+    na memória (16 bytes cada): o custo é O(E), como o de montar o grafo, e não serve para
+    arquivos maiores que a memória.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo de texto.
+        max_arestas (int, opcional): Limite de arestas a ler. None lê o arquivo inteiro.
+        unicas (bool): Se True, ignora arestas repetidas, guardando as já vistas (memória O(E)).
+
+    Returns:
+        numpy.ndarray: Grau de cada nó presente no arquivo (laços contam duas vezes).
+    """
+    contagem = np.zeros(0, dtype=np.int64)
+    nos = None  # Nós vistos, quando os identificadores passam de MAX_ID_DENSO
+    chaves = None
+    total = 0
+    inicio = time.perf_counter()
+    for bloco in iterar_blocos_arestas(caminho_arquivo, max_arestas=max_arestas):
+        total += len(bloco)
+        if unicas:
+            chaves, bloco = _arestas_novas(chaves, bloco)
+        if not len(bloco):
+            continue
+        if nos is None and bloco.max() >= MAX_ID_DENSO:
+            nos = np.flatnonzero(contagem)
+            contagem = contagem[nos]
+        if nos is None:
+            contagem = _acumular_bincount(contagem, bloco.ravel())
+        else:
+            nos, contagem = _acumular_esparso(nos, contagem, bloco.ravel())
+    relatar_vazao(caminho_arquivo, total, time.perf_counter() - inicio)
+    return contagem[contagem > 0]
+
+
+def graus_do_grafo(grafo):
+    """
+    Graus de todos os nós de um `nx.Graph`, `GrafoCSR`, `GrafoDinamico`, array de arestas ou
+    arquivo de arestas (lido em fluxo, uma aresta por linha; ver `graus_de_arquivo`).
+
+    Returns:
+        numpy.ndarray: Grau de cada nó.
+    """
+    if isinstance(grafo, (GrafoCSR, GrafoDinamico)):
+        return grafo.grau()
+    if isinstance(grafo, nx.Graph):
+        return np.fromiter((grau for _, grau in grafo.degree()), dtype=np.int64, count=len(grafo))
+    if isinstance(grafo, str):
+        return graus_de_arquivo(grafo)
+    return graus_de_arestas(grafo)
+
+
+def distribuicao_graus(graus):
+    """
+    Calcula a PDF e a CCDF da distribuição de graus de forma vetorizada.
+
+    Args:
+        graus (numpy.ndarray): Grau de cada nó.
+
+    Returns:
+        dict: "graus" (valores distintos, em ordem crescente), "pdf" (fração de nós com cada
+        grau) e "ccdf" (fração de nós com grau maior ou igual), como arrays alinhados.
+    """
+    graus = np.asarray(graus, dtype=np.int64)
+    contagem = np.bincount(graus) if graus.size else np.zeros(0, dtype=np.int64)
+    valores = np.flatnonzero(contagem)
+    return _distribuicao(valores, contagem[valores])
+
+
+def distribuicao_de_histograma(histograma):
+    """
+    PDF e CCDF a partir de um histograma grau -> número de nós (ver `distribuicao_graus`).
+
+    O custo é proporcional ao número de graus distintos, não ao número de nós.
+    """
+    valores = np.fromiter(sorted(histograma), dtype=np.int64, count=len(histograma))
+    return _distribuicao(valores, np.array([histograma[v] for v in valores.tolist()], dtype=np.int64))
+
+
+def _distribuicao(valores, contagem):
+    pdf = contagem / max(int(contagem.sum()), 1)
+    ccdf = np.cumsum(pdf[::-1])[::-1]
+    return {"graus": valores, "pdf": pdf, "ccdf": ccdf}
+
+
+def pdf_log_binada(graus, bins_por_decada=10):
+    """
+    PDF com intervalos de largura logarítmica, que reduz o ruído da cauda em escala log-log.
+
+    Nós de grau 0 são ignorados. A densidade de cada intervalo é a fração de nós nele dividida
+    pela largura do intervalo.
+
+    Args:
+        graus (numpy.ndarray): Grau de cada nó.
+        bins_por_decada (int): Número de intervalos por potência de 10.
+
+    Returns:
+        dict: "centros" (média geométrica das bordas de cada intervalo não vazio) e "densidade".
+    """
+    graus = np.asarray(graus, dtype=np.int64)
+    positivos = graus[graus > 0]
+    if positivos.size == 0:
+        return {"centros": np.zeros(0), "densidade": np.zeros(0)}
+    decadas = np.log10(positivos.max() + 1)
+    bordas = np.unique(np.floor(np.logspace(0, decadas, max(2, int(np.ceil(decadas * bins_por_decada)) + 1))))
+    bordas = np.append(bordas[bordas <= positivos.max()], positivos.max() + 1)
+    contagem, _ = np.histogram(positivos, bins=bordas)
+    larguras = np.diff(bordas)
+    nao_vazios = contagem > 0
+    centros = np.sqrt(bordas[:-1] * (bordas[1:] - 1))
+    return {"centros": centros[nao_vazios], "densidade": (contagem / (graus.size * larguras))[nao_vazios]}
+
+
+def _alpha_e_ks(valores, contagem, xmin):
+    """
+    Expoente por máxima verossimilhança (aproximação discreta de Clauset, Shalizi e Newman) e
+    distância de Kolmogorov–Smirnov entre a cauda x >= xmin e a lei de potência ajustada.
+    """
+    cauda = valores >= xmin
+    x, c = valores[cauda], contagem[cauda]
+    n = c.sum()
+    alpha = 1 + n / np.sum(c * np.log(x / (xmin - 0.5)))
+    empirica = np.cumsum(c[::-1])[::-1] / n  # P(X >= x) na amostra
+    modelo = ((x - 0.5) / (xmin - 0.5)) ** (1 - alpha)
+    return alpha, float(np.max(np.abs(empirica - modelo))), int(n)
+
+
+def ajustar_lei_potencia(graus, xmin=None, min_cauda=MIN_CAUDA):
+    """
+    Ajusta uma lei de potência P(k) ~ k^-alpha à cauda da distribuição de graus.
+
+    O expoente é estimado por máxima verossimilhança. Sem `xmin`, todos os graus distintos com
+    pelo menos `min_cauda` nós na cauda são testados, e é escolhido o que minimiza a distância
+    de Kolmogorov–Smirnov entre a cauda e o modelo ajustado.
+
+    Args:
+        graus (numpy.ndarray): Grau de cada nó.
+        xmin (int, opcional): Início da cauda. Padrão: escolhido pela distância KS.
+        min_cauda (int): Menor número de nós na cauda.
+
+    Returns:
+        dict | None: "alpha", "erro" (desvio padrão assintótico de alpha), "xmin", "ks" e
+        "n_cauda", ou None se não houver pontos suficientes.
+    """
+    graus = np.asarray(graus, dtype=np.int64)
+    contagem_total = np.bincount(graus[graus > 0]) if np.any(graus > 0) else np.zeros(0, dtype=np.int64)
+    valores = np.flatnonzero(contagem_total)
+    contagem = contagem_total[valores]
+    na_cauda = np.cumsum(contagem[::-1])[::-1]  # Nós com grau >= cada valor
+
+    if xmin is None:
+        candidatos = valores[(na_cauda >= min_cauda) & (valores > 1)]
+    else:
+        candidatos = valores[(valores == xmin) & (na_cauda >= min_cauda)]
+    if candidatos.size == 0:
+        return None
+
+    melhor = None
+    for candidato in candidatos:
+        alpha, ks, n = _alpha_e_ks(valores, contagem, candidato)
+        if melhor is None or ks < melhor["ks"]:
+            melhor = {"alpha": float(alpha), "erro": float((alpha - 1) / np.sqrt(n)),
+                      "xmin": int(candidato), "ks": ks, "n_cauda": n}
+    return melhor
+
+
+def perfil_graus(graus, bins_por_decada=10):
+    """
+    Reúne a distribuição, a PDF log-binada, o ajuste de lei de potência e estatísticas básicas.
+
+    Returns:
+        dict: "nos", "grau_medio", "grau_maximo", "distribuicao" (ver `distribuicao_graus`),
+        "log_binada" (ver `pdf_log_binada`) e "lei_potencia" (ver `ajustar_lei_potencia`).
+    """
+    graus = np.asarray(graus, dtype=np.int64)
+    return {
+        "nos": int(graus.size),
+        "grau_medio": float(graus.mean()) if graus.size else 0.0,
+        "grau_maximo": int(graus.max()) if graus.size else 0,
+        "distribuicao": distribuicao_graus(graus),
+        "log_binada": pdf_log_binada(graus, bins_por_decada),
+        "lei_potencia": ajustar_lei_potencia(graus),
+    }
+
+
+def comparar_distribuicoes(grafos, bins_por_decada=10):
+    """
+    Calcula o perfil de graus de vários grafos em uma única chamada.
+
+    Args:
+        grafos (dict): Nome -> `nx.Graph`, `GrafoCSR`, array de arestas ou caminho de um arquivo
+            de arestas (lido em blocos, sem montar o grafo).
+        bins_por_decada (int): Intervalos por década da PDF log-binada.
+
+    Returns:
+        dict: Nome -> perfil (ver `perfil_graus`).
+    """
+    return {nome: perfil_graus(graus_do_grafo(grafo), bins_por_decada) for nome, grafo in grafos.items()}
@@ -0,0 +1,199 @@
+import time
+
+import networkx as nx
+
+
+def _bits(mascara):
+    """Itera sobre os índices dos bits ligados de um inteiro."""
+    while mascara:
+        bit = mascara & -mascara
+        yield bit.bit_length() - 1
+        mascara ^= bit
+
+
+def _held_karp(adjacencia, n):
+    """
+    Programação dinâmica de Held–Karp sobre máscaras de bits.
+
+    `alcancaveis[mascara]` é a máscara dos vértices v tais que existe um caminho que começa no
+    vértice 0, visita exatamente os vértices de `mascara` e termina em v.
+
+    Returns:
+        list | None: O ciclo (índices densos) ou None se não existir.
+    """
+    todos = (1 << n) - 1
+    alcancaveis = [0] * (1 << n)
+    alcancaveis[1] = 1
+    for mascara in range(1, 1 << n, 2):  # Apenas máscaras que contêm o vértice 0
+        for v in _bits(alcancaveis[mascara]):
+            for w in _bits(adjacencia[v] & ~mascara):
+                alcancaveis[mascara | (1 << w)] |= 1 << w
+
+    finais = alcancaveis[todos] & adjacencia[0]
+    if not finais:
+        return None
+
+    # Reconstrói o caminho de trás para frente
+    v = next(_bits(finais))
+    mascara = todos
+    ciclo = [v]
+    while mascara != 1:
+        mascara ^= 1 << v
+        v = next(_bits(alcancaveis[mascara] & adjacencia[v]))
+        ciclo.append(v)
+    return ciclo[::-1]
+
+
+def _livres(adjacencia, w, disponiveis):
+    """Quantas arestas o vértice `w` ainda pode usar no ciclo."""
+    return (adjacencia[w] & disponiveis).bit_count()
+
+
+def _candidatos(adjacencia, anterior, atual, inicio, nao_visitados, tamanho_caminho):
+    """
+    Próximos vértices possíveis a partir de `atual`, ou lista vazia se o ramo é inviável.
+
+    Todo vértice não visitado precisa de duas arestas livres (para vértices não visitados ou para
+    as pontas do caminho, `atual` e `inicio`). Só os vizinhos de `anterior` e de `atual` perdem
+    arestas livres a cada passo, então só eles são verificados. Um vizinho de `atual` com apenas
+    duas arestas livres obriga o próximo passo a ir até ele.
+    """
+    disponiveis = nao_visitados | (1 << atual) | (1 << inicio)
+    for w in _bits(adjacencia[anterior] & nao_visitados):
+        if _livres(adjacencia, w, disponiveis) < 2:
+            return []
+
+    restantes = nao_visitados.bit_count()
+    if tamanho_caminho > 1 and not adjacencia[inicio] & nao_visitados:
+        return []  # O início não teria por onde fechar o ciclo
+    forcado = None
+    opcoes = []
+    for w in _bits(adjacencia[atual] & nao_visitados):
+        livres = _livres(adjacencia, w, disponiveis)
+        if livres < 2:
+            return []
+        if livres == 2 and tamanho_caminho > 1:
+            if restantes > 1 and adjacencia[w] >> inicio & 1 and inicio != atual:
+                return []  # w teria de ligar as duas pontas antes do fim
+            if forcado is not None:
+                return []  # Dois vizinhos exigem o próximo passo
+            forcado = w
+        opcoes.append((livres, w))
+
+    if forcado is not None:
+        return [forcado]
+    # Heurística de Warnsdorff: primeiro o vizinho com menos saídas
+    return [w for _, w in sorted(opcoes)]
+
+
+def _conexo(adjacencia, atual, nao_visitados):
+    """Verifica se os vértices não visitados continuam alcançáveis a partir de `atual`."""
+    permitidos = nao_visitados | (1 << atual)
+    alcance = fronteira = 1 << atual
+    while fronteira:
+        novos = 0
+        for v in _bits(fronteira):
+            novos |= adjacencia[v]
+        fronteira = novos & permitidos & ~alcance
+        alcance |= fronteira
+    return alcance == permitidos
+
+
+def _busca_profundidade(adjacencia, n, inicio, limite_nos, prazo, intervalo_conexidade):
+    """
+    Busca em profundidade iterativa (pilha explícita) com conjuntos de visitados em bits.
+
+    Returns:
+        tuple: (ciclo ou None, True se a busca terminou sem esgotar o orçamento).
+    """
+    todos = (1 << n) - 1
+    caminho = [inicio]
+    visitados = 1 << inicio
+    pilha = [iter(_candidatos(adjacencia, inicio, inicio, inicio, todos ^ visitados, 1))]
+    expandidos = 0
+
+    while pilha:
+        proximo = next(pilha[-1], None)
+        if proximo is None:
+            pilha.pop()
+            visitados ^= 1 << caminho.pop()
+            continue
+
+        expandidos += 1
+        if expandidos > limite_nos or (prazo is not None and expandidos % 1024 == 0 and time.perf_counter() > prazo):
+            return None, False
+
+        visitados |= 1 << proximo
+        caminho.append(proximo)
+        if visitados == todos:
+            if adjacencia[proximo] >> inicio & 1:
+                return caminho, True
+            visitados ^= 1 << caminho.pop()
+            continue
+
+        nao_visitados = todos ^ visitados
+        opcoes = _candidatos(adjacencia, caminho[-2], proximo, inicio, nao_visitados, len(caminho))
+        if opcoes and len(caminho) % intervalo_conexidade == 0 and not _conexo(adjacencia, proximo, nao_visitados):
+            opcoes = []
+        pilha.append(iter(opcoes))
+
+    return None, True
+
+
+def ciclo_hamiltoniano(grafo, max_nos_dp=16, limite_nos=2_000_000, tempo_limite=None, intervalo_conexidade=8):
+    """
+    Procura um ciclo Hamiltoniano com podas e orçamento de busca.
+
+    Antes de buscar, descarta grafos que não podem ter ciclo Hamiltoniano: menos de 3 vértices,
+    desconexos, com vértice de grau menor que 2, com articulação (ou ponte), com um vértice
+    vizinho de três ou mais vértices de grau 2 ou bipartidos com lados desiguais. Grafos com até `max_nos_dp` vértices são
+    resolvidos de forma exata por Held–Karp com máscaras de bits. Os demais usam busca em
+    profundidade a partir de um único vértice fixo (todo ciclo passa por ele), com visitados em
+    máscara de bits, poda por grau livre, movimentos forçados e verificação periódica de
+    conexidade do que falta visitar. Ao esgotar o orçamento, o resultado é "desconhecido".
+
+    Args:
+        grafo (networkx.Graph): O grafo a ser analisado.
+        max_nos_dp (int): Maior número de vértices resolvido por Held–Karp.
+        limite_nos (int): Máximo de nós da árvore de busca expandidos.
+        tempo_limite (float, opcional): Orçamento de tempo da busca, em segundos.
+        intervalo_conexidade (int): A cada quantos passos verificar a conexidade do restante.
+
+    Returns:
+        tuple: (estado, ciclo), em que estado é "sim", "nao" ou "desconhecido" e ciclo é a lista
+        de vértices do ciclo encontrado (sem repetir o inicial) ou None.
+    """
+    prazo = None if tempo_limite is None else time.perf_counter() + tempo_limite
+    grafo = nx.Graph(grafo)
+    grafo.remove_edges_from(list(nx.selfloop_edges(grafo)))
+    n = grafo.number_of_nodes()
+
+    if n < 3 or not nx.is_connected(grafo) or min(d for _, d in grafo.degree()) < 2:
+        return "nao", None
+    if any(True for _ in nx.articulation_points(grafo)):
+        return "nao", None
+    if any(sum(1 for w in grafo[v] if grafo.degree(w) == 2) > 2 for v in grafo):
+        return "nao", None  # Cada vértice de grau 2 força as suas duas arestas
+    if nx.is_bipartite(grafo):
+        lado, _ = nx.bipartite.sets(grafo)
+        if 2 * len(lado) != n:
+            return "nao", None  # Em grafo bipartido o ciclo alterna os lados
+
+    # Vértice de menor grau como início fixo: ramifica menos na raiz
+    nos = sorted(grafo.nodes, key=grafo.degree)
+    indice = {no: i for i, no in enumerate(nos)}
+    adjacencia = [0] * n
+    for u, v in grafo.edges:
+        adjacencia[indice[u]] |= 1 << indice[v]
+        adjacencia[indice[v]] |= 1 << indice[u]
+
+    if n <= max_nos_dp:
+        ciclo = _held_karp(adjacencia, n)
+    else:
+        ciclo, completa = _busca_profundidade(adjacencia, n, 0, limite_nos, prazo, intervalo_conexidade)
+        if ciclo is None and not completa:
+            return "desconhecido", None
+
+    if ciclo is None:
+        return "nao", None
+    return "sim", [nos[i] for i in ciclo]
@@ -0,0 +1,354 @@
+import atexit
+import contextlib
+import cProfile
+import functools
+import inspect
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+
+# Instrumentação das etapas de uma execução (leitura, cálculo, layout, desenho): tempo, número
+# de chamadas, tamanho do grafo e, opcionalmente, pico de memória (tracemalloc) e perfil
+# (cProfile) de uma função escolhida. Desligada, custa uma verificação por chamada.
+#
+# Também pode ser ligada sem mudar o código, pelas variáveis de ambiente:
+#   GRAFOS_INSTRUMENTACAO=1     liga a medição de tempo
+#   GRAFOS_MEMORIA=1            mede também o pico de memória (deixa a execução mais lenta)
+#   GRAFOS_PERFILAR=<nome>      roda o cProfile nas chamadas dessa função (ex.: calcular_diametro)
+#   GRAFOS_TRACE=<arquivo>      ao fim do processo, grava o trace no formato do Chrome
+#   GRAFOS_LOG=<arquivo>        ao fim do processo, grava o log estruturado (uma linha JSON por etapa)
+
+DIRETORIO_PERFIS = os.environ.get("GRAFOS_PERFIS", "perfis")
+LINHAS_PERFIL = 30  # Funções listadas no resumo textual de cada perfil
+
+
+def tamanho_do_grafo(grafo):
+    """
+    Número de nós e de arestas de um `nx.Graph`, `GrafoCSR`, `GrafoDirecionadoCSR` ou
+    `GrafoDinamico`, ou None para qualquer outro objeto.
+    """
+    if hasattr(grafo, "number_of_nodes") and hasattr(grafo, "number_of_edges"):
+        return grafo.number_of_nodes(), grafo.number_of_edges()
+    if hasattr(grafo, "num_nos") and hasattr(grafo, "num_arestas"):
+        return int(grafo.num_nos), int(grafo.num_arestas)
+    return None
+
+
+class Instrumentacao:
+    """
+    Coletor das etapas instrumentadas de um processo.
+
+    Cada etapa vira um evento com nome, categoria, início e duração, thread, tamanho do grafo
+    (quando a etapa recebe um) e tempo próprio (a duração menos a das etapas aninhadas na
+    mesma thread). Com `memoria`, o tracemalloc registra o pico de memória alocada pelo Python
+    (inclusive arrays do NumPy) durante a etapa; como o pico é do processo, etapas simultâneas
+    em threads diferentes compartilham o mesmo pico. Chamadas em processos filhos (pools de
+    processos) não são registradas.
+
+    Atributos:
+        ativa (bool): Se as etapas estão sendo registradas.
+        memoria (bool): Se o pico de memória é medido.
+        perfilar (str | None): Nome da função cujas chamadas rodam sob o cProfile.
+        eventos (list): Eventos registrados, na ordem em que terminaram.
+        perfis (dict): Nome da função -> resumo textual do perfil da última chamada.
+    """
+
+    def __init__(self):
+        self.ativa = False
+        self.memoria = False
+        self.perfilar = None
+        self.diretorio_perfis = DIRETORIO_PERFIS
+        self.eventos = []
+        self.perfis = {}
+        self._inicio = time.perf_counter_ns()
+        self._trava = threading.Lock()
+        self._local = threading.local()
+        self._abertas = []  # Etapas em andamento com medição de memória
+        self._iniciou_tracemalloc = False
+
+    def ativar(self, memoria=False, perfilar=None, diretorio_perfis=None):
+        """
+        Liga o registro das etapas.
+
+        Args:
+            memoria (bool): Se True, mede o pico de memória de cada etapa com o tracemalloc
+                (a execução fica algumas vezes mais lenta).
+            perfilar (str, opcional): Nome de uma função instrumentada a rodar sob o cProfile.
+            diretorio_perfis (str, opcional): Onde gravar os arquivos `.prof`.
+        """
+        self.ativa = True
+        self.memoria = memoria
+        self.perfilar = perfilar
+        self.diretorio_perfis = diretorio_perfis or self.diretorio_perfis
+        if memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._iniciou_tracemalloc = True
+
+    def desativar(self):
+        """Desliga o registro (os eventos já coletados são mantidos)."""
+        self.ativa = False
+        if self._iniciou_tracemalloc:
+            tracemalloc.stop()
+            self._iniciou_tracemalloc = False
+        self.memoria = False
+
+    def limpar(self):
+        """Descarta os eventos e perfis coletados e reinicia o relógio."""
+        with self._trava:
+            self.eventos = []
+            self.perfis = {}
+            self._inicio = time.perf_counter_ns()
+
+    # ------------------------------------------------------------------ registro
+
+    def _pilha(self):
+        pilha = getattr(self._local, "pilha", None)
+        if pilha is None:
+            pilha = self._local.pilha = []
+        return pilha
+
+    def _atualizar_picos(self):
+        """
+        Repassa o pico atual do tracemalloc a todas as etapas abertas e zera o pico, para que
+        cada etapa fique com o maior valor observado enquanto esteve aberta.
+        """
+        _, pico = tracemalloc.get_traced_memory()
+        for aberta in self._abertas:
+            aberta["pico"] = max(aberta["pico"], pico)
+        tracemalloc.reset_peak()
+
+    @contextlib.contextmanager
+    def etapa(self, nome, categoria="calculo", grafo=None, **dados):
+        """
+        Registra um trecho de código como uma etapa.
+
+        Args:
+            nome (str): Nome da etapa.
+            categoria (str): "leitura", "calculo", "layout", "desenho", "questao"...
+            grafo (opcional): Grafo processado; o seu tamanho vai para o evento.
+            **dados: Valores extras (serializáveis em JSON) guardados no evento.
+        """
+        if not self.ativa:
+            yield
+            return
+
+        medir_memoria = self.memoria and tracemalloc.is_tracing()
+        memoria = None
+        if medir_memoria:
+            with self._trava:
+                self._atualizar_picos()
+                atual = tracemalloc.get_traced_memory()[0]
+                memoria = {"inicial": atual, "pico": atual}
+                self._abertas.append(memoria)
+
+        pilha = self._pilha()
+        pilha.append(0)  # Tempo gasto nas etapas filhas
+        inicio = time.perf_counter_ns()
+        erro = None
+        try:
+            yield
+        except BaseException as e:
+            erro = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            duracao = time.perf_counter_ns() - inicio
+            filhas = pilha.pop()
+            if pilha:
+                pilha[-1] += duracao
+
+            evento = {
+                "nome": nome,
+                "categoria": categoria,
+                "inicio_us": (inicio - self._inicio) / 1000,
+                "duracao_us": duracao / 1000,
+                "proprio_us": (duracao - filhas) / 1000,
+                "pid": os.getpid(),
+                "thread": threading.get_ident(),
+                "nome_thread": threading.current_thread().name,
+                "profundidade": len(pilha),
+            }
+            tamanho = tamanho_do_grafo(grafo) if grafo is not None else None
+            if tamanho is not None:
+                evento["nos"], evento["arestas"] = tamanho
+            if dados:
+                evento["dados"] = dados
+            if erro is not None:
+                evento["erro"] = erro
+            with self._trava:
+                if memoria is not None and tracemalloc.is_tracing():
+                    self._atualizar_picos()
+                    self._abertas.remove(memoria)
+                    evento["memoria_pico"] = memoria["pico"]
+                    evento["memoria_extra"] = memoria["pico"] - memoria["inicial"]
+                self.eventos.append(evento)
+
+    def _executar_perfilado(self, nome, funcao, args, kwargs):
+        """Roda a função sob o cProfile, grava `<nome>.prof` e guarda o resumo textual."""
+        self._local.perfilando = True
+        perfil = cProfile.Profile()
+        try:
+            return perfil.runcall(funcao, *args, **kwargs)
+        finally:
+            self._local.perfilando = False
+            os.makedirs(self.diretorio_perfis, exist_ok=True)
+            perfil.dump_stats(os.path.join(self.diretorio_perfis, f"{nome}.prof"))
+            texto = io.StringIO()
+            pstats.Stats(perfil, stream=texto).sort_stats("cumulative").print_stats(LINHAS_PERFIL)
+            self.perfis[nome] = texto.getvalue()
+
+    def _iterar(self, nome, categoria, gerador):
+        """
+        Repassa os itens de um gerador medindo só o tempo gasto dentro dele (a soma das
+        chamadas a `next`), sem o tempo de quem consome os itens. Ao fim da iteração (ou quando
+        o consumidor descarta o gerador) registra a etapa `<nome>:iteracao`, com o número de
+        itens em "dados".
+        """
+        inicio = None
+        dentro = 0
+        itens = 0
+        try:
+            while True:
+                comeco = time.perf_counter_ns()
+                if inicio is None:
+                    inicio = comeco
+                try:
+                    item = next(gerador)
+                except StopIteration:
+                    return
+                finally:
+                    dentro += time.perf_counter_ns() - comeco
+                itens += 1
+                yield item
+        finally:
+            gerador.close()
+            if self.ativa and inicio is not None:
+                with self._trava:
+                    self.eventos.append({
+                        "nome": f"{nome}:iteracao",
+                        "categoria": categoria,
+                        "inicio_us": (inicio - self._inicio) / 1000,
+                        "duracao_us": dentro / 1000,
+                        "proprio_us": dentro / 1000,
+                        "pid": os.getpid(),
+                        "thread": threading.get_ident(),
+                        "nome_thread": threading.current_thread().name,
+                        "profundidade": len(self._pilha()),
+                        "dados": {"itens": itens},
+                    })
+
+    def instrumentar(self, categoria="calculo", nome=None):
+        """
+        Decorador que registra cada chamada da função como uma etapa; o grafo é o primeiro
+        argumento, quando houver. A função escolhida em `perfilar` também roda sob o cProfile
+        (uma chamada por vez; chamadas aninhadas ou simultâneas não são perfiladas).
+
+        Se a função retorna um gerador (como `get_all_paths(streaming=True)`), a etapa da
+        chamada mede só a criação dele, e a iteração vira a etapa `<nome>:iteracao` (ver
+        `_iterar`). O cProfile, nesse caso, também só cobre a criação.
+        """
+        def decorador(funcao):
+            nome_etapa = nome or funcao.__name__
+
+            @functools.wraps(funcao)
+            def envoltorio(*args, **kwargs):
+                if not self.ativa:
+                    return funcao(*args, **kwargs)
+                with self.etapa(nome_etapa, categoria, args[0] if args else None):
+                    if self.perfilar == nome_etapa and not getattr(self._local, "perfilando", False):
+                        resultado = self._executar_perfilado(nome_etapa, funcao, args, kwargs)
+                    else:
+                        resultado = funcao(*args, **kwargs)
+                if inspect.isgenerator(resultado):
+                    return self._iterar(nome_etapa, categoria, resultado)
+                return resultado
+            return envoltorio
+        return decorador
+
+    # ------------------------------------------------------------------ saída
+
+    def resumo(self):
+        """
+        Agrega os eventos por etapa.
+
+        Returns:
+            dict: Nome -> "categoria", "chamadas", "segundos_total", "segundos_proprios"
+            (sem as etapas aninhadas), "segundos_max" e, com memória, "memoria_pico" (bytes),
+            ordenado pelo tempo próprio.
+        """
+        agregado = {}
+        for evento in list(self.eventos):
+            item = agregado.setdefault(evento["nome"], {
+                "categoria": evento["categoria"], "chamadas": 0, "segundos_total": 0.0,
+                "segundos_proprios": 0.0, "segundos_max": 0.0,
+            })
+            item["chamadas"] += 1
+            item["segundos_total"] += evento["duracao_us"] / 1e6
+            item["segundos_proprios"] += evento["proprio_us"] / 1e6
+            item["segundos_max"] = max(item["segundos_max"], evento["duracao_us"] / 1e6)
+            if "memoria_pico" in evento:
+                item["memoria_pico"] = max(item.get("memoria_pico", 0), evento["memoria_pico"])
+        return dict(sorted(agregado.items(), key=lambda par: -par[1]["segundos_proprios"]))
+
+    def imprimir_resumo(self, max_linhas=30):
+        """Exibe as etapas que mais consumiram tempo próprio."""
+        print(f"{'Etapa':40s} {'Categoria':10s} {'Chamadas':>8s} {'Total (s)':>10s} {'Próprio (s)':>12s} {'Pico (MB)':>10s}")
+        for nome, item in list(self.resumo().items())[:max_linhas]:
+            pico = f"{item['memoria_pico'] / 2**20:10.1f}" if "memoria_pico" in item else f"{'-':>10s}"
+            print(f"{nome:40s} {item['categoria']:10s} {item['chamadas']:8d} {item['segundos_total']:10.3f} "
+                  f"{item['segundos_proprios']:12.3f} {pico}")
+
+    def salvar_log(self, caminho):
+        """Grava os eventos como log estruturado: uma linha JSON por etapa."""
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            for evento in list(self.eventos):
+                arquivo.write(json.dumps(evento, ensure_ascii=False, default=str) + "\n")
+        return caminho
+
+    def salvar_chrome_trace(self, caminho):
+        """
+        Grava os eventos no formato Trace Event do Chrome, que pode ser aberto em
+        chrome://tracing ou no Perfetto (ui.perfetto.dev): uma faixa por thread, com as etapas
+        aninhadas e o tamanho do grafo e a memória nos argumentos de cada uma.
+        """
+        eventos = []
+        threads = {}
+        for evento in list(self.eventos):
+            argumentos = {chave: evento[chave] for chave in ("nos", "arestas", "memoria_pico", "memoria_extra", "erro", "dados")
+                          if chave in evento}
+            eventos.append({
+                "name": evento["nome"], "cat": evento["categoria"], "ph": "X",
+                "ts": evento["inicio_us"], "dur": evento["duracao_us"],
+                "pid": evento["pid"], "tid": evento["thread"], "args": argumentos,
+            })
+            threads[(evento["pid"], evento["thread"])] = evento["nome_thread"]
+        for (pid, tid), nome in threads.items():
+            eventos.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": nome}})
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, arquivo, ensure_ascii=False, default=str)
+        return caminho
+
+
+# Coletor único do processo, usado pelos decoradores dos módulos de análise
+INSTRUMENTACAO = Instrumentacao()
+instrumentar = INSTRUMENTACAO.instrumentar
+etapa = INSTRUMENTACAO.etapa
+
+
+def _ativar_pelo_ambiente():
+    trace, log = os.environ.get("GRAFOS_TRACE"), os.environ.get("GRAFOS_LOG")
+    perfilar = os.environ.get("GRAFOS_PERFILAR")
+    if not (os.environ.get("GRAFOS_INSTRUMENTACAO") or os.environ.get("GRAFOS_MEMORIA") or perfilar or trace or log):
+        return
+    INSTRUMENTACAO.ativar(memoria=bool(os.environ.get("GRAFOS_MEMORIA")), perfilar=perfilar)
+    if trace:
+        atexit.register(INSTRUMENTACAO.salvar_chrome_trace, trace)
+    if log:
+        atexit.register(INSTRUMENTACAO.salvar_log, log)
+
+
+_ativar_pelo_ambiente()
@@ -0,0 +1,175 @@
+import multiprocessing
+import warnings
+
+import numpy as np
+import networkx as nx
+
+from grafo_csr import GrafoCSR
+from graus import graus_do_grafo
+from componentes import componentes_do_grafo
+
+
+ITERACOES_WL = 3  # Rodadas de refinamento do hash de Weisfeiler–Lehman
+MAX_NOS_NO_PROCESSO = 100  # Até esse número de nós, o VF2++ roda no próprio processo, sem prazo
+
+
+def _como_networkx(grafo):
+    return grafo.para_networkx() if isinstance(grafo, GrafoCSR) else grafo
+
+
+def _num_arestas(grafo):
+    return grafo.num_arestas if isinstance(grafo, GrafoCSR) else grafo.number_of_edges()
+
+
+def _triangulos(grafo):
+    return np.sort(np.fromiter(nx.triangles(_como_networkx(grafo)).values(), dtype=np.int64, count=len(grafo)))
+
+
+# Invariantes comparados em ordem crescente de custo: nome -> cálculo
+INVARIANTES = (
+    ("número de nós", len),
+    ("número de arestas", _num_arestas),
+    ("sequência de graus", lambda grafo: np.sort(graus_do_grafo(grafo))),
+    ("tamanhos das componentes", lambda grafo: np.sort(componentes_do_grafo(grafo)["tamanhos"])),
+    ("triângulos por nó", _triangulos),
+)
+
+
+def comparar_invariantes(grafo1, grafo2):
+    """
+    Compara invariantes de isomorfismo dos dois grafos, do mais barato ao mais caro, parando
+    no primeiro que difere.
+
+    Args:
+        grafo1, grafo2 (networkx.Graph | GrafoCSR): Os grafos comparados.
+
+    Returns:
+        str | None: O nome do primeiro invariante diferente, ou None se todos coincidem.
+    """
+    for nome, calcular in INVARIANTES:
+        if not np.array_equal(calcular(grafo1), calcular(grafo2)):
+            return nome
+    return None
+
+
+def hash_wl(grafo, iteracoes=ITERACOES_WL):
+    """
+    Hash de Weisfeiler–Lehman do grafo: grafos isomórficos têm sempre o mesmo hash; hashes
+    iguais não garantem isomorfismo (grafos regulares, por exemplo, costumam colidir).
+    """
+    with warnings.catch_warnings():
+        # Aviso do NetworkX >= 3.5 sobre a mudança dos hashes entre versões: aqui só se compara
+        # hashes calculados na mesma execução
+        warnings.filterwarnings("ignore", message="The hashes produced", category=UserWarning)
+        return nx.weisfeiler_lehman_graph_hash(_como_networkx(grafo), iterations=iteracoes)
+
+
+def _contexto_processos():
+    """
+    Contexto de multiprocessing do processo do VF2++. Nunca usa "fork": a verificação pode
+    rodar dentro de um pool de threads (como no `pipeline`), e copiar o processo com outras
+    threads no meio de uma operação pode deixar travas presas no filho.
+    """
+    metodos = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in metodos else "spawn")
+
+
+def _vf2pp(grafo1, grafo2, tempo_limite):
+    """
+    Executa o VF2++ completo. Com `tempo_limite` e grafos com mais de `MAX_NOS_NO_PROCESSO`
+    nós, a busca roda em um processo separado, que é encerrado ao fim do prazo (a busca em si
+    não pode ser interrompida); grafos menores são resolvidos no próprio processo, sem o custo
+    de criar o processo e copiar os grafos para ele.
+
+    Returns:
+        bool | None: O resultado, ou None se o prazo acabou.
+    """
+    if tempo_limite is None or len(grafo1) <= MAX_NOS_NO_PROCESSO:
+        return nx.vf2pp_is_isomorphic(grafo1, grafo2)
+    processos = _contexto_processos().Pool(1)
+    try:
+        return processos.apply_async(nx.vf2pp_is_isomorphic, (grafo1, grafo2)).get(tempo_limite)
+    except multiprocessing.TimeoutError:
+        return None
+    finally:
+        processos.terminate()
+
+
+def verificar_isomorfismo(grafo1, grafo2, tempo_limite=None):
+    """
+    Verifica se dois grafos são isomórficos em três etapas, cada uma só executada se a
+    anterior não decidiu:
+
+    1. invariantes baratos (nós, arestas, sequência de graus, tamanhos das componentes e
+       triângulos por nó; ver `comparar_invariantes`);
+    2. hash de Weisfeiler–Lehman;
+    3. busca completa VF2++, limitada a `tempo_limite` segundos.
+
+    Args:
+        grafo1, grafo2 (networkx.Graph | GrafoCSR): Os grafos comparados.
+        tempo_limite (float, opcional): Orçamento de tempo do VF2++, em segundos.
+
+    Returns:
+        dict: "estado" ("sim", "nao" ou "desconhecido", se o VF2++ esgotou o prazo), "etapa"
+        ("invariantes", "wl" ou "vf2pp") e "motivo" (o invariante que diferiu, se houver).
+    """
+    motivo = comparar_invariantes(grafo1, grafo2)
+    if motivo is not None:
+        return {"estado": "nao", "etapa": "invariantes", "motivo": motivo}
+    if hash_wl(grafo1) != hash_wl(grafo2):
+        return {"estado": "nao", "etapa": "wl", "motivo": "hash de Weisfeiler–Lehman"}
+    resultado = _vf2pp(_como_networkx(grafo1), _como_networkx(grafo2), tempo_limite)
+    estado = "desconhecido" if resultado is None else "sim" if resultado else "nao"
+    return {"estado": estado, "etapa": "vf2pp", "motivo": None}
+
+
+def _assinatura(grafo):
+    """Chave de agrupamento: grafos isomórficos sempre têm a mesma."""
+    return (len(grafo), _num_arestas(grafo), np.sort(graus_do_grafo(grafo)).tobytes(), hash_wl(grafo))
+
+
+def classes_isomorfismo(grafos, tempo_limite=None):
+    """
+    Agrupa vários grafos (por exemplo, instantâneos de uma rede ao longo do tempo) em classes
+    de isomorfismo.
+
+    Os grafos são primeiro separados pela assinatura (nós, arestas, sequência de graus e hash
+    de Weisfeiler–Lehman), calculada uma vez por grafo; grafos com assinaturas diferentes nunca
+    são isomórficos. Dentro de cada grupo, cada grafo é comparado pelo VF2++ apenas com um
+    representante de cada classe já formada. Um grafo que não coincide com nenhuma classe, mas
+    cuja comparação com alguma delas esgotou o prazo, não pode ser classificado: ele fica em
+    "indeterminados", e não em uma classe própria.
+
+    Args:
+        grafos (dict): Nome -> `nx.Graph` ou `GrafoCSR`.
+        tempo_limite (float, opcional): Orçamento de tempo de cada comparação VF2++, em segundos.
+
+    Returns:
+        dict: "classes" (lista de listas de nomes) e "indeterminados" (nome -> representantes
+        das classes cuja comparação esgotou o prazo).
+    """
+    grupos = {}
+    for nome, grafo in grafos.items():
+        grupos.setdefault(_assinatura(grafo), []).append(nome)
+
+    classes = []
+    indeterminados = {}
+    for nomes in grupos.values():
+        locais = []
+        for nome in nomes:
+            sem_resposta = []
+            for classe in locais:
+                representante = classe[0]
+                resultado = _vf2pp(_como_networkx(grafos[representante]), _como_networkx(grafos[nome]), tempo_limite)
+                if resultado is None:
+                    sem_resposta.append(representante)
+                elif resultado:
+                    classe.append(nome)
+                    break
+            else:
+                if sem_resposta:
+                    indeterminados[nome] = sem_resposta
+                else:
+                    locais.append([nome])
+        classes.extend(locais)
+    return {"classes": classes, "indeterminados": indeterminados}
@@ -0,0 +1,198 @@
+import hashlib
+import os
+
+import numpy as np
+
+from instrumentacao import instrumentar
+
+
+# Layout de força (Fruchterman–Reingold) para grafos grandes, com a repulsão aproximada por
+# Barnes–Hut sobre grades hierárquicas e todas as atualizações vetorizadas no NumPy. As
+# posições calculadas são guardadas em disco, indexadas por um hash do grafo.
+
+DIRETORIO_LAYOUTS = os.environ.get("GRAFOS_LAYOUTS", "layouts")
+LIMITE_EXATO = 1000  # Até esse número de nós, a repulsão é calculada par a par
+NOS_POR_CELULA = 2  # Ocupação média desejada das células da grade mais fina
+GRAVIDADE = 1.0  # Atração para o centro, que impede as componentes desconexas de se afastarem sem limite
+
+
+def arestas_indexadas(grafo):
+    """
+    Nós de um `nx.Graph` e as suas arestas como pares de índices (sem laços).
+
+    Returns:
+        tuple: (nos, pares), com nos uma lista e pares um array (m, 2) de int64.
+    """
+    nos = list(grafo.nodes)
+    indice = {no: i for i, no in enumerate(nos)}
+    pares = np.fromiter(
+        (indice[no] for aresta in grafo.edges for no in aresta),
+        dtype=np.int64, count=2 * grafo.number_of_edges()
+    ).reshape(-1, 2)
+    return nos, pares[pares[:, 0] != pares[:, 1]]
+
+
+def hash_grafo(nos, pares):
+    """Hash (SHA-1) da lista de nós e do conjunto de arestas, independente da ordem das arestas."""
+    normalizadas = np.unique(np.sort(pares, axis=1), axis=0) if len(pares) else pares
+    resumo = hashlib.sha1()
+    resumo.update("\n".join(map(repr, nos)).encode())
+    resumo.update(np.ascontiguousarray(normalizadas, dtype=np.int64).tobytes())
+    return resumo.hexdigest()
+
+
+def _somar_por_no(forca, indices, vetores):
+    n = len(forca)
+    forca[:, 0] += np.bincount(indices, weights=vetores[:, 0], minlength=n)
+    forca[:, 1] += np.bincount(indices, weights=vetores[:, 1], minlength=n)
+
+
+def _repulsao_par_a_par(pos, k2, i, j, forca):
+    """Soma em `forca[i]` a repulsão exata k² / d de cada par (i, j), com i != j."""
+    vetor = pos[i] - pos[j]
+    d2 = np.maximum(np.einsum("ij,ij->i", vetor, vetor), 1e-12)
+    _somar_por_no(forca, i, vetor * (k2 / d2)[:, None])
+
+
+def _repulsao_exata(pos, k2):
+    n = len(pos)
+    i, j = np.nonzero(~np.eye(n, dtype=bool))
+    forca = np.zeros_like(pos)
+    _repulsao_par_a_par(pos, k2, i, j, forca)
+    return forca
+
+
+def _repulsao_barnes_hut(pos, k2, nivel_max):
+    """
+    Repulsão aproximada em O(n log n), com grades de 4, 16, ..., 4^nivel_max células.
+
+    Em cada nível, um nó interage com o centro de massa das células filhas das vizinhas da
+    célula-mãe que não são vizinhas da sua própria célula (no máximo 27); essas células estão
+    a pelo menos uma largura de distância, e os nós mais distantes já foram contados em
+    níveis mais grossos. No nível mais fino, os nós das 9 células vizinhas são somados par a
+    par. Cada outro nó é contado exatamente uma vez.
+    """
+    n = len(pos)
+    minimo = pos.min(axis=0)
+    escala = float((pos.max(axis=0) - minimo).max()) or 1.0
+    normalizadas = (pos - minimo) / escala
+    forca = np.zeros_like(pos)
+
+    for nivel in range(2, nivel_max + 1):
+        lado = 1 << nivel
+        celula = np.minimum((normalizadas * lado).astype(np.int64), lado - 1)
+        plano = celula[:, 0] * lado + celula[:, 1]
+        massa = np.bincount(plano, minlength=lado * lado)
+        centro = np.stack([
+            np.bincount(plano, weights=pos[:, 0], minlength=lado * lado),
+            np.bincount(plano, weights=pos[:, 1], minlength=lado * lado),
+        ], axis=1) / np.maximum(massa, 1)[:, None]
+
+        base = celula // 2 * 2  # Primeira filha da célula-mãe
+        for dx in range(-2, 4):
+            x = base[:, 0] + dx
+            longe_x = np.abs(x - celula[:, 0]) > 1
+            for dy in range(-2, 4):
+                y = base[:, 1] + dy
+                valido = (x >= 0) & (x < lado) & (y >= 0) & (y < lado) & (longe_x | (np.abs(y - celula[:, 1]) > 1))
+                nos = np.flatnonzero(valido)
+                alvo = x[nos] * lado + y[nos]
+                cheias = massa[alvo] > 0
+                nos, alvo = nos[cheias], alvo[cheias]
+                vetor = pos[nos] - centro[alvo]
+                d2 = np.maximum(np.einsum("ij,ij->i", vetor, vetor), 1e-12)
+                forca[nos] += vetor * (massa[alvo] * k2 / d2)[:, None]
+
+    # Nível mais fino: pares exatos entre nós de células vizinhas
+    ordem = np.argsort(plano, kind="stable")
+    inicio = np.concatenate([[0], np.cumsum(massa)[:-1]])
+    for dx in (-1, 0, 1):
+        x = celula[:, 0] + dx
+        for dy in (-1, 0, 1):
+            y = celula[:, 1] + dy
+            nos = np.flatnonzero((x >= 0) & (x < lado) & (y >= 0) & (y < lado))
+            alvo = x[nos] * lado + y[nos]
+            quantidade = massa[alvo]
+            total = int(quantidade.sum())
+            i = np.repeat(nos, quantidade)
+            deslocamento = np.arange(total) - np.repeat(np.cumsum(quantidade) - quantidade, quantidade)
+            j = ordem[np.repeat(inicio[alvo], quantidade) + deslocamento]
+            distintos = i != j
+            _repulsao_par_a_par(pos, k2, i[distintos], j[distintos], forca)
+    return forca
+
+
+def layout_forcas(n, pares, iteracoes=100, seed=42, limite_exato=LIMITE_EXATO):
+    """
+    Calcula posições por Fruchterman–Reingold, com repulsão exata até `limite_exato` nós e
+    aproximada por Barnes–Hut (O(n log n) por iteração) acima disso, mais uma gravidade fraca
+    em direção ao centro.
+
+    Args:
+        n (int): Número de nós.
+        pares (numpy.ndarray): Arestas como pares de índices 0..n-1.
+        iteracoes (int): Número de iterações (a temperatura cai linearmente até zero).
+        seed (int): Semente das posições iniciais.
+        limite_exato (int): Maior número de nós com repulsão par a par.
+
+    Returns:
+        numpy.ndarray: Array (n, 2) de posições, centradas na origem e com coordenadas em [-1, 1].
+    """
+    if n == 0:
+        return np.zeros((0, 2))
+    pos = np.random.default_rng(seed).random((n, 2))
+    if n == 1:
+        return pos * 0
+    k = np.sqrt(1.0 / n)
+    nivel_max = max(2, int(np.ceil(np.log(max(n / NOS_POR_CELULA, 1)) / np.log(4))))
+    origem, destino = pares[:, 0], pares[:, 1]
+    temperatura = 0.1
+    passo = temperatura / (iteracoes + 1)
+
+    for _ in range(iteracoes):
+        if n <= limite_exato:
+            forca = _repulsao_exata(pos, k * k)
+        else:
+            forca = _repulsao_barnes_hut(pos, k * k, nivel_max)
+        # Atração d² / k ao longo das arestas, nos dois sentidos
+        vetor = pos[origem] - pos[destino]
+        atracao = vetor * (np.sqrt(np.einsum("ij,ij->i", vetor, vetor)) / k)[:, None]
+        _somar_por_no(forca, destino, atracao)
+        _somar_por_no(forca, origem, -atracao)
+        forca -= GRAVIDADE * (pos - pos.mean(axis=0))
+
+        tamanho = np.maximum(np.sqrt(np.einsum("ij,ij->i", forca, forca)), 1e-12)
+        pos += forca * (np.minimum(tamanho, temperatura) / tamanho)[:, None]
+        temperatura -= passo
+
+    pos -= pos.mean(axis=0)
+    return pos / (np.abs(pos).max() or 1.0)
+
+
+@instrumentar("layout")
+def layout_em_cache(grafo, seed=42, iteracoes=100, diretorio=None):
+    """
+    Retorna o layout de força do grafo, lendo-o do disco se já foi calculado para o mesmo grafo.
+
+    O arquivo é `<hash do grafo>_<seed>_<iteracoes>.npy` em `diretorio` (padrão:
+    `DIRETORIO_LAYOUTS`, variável de ambiente GRAFOS_LAYOUTS).
+
+    Args:
+        grafo (networkx.Graph): O grafo a ser desenhado.
+        seed (int): Semente das posições iniciais.
+        iteracoes (int): Iterações do layout.
+        diretorio (str, opcional): Onde guardar as posições.
+
+    Returns:
+        dict: Nó -> posição (x, y).
+    """
+    diretorio = diretorio or DIRETORIO_LAYOUTS
+    nos, pares = arestas_indexadas(grafo)
+    caminho = os.path.join(diretorio, f"{hash_grafo(nos, pares)}_{seed}_{iteracoes}.npy")
+    if os.path.exists(caminho):
+        pos = np.load(caminho)
+    else:
+        pos = layout_forcas(len(nos), pares, iteracoes=iteracoes, seed=seed)
+        os.makedirs(diretorio, exist_ok=True)
+        np.save(caminho, pos)
+    return dict(zip(nos, pos))
@@ -0,0 +1,159 @@
+import time
+
+import numpy as np
+
+from instrumentacao import instrumentar
+
+
+TAMANHO_BLOCO_PADRAO = 4 * 1024 * 1024  # Bytes lidos do arquivo por vez
+
+_NOVA_LINHA = ord("\n")
+_COMENTARIO = ord("#")
+_ESPACOS = (ord(" "), ord("\t"), ord("\r"))
+_POTENCIAS_10 = 10 ** np.arange(19, dtype=np.int64)
+
+
+def _converter_bloco(bloco):
+    """
+    Converte um bloco de bytes (apenas linhas completas) em pares de inteiros.
+
+    A conversão é feita de forma vetorizada sobre os bytes do bloco: as linhas de comentário
+    são descartadas, as sequências de dígitos são localizadas e os números são montados
+    somando cada dígito multiplicado pela potência de 10 da sua posição.
+
+    Args:
+        bloco (bytes): Trecho do arquivo terminado em quebra de linha.
+
+    Returns:
+        numpy.ndarray: Array (k, 2) de int64 com as arestas do bloco.
+    """
+    dados = np.frombuffer(bloco, dtype=np.uint8)
+    if dados.size == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Cada byte pertence à linha do próximo "\n" (a própria quebra de linha inclusive)
+    fim_linha = dados == _NOVA_LINHA
+    id_linha = np.cumsum(fim_linha) - fim_linha
+    espaco = np.isin(dados, _ESPACOS) | fim_linha
+
+    # Linhas cujo primeiro caractere visível é "#" são comentários
+    cerquilhas = np.flatnonzero(dados == _COMENTARIO)
+    if cerquilhas.size:
+        visiveis = np.cumsum(~espaco)
+        inicio_linha = np.flatnonzero(np.r_[True, fim_linha[:-1]])
+        base = visiveis[inicio_linha] - ~espaco[inicio_linha]
+        primeiro = visiveis[cerquilhas] - base[id_linha[cerquilhas]] == 1
+        linha_comentada = np.zeros(inicio_linha.size, dtype=bool)
+        linha_comentada[id_linha[cerquilhas[primeiro]]] = True
+        manter = ~linha_comentada[id_linha]
+        dados, id_linha, espaco = dados[manter], id_linha[manter], espaco[manter]
+
+    digito = (dados >= ord("0")) & (dados <= ord("9"))
+    invalidos = ~(digito | espaco)
+    if invalidos.any():
+        linha = bytes(dados[id_linha == id_linha[np.argmax(invalidos)]]).decode(errors="replace")
+        raise ValueError(f"Linha inválida no arquivo de arestas: {linha.strip()!r}")
+
+    # Início e fim de cada número (sequência contígua de dígitos)
+    borda = np.diff(digito.astype(np.int8), prepend=0, append=0)
+    inicios = np.flatnonzero(borda == 1)
+    if inicios.size == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    comprimentos = np.flatnonzero(borda == -1) - inicios
+    if comprimentos.max() > 18:
+        raise ValueError("Identificador de nó grande demais para int64.")
+
+    # Toda linha com conteúdo precisa ter exatamente dois números
+    numeros_por_linha = np.bincount(id_linha[inicios])
+    if np.any((numeros_por_linha != 0) & (numeros_por_linha != 2)):
+        linha_errada = np.flatnonzero((numeros_por_linha != 0) & (numeros_por_linha != 2))[0]
+        linha = bytes(dados[id_linha == linha_errada]).decode(errors="replace")
+        raise ValueError(f"Linha inválida no arquivo de arestas: {linha.strip()!r}")
+
+    valores = (dados[digito] - ord("0")).astype(np.int64)
+    fim_numero = np.cumsum(comprimentos)
+    expoente = np.repeat(fim_numero, comprimentos) - 1 - np.arange(valores.size)
+    numeros = np.add.reduceat(valores * _POTENCIAS_10[expoente], fim_numero - comprimentos)
+
+    return numeros.reshape(-1, 2)
+
+
+def iterar_blocos_arestas(caminho_arquivo, max_arestas=None, tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+    """
+    Lê um arquivo de arestas no formato SNAP em blocos grandes, gerando lotes de arestas.
+
+    O arquivo é lido em pedaços de `tamanho_bloco` bytes; a linha incompleta no fim de cada
+    pedaço é guardada e completada na leitura seguinte. Comentários ("#") são ignorados.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo de texto.
+        max_arestas (int, opcional): Número máximo de arestas a ler. None lê o arquivo inteiro.
+        tamanho_bloco (int): Quantidade de bytes lida do disco por vez.
+
+    Yields:
+        numpy.ndarray: Array (k, 2) de int64 com o próximo lote de arestas (origem, destino).
+    """
+    if max_arestas is not None and max_arestas <= 0:
+        return
+
+    lidas = 0
+    resto = b""
+    with open(caminho_arquivo, "rb") as arquivo:
+        while True:
+            pedaco = arquivo.read(tamanho_bloco)
+            if pedaco:
+                pedaco = resto + pedaco
+                corte = pedaco.rfind(b"\n") + 1
+                resto = pedaco[corte:]
+                arestas = _converter_bloco(memoryview(pedaco)[:corte])
+            else:
+                # Fim do arquivo: converte a última linha, mesmo sem "\n"
+                arestas = _converter_bloco(resto)
+                resto = b""
+
+            if len(arestas):
+                if max_arestas is not None and lidas + len(arestas) >= max_arestas:
+                    yield arestas[:max_arestas - lidas]
+                    return
+                lidas += len(arestas)
+                yield arestas
+
+            if not pedaco:
+                return
+
+
+def relatar_vazao(caminho_arquivo, total_arestas, segundos):
+    """
+    Exibe a quantidade de arestas lidas e a vazão da leitura em arestas por segundo.
+
+    Args:
+        caminho_arquivo (str): Arquivo que foi lido.
+        total_arestas (int): Número de arestas lidas.
+        segundos (float): Tempo gasto na leitura.
+
+    Returns:
+        float: Vazão em arestas por segundo.
+    """
+    vazao = total_arestas / segundos if segundos > 0 else float("inf")
+    print(f"{total_arestas} arestas lidas de {caminho_arquivo} em {segundos:.3f} s ({vazao:,.0f} arestas/s)")
+    return vazao
+
+
+@instrumentar("leitura")
+def ler_arestas(caminho_arquivo, max_arestas=None, tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+    """
+    Lê todas as arestas de um arquivo SNAP para um único array, sem criar objetos por aresta.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo de texto.
+        max_arestas (int, opcional): Número máximo de arestas a ler. None lê o arquivo inteiro.
+        tamanho_bloco (int): Quantidade de bytes lida do disco por vez.
+
+    Returns:
+        numpy.ndarray: Array (m, 2) de int64 com as arestas (origem, destino) na ordem do arquivo.
+    """
+    inicio = time.perf_counter()
+    blocos = list(iterar_blocos_arestas(caminho_arquivo, max_arestas, tamanho_bloco))
+    arestas = np.concatenate(blocos) if blocos else np.empty((0, 2), dtype=np.int64)
+    relatar_vazao(caminho_arquivo, len(arestas), time.perf_counter() - inicio)
+    return arestas
@@ -0,0 +1,298 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from grafo_csr import GrafoCSR
+from componentes import componentes_do_grafo
+
+
+MIN_CONSULTAS_POR_TRABALHADOR = 64  # Abaixo disso as consultas rodam na thread atual
+LIMITE_FRONTEIRA_PYTHON = 256  # Até esse número de arestas, um nível é expandido em Python, sem o custo fixo do NumPy
+NUM_MARCOS = 8  # Marcos (landmarks) do índice ALT
+
+# Serviço montado uma vez por processo trabalhador
+_servico_trabalhador = None
+
+
+class _AreaBusca:
+    """
+    Arrays de trabalho da busca bidirecional (graus e predecessor de cada nó a partir de cada
+    ponta), alocados uma vez e limpos apenas nas posições visitadas, para que uma consulta curta
+    em um grafo grande não pague O(n).
+    """
+
+    def __init__(self, csr):
+        n = csr.num_nos
+        self.graus = np.diff(csr.indptr)
+        self.pai = (np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int64))
+        self.visitados = ([], [])
+
+    def limpar(self):
+        for pai, visitados in zip(self.pai, self.visitados):
+            for nos in visitados:
+                pai[nos] = -1
+            visitados.clear()
+
+
+def _expandir(csr, fronteira, pai, pai_outro, visitados):
+    """
+    Avança um nível da busca de um dos lados.
+
+    Returns:
+        tuple: (nós descobertos, um nó já alcançado pelo outro lado ou -1).
+    """
+    vizinhos, comprimentos = csr._vizinhos_de(fronteira)
+    pais = np.repeat(fronteira, comprimentos)
+    novos = pai[vizinhos] < 0
+    nos, primeiro = np.unique(vizinhos[novos], return_index=True)
+    pai[nos] = pais[novos][primeiro]
+    visitados.append(nos)
+    encontro = nos[pai_outro[nos] >= 0]
+    return nos, int(encontro[0]) if encontro.size else -1
+
+
+def _expandir_pequena(csr, fronteira, pai, pai_outro, visitados):
+    """Mesmo que `_expandir`, nó a nó, para fronteiras pequenas; para no primeiro encontro."""
+    indptr, indices = csr.indptr, csr.indices
+    nos = []
+    try:
+        for u in fronteira.tolist():
+            for w in indices[indptr[u]:indptr[u + 1]].tolist():
+                if pai[w] < 0:
+                    pai[w] = u
+                    nos.append(w)
+                    if pai_outro[w] >= 0:
+                        return None, w
+    finally:
+        visitados.append(np.array(nos, dtype=np.int64))
+    return visitados[-1], -1
+
+
+def _subir(pai, no):
+    caminho = [no]
+    while pai[caminho[-1]] != caminho[-1]:
+        caminho.append(int(pai[caminho[-1]]))
+    return caminho
+
+
+def caminho_bidirecional(csr, origem, destino, area=None):
+    """
+    Menor caminho (índices densos) entre dois nós por busca em largura bidirecional.
+
+    As duas buscas avançam um nível inteiro por vez, sempre pelo lado cuja fronteira tem menos
+    arestas a examinar, e param no primeiro nó alcançado pelas duas. Em grafos com muitos
+    vizinhos por nó, isso explora cerca de 2·b^(d/2) nós em vez de b^d.
+
+    Args:
+        csr (GrafoCSR): O grafo.
+        origem (int): Índice denso do nó inicial.
+        destino (int): Índice denso do nó final.
+        area (_AreaBusca, opcional): Arrays de trabalho reaproveitados entre consultas.
+
+    Returns:
+        list | None: Os índices densos do caminho, ou None se não houver caminho.
+    """
+    if origem == destino:
+        return [origem]
+    area = area or _AreaBusca(csr)
+    pai_origem, pai_destino = area.pai
+    try:
+        pai_origem[origem] = origem
+        pai_destino[destino] = destino
+        area.visitados[0].append(np.array([origem]))
+        area.visitados[1].append(np.array([destino]))
+        fronteiras = [np.array([origem], dtype=np.int64), np.array([destino], dtype=np.int64)]
+        graus = area.graus
+
+        while fronteiras[0].size and fronteiras[1].size:
+            arestas = [int(graus[fronteira].sum()) for fronteira in fronteiras]
+            lado = 0 if arestas[0] <= arestas[1] else 1
+            expandir = _expandir_pequena if arestas[lado] <= LIMITE_FRONTEIRA_PYTHON else _expandir
+            nos, meio = expandir(csr, fronteiras[lado], area.pai[lado], area.pai[1 - lado], area.visitados[lado])
+            if meio >= 0:
+                # Todo nó de encontro está no nível mais recente de cada lado, então qualquer
+                # um deles dá um menor caminho
+                return _subir(pai_origem, meio)[::-1] + _subir(pai_destino, meio)[1:]
+            fronteiras[lado] = nos
+        return None
+    finally:
+        area.limpar()
+
+
+class ServicoCaminhos:
+    """
+    Responde muitas consultas de menor caminho sobre o mesmo grafo.
+
+    Na construção, rotula as componentes conexas (união-busca), o que responde "existe
+    caminho?" em O(1), e calcula opcionalmente um índice ALT: as distâncias de `marcos` nós a
+    todos os outros. Pela desigualdade triangular, |d(L, u) - d(L, v)| <= d(u, v) <=
+    d(L, u) + d(L, v) para todo marco L da componente, o que limita a distância sem busca e a
+    determina quando os dois limites coincidem. Os demais caminhos saem de
+    `caminho_bidirecional`.
+
+    Atributos:
+        csr (GrafoCSR): O grafo.
+        componente (numpy.ndarray): Rótulo da componente de cada nó denso.
+        marcos (numpy.ndarray): Índices densos dos marcos.
+        distancias_marcos (numpy.ndarray): Matriz (marcos, n) de distâncias (-1 se inalcançável).
+    """
+
+    def __init__(self, grafo, marcos=NUM_MARCOS, componente=None):
+        self.csr = grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.de_networkx(grafo)
+        self.componente = componentes_do_grafo(self.csr)["componente"] if componente is None else componente
+        self._local = threading.local()
+        self.marcos, self.distancias_marcos = self._escolher_marcos(marcos)
+
+    def _escolher_marcos(self, quantidade):
+        """
+        Escolhe os marcos pelo ponto mais distante: o primeiro é o nó de maior grau e cada
+        seguinte é o nó mais longe dos já escolhidos, priorizando componentes ainda sem marco.
+        """
+        n = self.csr.num_nos
+        if not quantidade or n == 0:
+            return np.empty(0, dtype=np.int64), np.empty((0, n), dtype=np.int32)
+        marcos, distancias = [], []
+        cobertura = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+        candidato = int(np.argmax(np.diff(self.csr.indptr)))
+        for _ in range(min(quantidade, n)):
+            distancia = self.csr.bfs(candidato)
+            marcos.append(candidato)
+            distancias.append(distancia)
+            alcancados = distancia >= 0
+            cobertura[alcancados] = np.minimum(cobertura[alcancados], distancia[alcancados])
+            cobertura[candidato] = -1
+            candidato = int(np.argmax(cobertura))
+            if cobertura[candidato] <= 0:
+                break
+        return np.array(marcos, dtype=np.int64), np.array(distancias, dtype=np.int32)
+
+    def _area(self):
+        # Uma área de trabalho por thread
+        area = getattr(self._local, "area", None)
+        if area is None:
+            area = self._local.area = _AreaBusca(self.csr)
+        return area
+
+    # ------------------------------------------------------------------ consultas
+
+    def alcancavel(self, origem, destino):
+        """Indica, em O(1), se existe caminho entre dois nós (identificadores originais)."""
+        return bool(self.componente[self.csr.indice(origem)] == self.componente[self.csr.indice(destino)])
+
+    def limites_distancia(self, origem, destino):
+        """
+        Limites inferior e superior da distância entre dois nós pelo índice ALT, sem busca.
+
+        Returns:
+            tuple: (inferior, superior), com superior None se nenhum marco alcança os dois nós,
+            ou (None, None) se não há caminho.
+        """
+        return self._limites(self.csr.indice(origem), self.csr.indice(destino))
+
+    def _limites(self, u, v):
+        if self.componente[u] != self.componente[v]:
+            return None, None
+        if u == v:
+            return 0, 0
+        de_u = self.distancias_marcos[:, u]
+        de_v = self.distancias_marcos[:, v]
+        validos = de_u >= 0
+        if not validos.any():
+            return 1, None
+        inferior = max(1, int(np.abs(de_u[validos] - de_v[validos]).max()))
+        return inferior, int((de_u[validos] + de_v[validos]).min())
+
+    def _caminho(self, u, v):
+        if self.componente[u] != self.componente[v]:
+            return None
+        return caminho_bidirecional(self.csr, u, v, self._area())
+
+    def _distancia(self, u, v):
+        inferior, superior = self._limites(u, v)
+        if inferior is None:
+            return -1
+        if inferior == superior:
+            return inferior
+        return len(caminho_bidirecional(self.csr, u, v, self._area())) - 1
+
+    def caminho(self, origem, destino):
+        """
+        Menor caminho entre dois nós (identificadores originais).
+
+        Returns:
+            list | None: Os nós do caminho, ou None se não houver caminho.
+        """
+        caminho = self._caminho(self.csr.indice(origem), self.csr.indice(destino))
+        return None if caminho is None else [self.csr.rotulo(i) for i in caminho]
+
+    def distancia(self, origem, destino):
+        """Número de arestas do menor caminho entre dois nós, ou -1 se não houver caminho."""
+        return self._distancia(self.csr.indice(origem), self.csr.indice(destino))
+
+    # ------------------------------------------------------------------ lotes
+
+    def _indices(self, pares):
+        return [(self.csr.indice(origem), self.csr.indice(destino)) for origem, destino in pares]
+
+    def _executar(self, funcao, pares, trabalhadores, modo):
+        """
+        Aplica `funcao` (nome de método sobre índices densos) a cada par, na thread atual, em
+        um pool de threads (a busca passa a maior parte do tempo no NumPy, que libera o GIL)
+        ou em um pool de processos, cada um com a sua cópia do grafo.
+        """
+        if trabalhadores is None:
+            trabalhadores = os.cpu_count() or 1
+        trabalhadores = max(1, min(trabalhadores, len(pares) // MIN_CONSULTAS_POR_TRABALHADOR))
+        if trabalhadores == 1:
+            return [getattr(self, funcao)(u, v) for u, v in pares]
+
+        blocos = [bloco.tolist() for bloco in np.array_split(np.asarray(pares, dtype=np.int64), trabalhadores)]
+        if modo == "threads":
+            with ThreadPoolExecutor(trabalhadores) as executor:
+                partes = executor.map(lambda bloco: [getattr(self, funcao)(u, v) for u, v in bloco], blocos)
+                return [resultado for parte in partes for resultado in parte]
+        if modo == "processos":
+            argumentos = (self.csr.indptr, self.csr.indices, self.componente, self.marcos, self.distancias_marcos)
+            with ProcessPoolExecutor(trabalhadores, initializer=_iniciar_trabalhador, initargs=argumentos) as executor:
+                partes = executor.map(_consultar_trabalhador, [funcao] * len(blocos), blocos)
+                return [resultado for parte in partes for resultado in parte]
+        raise ValueError(f"Modo desconhecido: {modo!r} (use 'threads' ou 'processos').")
+
+    def caminhos(self, pares, trabalhadores=None, modo="threads"):
+        """
+        Menores caminhos de um lote de pares (origem, destino).
+
+        Args:
+            pares (list): Pares de identificadores originais.
+            trabalhadores (int, opcional): Threads ou processos. Padrão: número de núcleos. Com
+                1, ou com poucos pares, as consultas rodam na thread atual.
+            modo (str): "threads" ou "processos".
+
+        Returns:
+            list: Um caminho (lista de nós) ou None por par, na ordem dos pares.
+        """
+        resultados = self._executar("_caminho", self._indices(pares), trabalhadores, modo)
+        return [None if caminho is None else [self.csr.rotulo(i) for i in caminho] for caminho in resultados]
+
+    def distancias(self, pares, trabalhadores=None, modo="threads"):
+        """
+        Distâncias de um lote de pares (origem, destino); ver `caminhos`.
+
+        Returns:
+            numpy.ndarray: Distância de cada par (-1 se não houver caminho).
+        """
+        return np.array(self._executar("_distancia", self._indices(pares), trabalhadores, modo), dtype=np.int64)
+
+
+def _iniciar_trabalhador(indptr, indices, componente, marcos, distancias_marcos):
+    """Monta, uma vez por processo, o serviço sobre a cópia do grafo e dos índices."""
+    global _servico_trabalhador
+    csr = GrafoCSR(indptr, indices, np.arange(len(indptr) - 1))
+    _servico_trabalhador = ServicoCaminhos(csr, marcos=0, componente=componente)
+    _servico_trabalhador.marcos, _servico_trabalhador.distancias_marcos = marcos, distancias_marcos
+
+
+def _consultar_trabalhador(funcao, pares):
+    return [getattr(_servico_trabalhador, funcao)(u, v) for u, v in pares]
@@ -0,0 +1,370 @@
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+from grafo_csr import GrafoCSR
+from instrumentacao import INSTRUMENTACAO, etapa
+from distancias import varredura_bfs, resumir_componentes
+from caminhos import iterar_caminhos_simples
+from cliques import histograma_cliques
+from analise import (
+    como_csr, calcular_pdf_ccdf, calcular_menor_caminho, calcular_distancia_media, calcular_excentricidade,
+    calcular_diametro, calcular_densidade, calcular_euleriano, calcular_hamiltoniano,
+    calcular_clique_maximo, calcular_conectividade, calcular_isomorfismo,
+    calcular_pontes
+)
+
+AMOSTRA_CAMINHOS = 10  # Caminhos simples da questão 3 guardados no relatório
+
+
+class ContextoAnalise:
+    """
+    Resultados intermediários de um grafo, calculados uma única vez e compartilhados.
+
+    Cada fato (CSR, componentes, varredura BFS, cliques...) é calculado na primeira vez que é
+    pedido e guardado. O cálculo de um mesmo fato é protegido por uma trava própria, então
+    várias threads podem pedi-lo ao mesmo tempo: só uma calcula, as demais esperam o resultado.
+
+    Atributos:
+        grafo (networkx.Graph | GrafoCSR): O grafo analisado.
+        processos (int, opcional): Número de processos da varredura BFS.
+    """
+
+    def __init__(self, grafo, processos=None):
+        self.grafo = grafo
+        self.processos = processos
+        self._resultados = {}
+        self._travas = {}
+        self._trava = threading.Lock()
+
+    def _memorizar(self, chave, calcular):
+        with self._trava:
+            trava = self._travas.setdefault(chave, threading.Lock())
+        with trava:
+            if chave not in self._resultados:
+                self._resultados[chave] = calcular()
+        return self._resultados[chave]
+
+    def networkx(self):
+        """O grafo como `nx.Graph` (convertido uma vez se for `GrafoCSR`)."""
+        if not isinstance(self.grafo, GrafoCSR):
+            return self.grafo
+        return self._memorizar("networkx", self.grafo.para_networkx)
+
+    def csr(self):
+        """O grafo como `GrafoCSR`."""
+        return self._memorizar("csr", lambda: como_csr(self.grafo))
+
+    def componentes(self):
+        """Rótulos, tamanhos e maior componente conexa, de uma única passada de união-busca."""
+        return self._memorizar("componentes", lambda: calcular_conectividade(self.csr()))
+
+    def conectado(self):
+        return self.componentes()["conectado"]
+
+    def resumo_componentes(self):
+        """Distância média, diâmetro e raio de cada componente, de uma única varredura BFS."""
+        return self._memorizar(
+            "resumo", lambda: resumir_componentes(self.csr(), varredura_bfs(self.csr(), self.processos))
+        )
+
+    def histograma_cliques(self):
+        """Número de cliques maximais de cada tamanho, sem guardar os cliques."""
+        return self._memorizar("histograma_cliques", lambda: histograma_cliques(self.csr(), processos=self.processos))
+
+
+# Fatos compartilhados: nome -> (dependências, cálculo)
+FATOS = {
+    "csr": ((), ContextoAnalise.csr),
+    "componentes": (("csr",), ContextoAnalise.componentes),
+    "resumo": (("csr",), ContextoAnalise.resumo_componentes),
+}
+
+
+def _caminhos(contexto, p):
+    grafo = contexto.csr()
+    if p["origem_caminhos"] not in grafo or p["destino_caminhos"] not in grafo:
+        return None
+    # O relatório guarda a contagem e uma amostra: os caminhos completos podem ocupar dezenas de MB
+    total = 0
+    amostra = []
+    inicio = time.perf_counter()
+    for caminho in iterar_caminhos_simples(
+        grafo, p["origem_caminhos"], p["destino_caminhos"],
+        limite=p["limite_caminhos"], tempo_limite=p["tempo_limite"]
+    ):
+        total += 1
+        if len(amostra) < AMOSTRA_CAMINHOS:
+            amostra.append(caminho)
+    # A geração para sem aviso ao esgotar o prazo; só isso a faz passar do orçamento
+    tempo_esgotado = (
+        total < p["limite_caminhos"] and p["tempo_limite"] is not None
+        and time.perf_counter() - inicio >= p["tempo_limite"]
+    )
+    return {
+        "total": total,
+        "limite_atingido": total >= p["limite_caminhos"] or tempo_esgotado,
+        "tempo_esgotado": tempo_esgotado,
+        "amostra": amostra,
+    }
+
+
+def _menor_caminho(contexto, p):
+    grafo = contexto.csr()
+    if p["origem_menor_caminho"] not in grafo or p["destino_menor_caminho"] not in grafo:
+        return None
+    return calcular_menor_caminho(grafo, p["origem_menor_caminho"], p["destino_menor_caminho"])
+
+
+def _excentricidade(contexto, p):
+    grafo = contexto.csr()
+    if p["vertice_excentricidade"] not in grafo:
+        return None
+    resultado = calcular_excentricidade(grafo, p["vertice_excentricidade"])
+    return {k: resultado[k] for k in ("excentricidade", "mais_distante", "conectado")}
+
+
+def _diametro(contexto, p):
+    resumo = calcular_diametro(contexto.csr(), resumo=contexto.resumo_componentes())
+    return [{k: v for k, v in componente.items() if k != "vertices"} for componente in resumo]
+
+
+def _hamiltoniano(contexto, p):
+    estado, ciclo = calcular_hamiltoniano(contexto.networkx(), tempo_limite=p["tempo_limite"])
+    return {"estado": estado, "ciclo": ciclo}
+
+
+def _isomorfismo(contexto, p):
+    if p["grafo_comparacao"] is None:
+        return None
+    return calcular_isomorfismo(contexto.csr(), p["grafo_comparacao"], tempo_limite=p["tempo_limite"])
+
+
+def _pontes(contexto, p):
+    estrutura = calcular_pontes(contexto.csr())
+    return {
+        "pontes": estrutura["pontes"],
+        "articulacoes": estrutura["articulacoes"],
+        "biconexas": len(estrutura["biconexas"]),
+        "duas_arestas_conexas": len(estrutura["duas_arestas_conexas"]),
+    }
+
+
+def _conectividade(contexto, p):
+    return {"conectado": contexto.conectado(), "componentes": contexto.componentes()["num_componentes"]}
+
+
+# Questões do trabalho: chave -> (título, dependências, cálculo)
+QUESTOES = {
+    "2_pdf_ccdf": ("PDF e CCDF da distribuição de graus", ("csr",),
+                   lambda c, p: dict(zip(("pdf", "ccdf"), calcular_pdf_ccdf(c.csr())))),
+    "3_caminhos": ("Caminhos simples entre dois vértices (número e amostra)", ("csr",), _caminhos),
+    "4_menor_caminho": ("Menor caminho entre dois vértices", ("csr",), _menor_caminho),
+    "5_distancia_media": ("Distância média", ("resumo",),
+                          lambda c, p: calcular_distancia_media(c.csr(), resumo=c.resumo_componentes())),
+    "6_excentricidade": ("Excentricidade de um vértice", ("csr",), _excentricidade),
+    "7_diametro": ("Diâmetro", ("resumo",), _diametro),
+    "8_densidade": ("Densidade", ("csr",), lambda c, p: calcular_densidade(c.csr())),
+    "9_euleriano": ("Ciclo Euleriano", ("componentes",),
+                    lambda c, p: calcular_euleriano(c.csr(), conectado=c.conectado())),
+    "9_hamiltoniano": ("Ciclo Hamiltoniano", (), _hamiltoniano),
+    "10_cliques": ("Todos os cliques (número por tamanho)", ("csr",),
+                   lambda c, p: {"total": sum(c.histograma_cliques().values()), "histograma": c.histograma_cliques()}),
+    "11_clique_maximo": ("Clique máximo", ("csr",), lambda c, p: calcular_clique_maximo(c.csr())),
+    "12_conectividade": ("Conectividade e número de componentes", ("componentes",), _conectividade),
+    "13_maior_componente": ("Maior componente", ("componentes",),
+                            lambda c, p: set(c.componentes()["maior_componente"].tolist())),
+    "14_isomorfismo": ("Isomorfismo com o grafo de comparação", ("csr",), _isomorfismo),
+    "15_pontes": ("Pontes", ("csr",), _pontes),
+}
+
+PARAMETROS_PADRAO = {
+    "origem_caminhos": 21,
+    "destino_caminhos": 4,
+    "limite_caminhos": 10_000,
+    "origem_menor_caminho": 703,
+    "destino_menor_caminho": 11,
+    "vertice_excentricidade": 1,
+    "tempo_limite": 30,
+    "grafo_comparacao": None,
+}
+
+
+def _para_json(valor):
+    """Converte para JSON os tipos que o módulo `json` não conhece."""
+    if isinstance(valor, (set, frozenset)):
+        return sorted(valor, key=str)
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    raise TypeError(f"Tipo não serializável: {type(valor).__name__}")
+
+
+def _validar_dependencias(tarefas):
+    """
+    Verifica se as dependências das tarefas formam um grafo acíclico, antes de agendá-las.
+
+    Args:
+        tarefas (dict): Nome -> (dependências, cálculo, argumentos).
+
+    Raises:
+        ValueError: Se uma tarefa depende de um nome desconhecido ou se há um ciclo.
+    """
+    for nome, (dependencias, _, _) in tarefas.items():
+        desconhecidas = sorted(set(dependencias) - set(tarefas))
+        if desconhecidas:
+            raise ValueError(f"A tarefa {nome!r} depende de tarefas desconhecidas: {desconhecidas}")
+    # Algoritmo de Kahn: o que sobra sem ser ordenado está em um ciclo ou depende de um
+    faltam = {nome: len(set(dependencias)) for nome, (dependencias, _, _) in tarefas.items()}
+    dependentes = {nome: [] for nome in tarefas}
+    for nome, (dependencias, _, _) in tarefas.items():
+        for dependencia in set(dependencias):
+            dependentes[dependencia].append(nome)
+    livres = [nome for nome, quantas in faltam.items() if not quantas]
+    while livres:
+        for dependente in dependentes[livres.pop()]:
+            faltam[dependente] -= 1
+            if not faltam[dependente]:
+                livres.append(dependente)
+    em_ciclo = sorted(nome for nome, quantas in faltam.items() if quantas)
+    if em_ciclo:
+        raise ValueError(f"Dependências circulares entre as tarefas: {em_ciclo}")
+
+
+def _executar(nome, categoria, funcao, *args):
+    inicio = time.perf_counter()
+    with etapa(nome, categoria):
+        resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def executar_questionario(grafo, caminho_relatorio="relatorio_trabalho_1.json", threads=None, processos=None,
+                          **parametros):
+    """
+    Responde às questões do trabalho 1 em paralelo e grava um único relatório JSON.
+
+    As questões e os fatos compartilhados formam um grafo de dependências: cada tarefa é
+    submetida a um pool de threads assim que as suas dependências terminam, e os fatos
+    (componentes, varredura BFS, cliques) são calculados uma única vez pelo `ContextoAnalise`.
+    Nenhuma questão desenha ou imprime; o erro de uma questão é registrado no relatório sem
+    interromper as demais, e as tarefas que dependem de um fato com erro são registradas como
+    falhas, sem rodar. As dependências são validadas antes de qualquer tarefa rodar.
+
+    Args:
+        grafo (networkx.Graph | GrafoCSR): O grafo analisado.
+        caminho_relatorio (str, opcional): Arquivo JSON do relatório. None não grava arquivo.
+        threads (int, opcional): Número de threads. Padrão: uma por tarefa.
+        processos (int, opcional): Número de processos da varredura BFS.
+        **parametros: Vértices e limites das questões (ver `PARAMETROS_PADRAO`).
+
+    Returns:
+        dict: O relatório, com o resultado e o tempo de cada questão e de cada fato.
+
+    Raises:
+        TypeError: Se há parâmetros desconhecidos.
+        ValueError: Se `FATOS` e `QUESTOES` têm dependências desconhecidas ou circulares.
+    """
+    desconhecidos = set(parametros) - set(PARAMETROS_PADRAO)
+    if desconhecidos:
+        raise TypeError(f"Parâmetros desconhecidos: {sorted(desconhecidos)}")
+    parametros = {**PARAMETROS_PADRAO, **parametros}
+    contexto = ContextoAnalise(grafo, processos)
+
+    tarefas = {}
+    for nome, (dependencias, calcular) in FATOS.items():
+        tarefas[nome] = (dependencias, calcular, (contexto,))
+    for nome, (_, dependencias, calcular) in QUESTOES.items():
+        tarefas[nome] = (dependencias, calcular, (contexto, parametros))
+    _validar_dependencias(tarefas)
+
+    relatorio = {
+        "parametros": {k: v for k, v in parametros.items() if k != "grafo_comparacao"},
+        "fatos": {},
+        "questoes": {},
+    }
+
+    def registrar(nome, entrada):
+        concluidas.add(nome)
+        if "erro" in entrada:
+            falhas.add(nome)
+        if nome in QUESTOES:
+            entrada = {"titulo": QUESTOES[nome][0], **entrada}
+        relatorio["questoes" if nome in QUESTOES else "fatos"][nome] = entrada
+
+    inicio = time.perf_counter()
+    pendentes = dict(tarefas)
+    concluidas = set()
+    falhas = set()
+    futuros = {}
+    with ThreadPoolExecutor(max_workers=threads or len(tarefas)) as executor:
+        while pendentes or futuros:
+            for nome in [n for n, (deps, _, _) in pendentes.items() if concluidas.issuperset(deps)]:
+                dependencias, calcular, args = pendentes.pop(nome)
+                # Uma tarefa que depende de um fato com erro falha também, sem rodar sobre dados ausentes
+                com_erro = sorted(falhas.intersection(dependencias))
+                if com_erro:
+                    registrar(nome, {"erro": f"Dependência com erro: {', '.join(com_erro)}"})
+                    continue
+                categoria = "questao" if nome in QUESTOES else "fato"
+                futuros[executor.submit(_executar, nome, categoria, calcular, *args)] = nome
+            if not futuros:
+                continue  # Só houve falhas propagadas; o grafo é acíclico, então elas liberam outras tarefas
+
+            prontos, _ = wait(futuros, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                nome = futuros.pop(futuro)
+                try:
+                    resultado, segundos = futuro.result()
+                    entrada = {"segundos": round(segundos, 6)}
+                    if nome in QUESTOES:
+                        entrada["resultado"] = resultado
+                except Exception as e:
+                    entrada = {"erro": f"{type(e).__name__}: {e}"}
+                registrar(nome, entrada)
+
+    relatorio["grafo"] = {"nos": contexto.csr().num_nos, "arestas": contexto.csr().num_arestas}
+    relatorio["questoes"] = {nome: relatorio["questoes"][nome] for nome in QUESTOES}
+    relatorio["segundos_total"] = round(time.perf_counter() - inicio, 6)
+
+    if caminho_relatorio is not None:
+        with open(caminho_relatorio, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2, default=_para_json)
+        print(f"Relatório gravado em {caminho_relatorio} ({relatorio['segundos_total']:.2f} s)")
+    return relatorio
+
+
+if __name__ == "__main__":
+    from cache_grafo import carregar_grafo_csr
+
+    parser = argparse.ArgumentParser(description="Responde às questões do trabalho 1 e grava um relatório JSON.")
+    parser.add_argument("arquivo", help="Arquivo de arestas SNAP analisado")
+    parser.add_argument("--comparacao", help="Arquivo de arestas do grafo da questão 14")
+    parser.add_argument("--relatorio", default="relatorio_trabalho_1.json", help="Arquivo JSON de saída")
+    parser.add_argument("--processos", type=int, help="Processos da varredura BFS")
+    parser.add_argument("--tempo-limite", type=float, default=30, help="Orçamento, em segundos, das buscas exaustivas")
+    parser.add_argument("--trace", help="Grava o tempo de cada etapa no formato de trace do Chrome")
+    parser.add_argument("--log", help="Grava o tempo de cada etapa como log JSON (uma linha por etapa)")
+    parser.add_argument("--memoria", action="store_true", help="Mede o pico de memória de cada etapa")
+    parser.add_argument("--perfilar", metavar="FUNCAO", help="Roda o cProfile nas chamadas dessa função")
+    args = parser.parse_args()
+
+    if args.trace or args.log or args.memoria or args.perfilar:
+        INSTRUMENTACAO.ativar(memoria=args.memoria, perfilar=args.perfilar)
+
+    executar_questionario(
+        carregar_grafo_csr(args.arquivo), caminho_relatorio=args.relatorio, processos=args.processos,
+        tempo_limite=args.tempo_limite,
+        grafo_comparacao=carregar_grafo_csr(args.comparacao) if args.comparacao else None,
+    )
+
+    if INSTRUMENTACAO.ativa:
+        INSTRUMENTACAO.imprimir_resumo()
+        if args.trace:
+            print(f"Trace gravado em {INSTRUMENTACAO.salvar_chrome_trace(args.trace)}")
+        if args.log:
+            print(f"Log gravado em {INSTRUMENTACAO.salvar_log(args.log)}")
@@ -0,0 +1,119 @@
+import numpy as np
+
+from grafo_csr import GrafoCSR
+
+
+def estrutura_de_cortes(grafo):
+    """
+    Encontra pontes, articulações, componentes biconexas e componentes 2-aresta-conexas em uma
+    única busca em profundidade (algoritmo de Tarjan com `low`), em tempo linear.
+
+    A busca é iterativa (pilha explícita, sem recursão) e percorre os arrays do `GrafoCSR`
+    convertidos para listas, sem dicionários por nó. Ao terminar um filho w de v:
+
+    - se low[w] > descoberta[v], a aresta (v, w) é ponte e os vértices empilhados a partir de w
+      formam uma componente 2-aresta-conexa;
+    - se low[w] >= descoberta[v], as arestas empilhadas a partir de (v, w) formam uma
+      componente biconexa, e v é articulação (a raiz, só se tiver mais de um filho).
+
+    Args:
+        grafo (networkx.Graph | GrafoCSR): O grafo não direcionado.
+
+    Returns:
+        dict: "pontes" (lista de pares de nós), "articulacoes" (lista de nós), "biconexas"
+        (lista de listas de nós, uma por componente com ao menos uma aresta, como em
+        `nx.biconnected_components`) e "duas_arestas_conexas" (lista de listas de nós; todo nó
+        pertence a exatamente uma).
+    """
+    csr = grafo if isinstance(grafo, GrafoCSR) else GrafoCSR.de_networkx(grafo)
+    n = csr.num_nos
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+
+    descoberta = [-1] * n
+    low = [0] * n
+    pai = [-1] * n
+    proximo = indptr[:-1]
+    articulacao = [False] * n
+    pontes = []
+    biconexas = []
+    duas_arestas = []
+    pilha_arestas = []
+    pilha_vertices = []
+    tempo = 0
+
+    for raiz in range(n):
+        if descoberta[raiz] >= 0:
+            continue
+        descoberta[raiz] = low[raiz] = tempo
+        tempo += 1
+        filhos_raiz = 0
+        pilha = [raiz]
+        pilha_vertices.append(raiz)
+
+        while pilha:
+            v = pilha[-1]
+            i = proximo[v]
+            if i < indptr[v + 1]:
+                proximo[v] = i + 1
+                w = indices[i]
+                if w == v or w == pai[v]:
+                    continue  # Laço, ou a aresta da árvore de volta ao pai (o CSR não tem arestas repetidas)
+                if descoberta[w] < 0:
+                    pai[w] = v
+                    descoberta[w] = low[w] = tempo
+                    tempo += 1
+                    if v == raiz:
+                        filhos_raiz += 1
+                    pilha_arestas.append((v, w))
+                    pilha_vertices.append(w)
+                    pilha.append(w)
+                elif descoberta[w] < descoberta[v]:
+                    # Aresta de retorno para um ancestral
+                    if descoberta[w] < low[v]:
+                        low[v] = descoberta[w]
+                    pilha_arestas.append((v, w))
+                continue
+
+            # Todos os vizinhos de v foram examinados: propaga o low para o pai
+            pilha.pop()
+            u = pai[v]
+            if u < 0:
+                continue
+            if low[v] < low[u]:
+                low[u] = low[v]
+
+            if low[v] > descoberta[u]:
+                pontes.append((u, v))
+                componente = []
+                while True:
+                    x = pilha_vertices.pop()
+                    componente.append(x)
+                    if x == v:
+                        break
+                duas_arestas.append(componente)
+
+            if low[v] >= descoberta[u]:
+                if u != raiz:
+                    articulacao[u] = True
+                componente = set()
+                while True:
+                    a, b = pilha_arestas.pop()
+                    componente.add(a)
+                    componente.add(b)
+                    if a == u and b == v:
+                        break
+                biconexas.append(componente)
+
+        if filhos_raiz > 1:
+            articulacao[raiz] = True
+        duas_arestas.append(pilha_vertices[:])
+        pilha_vertices.clear()
+
+    rotulos = csr.rotulos
+    return {
+        "pontes": [(csr.rotulo(u), csr.rotulo(v)) for u, v in pontes],
+        "articulacoes": rotulos[np.flatnonzero(articulacao)].tolist(),
+        "biconexas": [rotulos[sorted(c)].tolist() for c in biconexas],
+        "duas_arestas_conexas": [rotulos[sorted(c)].tolist() for c in duas_arestas],
+    }
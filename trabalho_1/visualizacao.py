@@ -0,0 +1,349 @@
+import itertools
+import os
+import weakref
+
+import matplotlib
+import matplotlib.pyplot as plt
+import networkx as nx
+from matplotlib.collections import LineCollection
+
+from layout import arestas_indexadas, hash_grafo, layout_em_cache
+from instrumentacao import instrumentar
+
+
+# Desenho opcional dos resultados de `analise.py`. Sem tela (backend não interativo ou variável
+# de ambiente GRAFOS_HEADLESS definida), as figuras são salvas em arquivos em vez de exibidas.
+
+DIRETORIO_FIGURAS = os.environ.get("GRAFOS_FIGURAS", "figuras")
+_BACKENDS_SEM_TELA = {"agg", "cairo", "pdf", "pgf", "ps", "svg", "template"}
+
+# Acima de LIMITE_SPRING nós o layout vem de `layout.py` (Barnes–Hut, guardado em disco); acima
+# de LIMITE_ROTULOS o desenho omite os rótulos e usa nós pequenos e uma única LineCollection
+LIMITE_SPRING = 500
+LIMITE_ROTULOS = 200
+
+# Um layout por grafo, compartilhado por todos os desenhos; descartado junto com o grafo
+_layouts = weakref.WeakKeyDictionary()
+_numero_figura = itertools.count(1)
+
+
+def sem_tela():
+    """True se as figuras devem ser salvas em arquivo em vez de exibidas."""
+    if os.environ.get("GRAFOS_HEADLESS"):
+        return True
+    return matplotlib.get_backend().lower() in _BACKENDS_SEM_TELA
+
+
+@instrumentar("layout")
+def obter_layout(grafo, seed=42):
+    """
+    Retorna as posições dos nós para desenho, calculadas uma única vez por grafo.
+
+    O layout guardado é indexado pelo hash dos nós e das arestas (o mesmo do cache em disco de
+    `layout.py`), então é refeito sempre que o conteúdo do grafo muda, mesmo que o número de
+    nós e de arestas continue igual. Grafos com até `LIMITE_SPRING` nós usam
+    `nx.spring_layout`; os maiores usam o layout de forças com Barnes–Hut de `layout.py`, lido
+    do disco se o mesmo grafo já foi desenhado antes.
+
+    Args:
+        grafo (networkx.Graph): O grafo a ser desenhado.
+        seed (int): Semente do layout, para desenhos repetíveis.
+
+    Returns:
+        dict: Nó -> posição (x, y).
+    """
+    versao = (hash_grafo(*arestas_indexadas(grafo)), seed)
+    guardado = _layouts.get(grafo)
+    if guardado is None or guardado[0] != versao:
+        if len(grafo) <= LIMITE_SPRING:
+            pos = nx.spring_layout(grafo, seed=seed)
+        else:
+            pos = layout_em_cache(grafo, seed=seed)
+        guardado = (versao, pos)
+        _layouts[grafo] = guardado
+    return guardado[1]
+
+
+@instrumentar("desenho")
+def exibir_figura(nome):
+    """
+    Exibe a figura atual ou, sem tela, salva-a em `DIRETORIO_FIGURAS`.
+
+    Args:
+        nome (str): Nome base do arquivo (sem extensão).
+
+    Returns:
+        str | None: Caminho do arquivo salvo, ou None se a figura foi exibida.
+    """
+    if not sem_tela():
+        plt.show()
+        return None
+    os.makedirs(DIRETORIO_FIGURAS, exist_ok=True)
+    caminho = os.path.join(DIRETORIO_FIGURAS, f"{next(_numero_figura):02d}_{nome}.png")
+    plt.savefig(caminho, dpi=100, bbox_inches="tight")
+    plt.close()
+    print(f"Figura salva em {caminho}")
+    return caminho
+
+
+def _grande(grafo):
+    return len(grafo) > LIMITE_ROTULOS
+
+
+def _tamanho_destaque(grafo):
+    """Tamanho dos nós destacados sobre o desenho base."""
+    return 12 if _grande(grafo) else 900
+
+
+def _largura_destaque(grafo):
+    """Espessura das arestas destacadas sobre o desenho base."""
+    return 0.8 if _grande(grafo) else 2
+
+
+def _desenhar_base(grafo, pos, node_color, **kwargs):
+    """
+    Desenha o grafo inteiro. Grafos grandes são desenhados sem rótulos, com as arestas em uma
+    única `LineCollection` e os nós em um único `scatter`.
+    """
+    if not _grande(grafo):
+        nx.draw(grafo, pos, with_labels=True, node_color=node_color, edge_color="gray", node_size=800, font_size=10, **kwargs)
+        return
+    eixo = plt.gca()
+    segmentos = [(pos[u], pos[v]) for u, v in grafo.edges if u != v]
+    eixo.add_collection(LineCollection(segmentos, colors="gray", linewidths=0.3, alpha=0.5, zorder=1))
+    coordenadas = [pos[no] for no in grafo.nodes]
+    eixo.scatter([x for x, _ in coordenadas], [y for _, y in coordenadas], s=4, c=node_color, linewidths=0, zorder=2)
+    eixo.autoscale_view()
+    eixo.set_axis_off()
+
+
+@instrumentar("desenho")
+def desenhar_pdf_ccdf(pdf, ccdf):
+    """Plota a PDF e a CCDF da distribuição de graus lado a lado."""
+    plt.figure(figsize=(12, 5))
+
+    plt.subplot(1, 2, 1)
+    plt.bar(pdf.keys(), pdf.values(), color='blue', alpha=0.7)
+    plt.title("PDF (Distribuição de Graus)")
+    plt.xlabel("Grau")
+    plt.ylabel("Probabilidade")
+
+    plt.subplot(1, 2, 2)
+    plt.plot(ccdf.keys(), ccdf.values(), marker='o', color='red')
+    plt.title("CCDF (Distribuição Cumulativa)")
+    plt.xlabel("Grau")
+    plt.ylabel("Probabilidade Acumulada")
+
+    plt.tight_layout()
+    return exibir_figura("pdf_ccdf")
+
+
+@instrumentar("desenho")
+def desenhar_distribuicoes(perfis):
+    """
+    Sobrepõe, em escala log-log, a PDF log-binada e a CCDF de vários grafos.
+
+    Args:
+        perfis (dict): Nome -> perfil de graus (ver `graus.perfil_graus`).
+    """
+    plt.figure(figsize=(12, 5))
+    for i, (nome, perfil) in enumerate(perfis.items()):
+        cor = f"C{i % 10}"
+        plt.subplot(1, 2, 1)
+        plt.loglog(perfil["log_binada"]["centros"], perfil["log_binada"]["densidade"], "o-", color=cor, label=nome)
+        plt.subplot(1, 2, 2)
+        distribuicao = perfil["distribuicao"]
+        positivos = distribuicao["graus"] > 0
+        plt.loglog(distribuicao["graus"][positivos], distribuicao["ccdf"][positivos], ".", color=cor, label=nome)
+        ajuste = perfil["lei_potencia"]
+        if ajuste is not None:
+            # Reta do ajuste, ancorada na CCDF empírica em xmin
+            x = distribuicao["graus"][distribuicao["graus"] >= ajuste["xmin"]]
+            base = distribuicao["ccdf"][distribuicao["graus"] == ajuste["xmin"]][0]
+            plt.loglog(x, base * (x / ajuste["xmin"]) ** (1 - ajuste["alpha"]), "--", color=cor,
+                       label=f"{nome}: alpha = {ajuste['alpha']:.2f}")
+
+    plt.subplot(1, 2, 1)
+    plt.title("PDF log-binada")
+    plt.xlabel("Grau")
+    plt.ylabel("Probabilidade")
+    plt.legend()
+    plt.subplot(1, 2, 2)
+    plt.title("CCDF")
+    plt.xlabel("Grau")
+    plt.ylabel("Probabilidade Acumulada")
+    plt.legend()
+
+    plt.tight_layout()
+    return exibir_figura("distribuicoes_graus")
+
+
+@instrumentar("desenho")
+def desenhar_caminhos(grafo, origem, destino, caminhos, max_desenhados=10):
+    """Destaca os primeiros `max_desenhados` caminhos entre `origem` e `destino`."""
+    pos = obter_layout(grafo)
+    plt.figure(figsize=(10, 8))
+
+    cores = ["red" if no == origem else "yellow" if no == destino else "lightgray" for no in grafo.nodes]
+    _desenhar_base(grafo, pos, cores)
+
+    for caminho in caminhos[:max_desenhados]:
+        nx.draw_networkx_edges(grafo, pos, edgelist=list(zip(caminho, caminho[1:])), edge_color="blue", width=_largura_destaque(grafo))
+        # Destacar os nós no caminho (sem sobrescrever os nós inicial e final)
+        nx.draw_networkx_nodes(
+            grafo, pos, nodelist=[no for no in caminho if no not in (origem, destino)],
+            node_color="lightgray", node_size=_tamanho_destaque(grafo)
+        )
+
+    titulo = f"Todos os caminhos simples de {origem} para {destino}"
+    if len(caminhos) > max_desenhados:
+        titulo += f" ({max_desenhados} de {len(caminhos)} destacados)"
+    plt.title(titulo)
+    return exibir_figura("caminhos")
+
+
+@instrumentar("desenho")
+def desenhar_menor_caminho(grafo, origem, destino, caminho):
+    """Destaca o menor caminho entre `origem` e `destino`."""
+    pos = obter_layout(grafo)
+    plt.figure(figsize=(10, 8))
+
+    no_caminho = set(caminho)
+    cores = [
+        "red" if no == origem else
+        "blue" if no == destino else
+        "orange" if no in no_caminho else
+        "lightgray"
+        for no in grafo.nodes
+    ]
+    _desenhar_base(grafo, pos, cores)
+    nx.draw_networkx_edges(grafo, pos, edgelist=list(zip(caminho, caminho[1:])), edge_color="red", width=_largura_destaque(grafo))
+
+    plt.title(f"Menor Caminho de {origem} para {destino}")
+    return exibir_figura("menor_caminho")
+
+
+@instrumentar("desenho")
+def desenhar_excentricidade(grafo, vertice, mais_distante):
+    """Destaca o vértice e o nó mais distante dele."""
+    pos = obter_layout(grafo)
+    plt.figure(figsize=(10, 8))
+
+    cores = ["red" if no == vertice else "blue" if no == mais_distante else "lightgray" for no in grafo.nodes]
+    _desenhar_base(grafo, pos, cores)
+
+    plt.title(f"Excentricidade do Vértice {vertice}")
+    return exibir_figura("excentricidade")
+
+
+@instrumentar("desenho")
+def desenhar_diametro(grafo, diameter_data):
+    """Destaca os extremos e um caminho que realiza o diâmetro de cada componente."""
+    pos = obter_layout(grafo)
+    plt.figure(figsize=(10, 8))
+
+    extremos = {no for dados in diameter_data.values() for no in dados["nodes"]}
+    _desenhar_base(grafo, pos, ["red" if no in extremos else "lightgray" for no in grafo.nodes])
+    for idx, dados in diameter_data.items():
+        caminho = nx.shortest_path(grafo, *dados["nodes"])
+        nx.draw_networkx_edges(
+            grafo, pos, edgelist=list(zip(caminho, caminho[1:])),
+            edge_color="blue" if idx == "connected" else f"C{idx % 10}", width=_largura_destaque(grafo)
+        )
+
+    plt.title("Diâmetro do Grafo e Componentes Conectadas")
+    return exibir_figura("diametro")
+
+
+@instrumentar("desenho")
+def desenhar_cliques(grafo, cliques):
+    """Destaca cada clique com uma cor."""
+    pos = obter_layout(grafo)
+    plt.figure(figsize=(10, 8))
+
+    _desenhar_base(grafo, pos, "lightgray")
+    for i, clique in enumerate(cliques):
+        nx.draw_networkx_nodes(grafo, pos, nodelist=clique, node_color=f"C{i % 10}", node_size=_tamanho_destaque(grafo))
+        nx.draw_networkx_edges(grafo, pos, edgelist=grafo.subgraph(clique).edges(), edge_color=f"C{i % 10}", width=_largura_destaque(grafo))
+
+    plt.title("Grafos com Destaque para os Cliques")
+    return exibir_figura("cliques")
+
+
+@instrumentar("desenho")
+def desenhar_clique_maximo(grafo, clique):
+    """Destaca o clique máximo."""
+    pos = obter_layout(grafo)
+    plt.figure(figsize=(8, 6))
+
+    _desenhar_base(grafo, pos, "lightblue")
+    nx.draw_networkx_nodes(grafo, pos, nodelist=clique, node_color="orange", node_size=_tamanho_destaque(grafo))
+    nx.draw_networkx_edges(grafo, pos, edgelist=grafo.subgraph(clique).edges(), edge_color="orange", width=_largura_destaque(grafo))
+
+    plt.title("Grafo com Destaque para o Clique Máximo")
+    return exibir_figura("clique_maximo")
+
+
+@instrumentar("desenho")
+def desenhar_componentes(grafo, componentes):
+    """Desenha cada componente conexa com uma cor diferente."""
+    pos = obter_layout(grafo)
+    plt.figure(figsize=(8, 6))
+
+    cor = {no: f"C{i % 10}" for i, componente in enumerate(componentes) for no in componente}
+    _desenhar_base(grafo, pos, [cor[no] for no in grafo.nodes])
+
+    plt.title("Componentes Conexos no Grafo")
+    return exibir_figura("componentes")
+
+
+@instrumentar("desenho")
+def desenhar_maior_componente(grafo, componente):
+    """Destaca a maior componente conexa."""
+    pos = obter_layout(grafo)
+    plt.figure(figsize=(8, 6))
+
+    _desenhar_base(grafo, pos, "lightgray")
+    subgrafo = grafo.subgraph(componente)
+    nx.draw_networkx_nodes(subgrafo, pos, node_color="orange", node_size=_tamanho_destaque(grafo))
+    nx.draw_networkx_edges(subgrafo, pos, edge_color="orange", width=_largura_destaque(grafo))
+
+    plt.title("Maior Componente Conexa no Grafo")
+    plt.tight_layout()
+    return exibir_figura("maior_componente")
+
+
+@instrumentar("desenho")
+def desenhar_isomorfismo(grafo1, grafo2, titulos=("p2p-Gnutella09", "p2p-Gnutella08")):
+    """Desenha dois grafos lado a lado para comparação."""
+    plt.figure(figsize=(12, 6))
+    for posicao, grafo, cor, titulo in ((121, grafo1, "lightblue", titulos[0]), (122, grafo2, "lightgreen", titulos[1])):
+        plt.subplot(posicao)
+        _desenhar_base(grafo, obter_layout(grafo), cor)
+        plt.title(titulo)
+
+    plt.suptitle("Comparação de Grafos")
+    plt.tight_layout()
+    return exibir_figura("isomorfismo")
+
+
+@instrumentar("desenho")
+def desenhar_pontes(grafo, pontes):
+    """Destaca as pontes do grafo."""
+    pos = obter_layout(grafo)
+    plt.figure(figsize=(10, 8))
+
+    _desenhar_base(grafo, pos, "lightblue")
+    nx.draw_networkx_edges(grafo, pos, edgelist=pontes, edge_color="red", width=_largura_destaque(grafo))
+
+    plt.title("Grafo com Pontes Destacadas")
+    return exibir_figura("pontes")
+
+
+@instrumentar("desenho")
+def desenhar_grafo(grafo, titulo="Exemplo de Grafo"):
+    """Desenha o grafo inteiro."""
+    plt.figure()
+    _desenhar_base(grafo, obter_layout(grafo), "lightblue")
+    plt.title(titulo)
+    return exibir_figura("grafo")
@@ -0,0 +1,209 @@
+import numpy as np
+import networkx as nx
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+
+LIMITE_ELEMENTOS_LOTE = 1 << 24  # Tamanho máximo (nós x fontes) da matriz de fronteiras da BFS em lote
+
+
+class Centralidades:
+    """
+    Medidas de centralidade calculadas sobre uma única matriz de adjacência esparsa (CSR).
+
+    A matriz é montada uma vez e compartilhada por todas as medidas; os cálculos são operações
+    vetorizadas do NumPy/SciPy, sem laços Python por nó ou por aresta. Os resultados são
+    dicionários nó -> valor, iguais (dentro da tolerância numérica) aos do NetworkX.
+
+    Atributos:
+        matriz (scipy.sparse.csr_matrix): Adjacência simétrica (float64), 1 por aresta.
+        nos (list): Nó de cada linha da matriz.
+    """
+
+    def __init__(self, matriz, nos):
+        self.matriz = matriz.tocsr()
+        self.nos = list(nos)
+        self._autopar = None
+
+    # ------------------------------------------------------------------ construção
+
+    @classmethod
+    def de_networkx(cls, grafo):
+        """Monta a matriz a partir de um `nx.Graph`, na ordem dos nós do grafo."""
+        nos = list(grafo.nodes)
+        indice = {no: i for i, no in enumerate(nos)}
+        pares = np.fromiter(
+            (indice[no] for aresta in grafo.edges for no in aresta),
+            dtype=np.int64, count=2 * grafo.number_of_edges()
+        ).reshape(-1, 2)
+        return cls(_simetrica(pares[:, 0], pares[:, 1], len(nos)), nos)
+
+    @classmethod
+    def de_arestas(cls, arestas):
+        """
+        Monta a matriz diretamente de uma lista ou array (m, 2) de arestas, sem criar um grafo.
+
+        Os nós (de qualquer tipo ordenável) são renumerados em ordem crescente; arestas
+        repetidas, inclusive nos dois sentidos, contam uma vez, como em `nx.Graph`.
+        """
+        arestas = np.asarray(arestas).reshape(-1, 2)
+        nos, densos = np.unique(arestas, return_inverse=True)
+        densos = densos.reshape(-1, 2)
+        return cls(_simetrica(densos[:, 0], densos[:, 1], len(nos)), nos.tolist())
+
+    def como_dicionario(self, valores):
+        """Converte um vetor alinhado com `nos` em um dicionário nó -> valor."""
+        return dict(zip(self.nos, valores.tolist()))
+
+    @property
+    def num_nos(self):
+        return self.matriz.shape[0]
+
+    # ------------------------------------------------------------------ medidas
+
+    def grau(self):
+        """
+        Centralidade de grau: grau / (n - 1), com laços contando duas vezes, como em
+        `nx.degree_centrality`.
+        """
+        n = self.num_nos
+        graus = np.asarray(self.matriz.sum(axis=1)).ravel() + self.matriz.diagonal()
+        return self.como_dicionario(graus * (1.0 / (n - 1) if n > 1 else 1.0))
+
+    def _autovetor_principal(self, tol):
+        """Maior autovalor da adjacência e o seu autovetor (positivo, norma 1), calculados uma vez."""
+        if self._autopar is None:
+            n = self.num_nos
+            if n == 0:
+                raise nx.NetworkXPointlessConcept("Não há centralidade de autovetor em um grafo vazio.")
+            if n < 3:
+                valores, vetores = np.linalg.eigh(self.matriz.toarray())
+                valor, vetor = valores[-1], vetores[:, -1]
+            else:
+                # Lanczos (ARPACK); o vetor inicial positivo deixa o resultado determinístico
+                valores, vetores = spla.eigsh(self.matriz, k=1, which="LA", v0=np.ones(n), tol=tol)
+                valor, vetor = valores[0], vetores[:, 0]
+            vetor = np.abs(vetor)  # O autovetor de Perron tem sinal constante
+            self._autopar = (float(valor), vetor / np.linalg.norm(vetor))
+        return self._autopar
+
+    def autovetor(self, tol=1e-10):
+        """
+        Centralidade de autovetor: autovetor do maior autovalor da adjacência, com norma
+        euclidiana 1, como em `nx.eigenvector_centrality`.
+
+        Args:
+            tol (float): Tolerância do ARPACK.
+        """
+        return self.como_dicionario(self._autovetor_principal(tol)[1])
+
+    def katz(self, alpha=0.1, beta=1.0, metodo="linear", tol=1e-8, max_iter=1000):
+        """
+        Centralidade de Katz: solução de x = alpha * A x + beta, normalizada para norma
+        euclidiana 1, como em `nx.katz_centrality`.
+
+        Args:
+            alpha (float): Fator de atenuação; precisa ser menor que 1 / (maior autovalor).
+            beta (float): Peso constante de cada nó.
+            metodo (str): "linear" resolve (I - alpha A) x = beta pelo gradiente conjugado
+                (a matriz é simétrica e positiva definida quando alpha é válido); "potencia"
+                usa a iteração x <- alpha A x + beta vetorizada.
+            tol (float): Tolerância relativa do resíduo (linear) ou da variação entre iterações
+                por nó (potência).
+            max_iter (int): Máximo de iterações.
+
+        Returns:
+            tuple: (valores, convergencia), em que valores é o dicionário nó -> centralidade e
+            convergencia traz "metodo", "iteracoes" e "erro" (resíduo relativo final ou
+            variação da última iteração).
+
+        Raises:
+            networkx.PowerIterationFailedConvergence: Se não convergir em `max_iter` iterações
+                ou se alpha não for menor que 1 / (maior autovalor), caso em que a série de
+                Katz diverge.
+        """
+        n = self.num_nos
+        if n == 0:
+            return {}, {"metodo": metodo, "iteracoes": 0, "erro": 0.0}
+        b = np.full(n, float(beta))
+
+        if metodo == "linear":
+            if alpha * self._autovetor_principal(1e-10)[0] >= 1:
+                raise nx.PowerIterationFailedConvergence(max_iter)
+            sistema = sp.identity(n, format="csr") - alpha * self.matriz
+            iteracoes = []
+            x, info = spla.cg(sistema, b, rtol=tol, maxiter=max_iter, callback=iteracoes.append)
+            if info != 0:
+                raise nx.PowerIterationFailedConvergence(max_iter)
+            erro = float(np.linalg.norm(sistema @ x - b) / np.linalg.norm(b))
+            convergencia = {"metodo": metodo, "iteracoes": len(iteracoes), "erro": erro}
+        elif metodo == "potencia":
+            x = np.zeros(n)
+            for iteracao in range(1, max_iter + 1):
+                anterior = x
+                x = alpha * (self.matriz @ anterior) + b
+                erro = float(np.abs(x - anterior).sum())
+                if erro < n * tol:
+                    break
+            else:
+                raise nx.PowerIterationFailedConvergence(max_iter)
+            convergencia = {"metodo": metodo, "iteracoes": iteracao, "erro": erro}
+        else:
+            raise ValueError(f"Método desconhecido: {metodo!r} (use 'linear' ou 'potencia').")
+
+        return self.como_dicionario(x / np.linalg.norm(x)), convergencia
+
+    def proximidade(self, lote=None):
+        """
+        Centralidade de proximidade, como em `nx.closeness_centrality` (com a correção de
+        Wasserman–Faust para grafos desconexos).
+
+        As distâncias saem de buscas em largura simultâneas a partir de `lote` fontes: as
+        fronteiras ficam em uma matriz densa (nós x fontes) e cada nível é um único produto
+        esparso-denso com a adjacência, então o trabalho por nível é vetorizado sobre todas as
+        fontes do lote.
+
+        Args:
+            lote (int, opcional): Fontes por lote. Padrão: o maior lote (até 64) com a matriz
+                de fronteiras dentro de `LIMITE_ELEMENTOS_LOTE` elementos.
+        """
+        n = self.num_nos
+        if lote is None:
+            lote = max(1, min(64, LIMITE_ELEMENTOS_LOTE // max(n, 1)))
+        alcancados = np.zeros(n, dtype=np.int64)
+        soma = np.zeros(n, dtype=np.int64)
+        adjacencia = self.matriz.astype(np.float32)
+
+        for inicio in range(0, n, lote):
+            fontes = np.arange(inicio, min(inicio + lote, n))
+            colunas = np.arange(len(fontes))
+            visitados = np.zeros((n, len(fontes)), dtype=bool)
+            visitados[fontes, colunas] = True
+            fronteira = visitados.astype(np.float32)
+            nivel = 0
+            while True:
+                nivel += 1
+                novos = (adjacencia @ fronteira > 0) & ~visitados
+                contagem = novos.sum(axis=0)
+                if not contagem.any():
+                    break
+                visitados |= novos
+                alcancados[fontes] += contagem
+                soma[fontes] += nivel * contagem
+                fronteira = novos.astype(np.float32)
+
+        valores = np.zeros(n)
+        positivos = soma > 0
+        valores[positivos] = alcancados[positivos] / soma[positivos]
+        if n > 1:
+            valores *= alcancados / (n - 1)
+        return self.como_dicionario(valores)
+
+
+def _simetrica(origem, destino, n):
+    """Adjacência simétrica 0/1 (n x n) a partir de pares de índices, sem arestas repetidas."""
+    linhas = np.concatenate([origem, destino])
+    colunas = np.concatenate([destino, origem])
+    matriz = sp.csr_matrix((np.ones(len(linhas)), (linhas, colunas)), shape=(n, n))
+    matriz.data[:] = 1.0  # Pares repetidos (e laços, contados duas vezes acima) valem 1
+    return matriz
@@ -2,6 +2,10 @@ import networkx as nx
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from centralidade import Centralidades
+from intermediacao import intermediacao
+from ranking import top_k, tabela_top_k, correlacoes
+
 # Lista de colaborações fictícias (FromNodeId, ToNodeId)
 edges = [
     ("Alice", "Bob"), ("Alice", "Carol"), ("Alice", "Dave"), ("Bob", "Eve"),
@@ -74,44 +78,61 @@ plt.title(f"Rede de Colaboração entre Pesquisadores\n"
           f"Nós: {num_nos} | Arestas: {num_arestas}")
 plt.show()
 
-# Função para ordenar e obter os 10 maiores valores
-def top_10_centrality(measure):
-    return sorted(measure.items(), key=lambda x: x[1], reverse=True)[:10]
-
-
 # Calculando medidas de centralidade
+# Grau, proximidade, autovetor e Katz saem de uma única matriz de adjacência esparsa, com
+# operações vetorizadas (ver `centralidade.py`), o que também vale para redes com milhões de nós
+centralidades = Centralidades.de_networkx(G)
+
 # 1. Centralidade de Grau (Degree Centrality): Mede o número de conexões diretas de cada pesquisador
-degree_centrality = nx.degree_centrality(G)
+degree_centrality = centralidades.grau()
 print("\nDegree Centrality (Centralidade de Grau):")
-for researcher, value in top_10_centrality(degree_centrality):
+for researcher, value in top_k(degree_centrality):
     print(f"{researcher}: {value:.4f}")
 
 
 # 2. Centralidade de Proximidade (Closeness Centrality): Mede a proximidade de um nó com todos os outros
-closeness_centrality = nx.closeness_centrality(G)
+closeness_centrality = centralidades.proximidade()
 print("\nCloseness Centrality (Centralidade de Proximidade):")
-for researcher, value in top_10_centrality(closeness_centrality):
+for researcher, value in top_k(closeness_centrality):
     print(f"{researcher}: {value:.4f}")
 
 
 # 3. Centralidade de Intermediação (Betweenness Centrality): Mede quantas vezes um nó está nos caminhos mais curtos
-betweenness_centrality = nx.betweenness_centrality(G)
+# Brandes com as fontes divididas entre processos; para redes grandes, `intermediacao.py` também
+# tem a estimativa por amostragem (Riondato–Kornaropoulos) e o modo adaptativo só para o top 10
+betweenness_centrality = intermediacao(centralidades)
 print("\nBetweenness Centrality (Centralidade de Intermediação):")
-for researcher, value in top_10_centrality(betweenness_centrality):
+for researcher, value in top_k(betweenness_centrality):
     print(f"{researcher}: {value:.4f}")
 
 
 # 4. Centralidade de Autovetor (Eigenvector Centrality): Mede a importância de um nó baseado nos seus vizinhos
-eigenvector_centrality = nx.eigenvector_centrality(G)
+eigenvector_centrality = centralidades.autovetor()
 print("\nEigenvector Centrality (Centralidade de Autovetor):")
-for researcher, value in top_10_centrality(eigenvector_centrality):
+for researcher, value in top_k(eigenvector_centrality):
     print(f"{researcher}: {value:.4f}")
 
 
 # 5. Centralidade de Katz (Katz Centrality): Considera conexões diretas e indiretas com penalização para conexões mais distantes
-katz_centrality = nx.katz_centrality(G, alpha=0.1, beta=1.0)
+katz_centrality, convergencia_katz = centralidades.katz(alpha=0.1, beta=1.0)
 print("\nKatz Centrality (Centralidade de Katz):")
-for researcher, value in top_10_centrality(katz_centrality):
+print(f"(convergiu em {convergencia_katz['iteracoes']} iterações, resíduo {convergencia_katz['erro']:.2e})")
+for researcher, value in top_k(katz_centrality):
     print(f"{researcher}: {value:.4f}")
 
 
+# Comparando as medidas: top 10 lado a lado e correlação entre os rankings
+medidas = {
+    "Grau": degree_centrality,
+    "Proximidade": closeness_centrality,
+    "Intermediação": betweenness_centrality,
+    "Autovetor": eigenvector_centrality,
+    "Katz": katz_centrality,
+}
+print("\nTop 10 de cada medida:")
+print(tabela_top_k(medidas, k=10).to_string(float_format="{:.4f}".format))
+
+print("\nCorrelação de Spearman entre as medidas:")
+print(correlacoes(medidas, metodo="spearman").round(3))
+print("\nCorrelação de Kendall entre as medidas:")
+print(correlacoes(medidas, metodo="kendall").round(3))
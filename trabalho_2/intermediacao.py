@@ -0,0 +1,293 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.sparse.csgraph import connected_components
+
+from centralidade import Centralidades, LIMITE_ELEMENTOS_LOTE
+
+
+MIN_FONTES_POR_PROCESSO = 64  # Abaixo disso, criar processos custa mais do que a busca
+
+
+# Intermediação (betweenness) pelo algoritmo de Brandes em forma matricial: as buscas em largura
+# de um lote de fontes andam juntas, nível a nível, com um produto esparso-denso por nível, e o
+# acúmulo das dependências volta pelos mesmos níveis. As fontes são divididas entre processos e
+# os vetores parciais de dependência são somados no fim.
+
+
+def _centralidades(grafo):
+    return grafo if isinstance(grafo, Centralidades) else Centralidades.de_networkx(grafo)
+
+
+def _tamanho_lote(n, lote=None):
+    return lote or max(1, min(64, LIMITE_ELEMENTOS_LOTE // max(4 * n, 1)))
+
+
+def _bfs_lote(matriz, fontes):
+    """
+    Buscas em largura simultâneas a partir de `fontes`.
+
+    Returns:
+        tuple: (nivel, sigma, profundidade), em que nivel (n x k) é a distância de cada nó a
+        cada fonte (-1 se inalcançável), sigma (n x k) é o número de menores caminhos e
+        profundidade é o maior nível alcançado.
+    """
+    n, k = matriz.shape[0], len(fontes)
+    colunas = np.arange(k)
+    nivel = np.full((n, k), -1, dtype=np.int32)
+    nivel[fontes, colunas] = 0
+    sigma = np.zeros((n, k))
+    sigma[fontes, colunas] = 1.0
+    fronteira = sigma.copy()
+    profundidade = 0
+    while True:
+        proximos = matriz @ fronteira
+        novos = (proximos > 0) & (nivel < 0)
+        if not novos.any():
+            return nivel, sigma, profundidade
+        profundidade += 1
+        nivel[novos] = profundidade
+        sigma[novos] = proximos[novos]
+        fronteira = np.where(novos, proximos, 0.0)
+
+
+def _dependencias(matriz, fontes, lote=None):
+    """
+    Soma, sobre as fontes, das dependências de Brandes de cada nó (a própria fonte não conta).
+
+    Returns:
+        numpy.ndarray: Vetor com a soma das dependências de cada nó.
+    """
+    n = matriz.shape[0]
+    total = np.zeros(n)
+    lote = _tamanho_lote(n, lote)
+    for inicio in range(0, len(fontes), lote):
+        bloco = np.asarray(fontes[inicio:inicio + lote])
+        nivel, sigma, profundidade = _bfs_lote(matriz, bloco)
+        delta = np.zeros_like(sigma)
+        for d in range(profundidade, 0, -1):
+            # delta(v) = sigma(v) * soma, sobre os filhos w de v, de (1 + delta(w)) / sigma(w)
+            filhos = nivel == d
+            razao = np.divide(1.0 + delta, sigma, out=np.zeros_like(sigma), where=filhos)
+            pais = nivel == d - 1
+            delta[pais] = (sigma * (matriz @ razao))[pais]
+        delta[bloco, np.arange(len(bloco))] = 0.0
+        total += delta.sum(axis=1)
+    return total
+
+
+_MATRIZ = None
+
+
+def _iniciar_trabalhador(matriz):
+    global _MATRIZ
+    _MATRIZ = matriz
+
+
+def _dependencias_trabalhador(fontes, lote):
+    return _dependencias(_MATRIZ, fontes, lote)
+
+
+class _Executor:
+    """Divide listas de fontes entre processos (ou no processo atual, com um só processo)."""
+
+    def __init__(self, matriz, processos=None):
+        self.matriz = matriz
+        processos = processos or os.cpu_count() or 1
+        self.processos = max(1, min(processos, matriz.shape[0] // MIN_FONTES_POR_PROCESSO))
+        self._pool = None
+        if self.processos > 1:
+            self._pool = ProcessPoolExecutor(self.processos, initializer=_iniciar_trabalhador, initargs=(matriz,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def dependencias(self, fontes, lote=None):
+        fontes = np.asarray(fontes)
+        if self._pool is None or len(fontes) < 2:
+            return _dependencias(self.matriz, fontes, lote)
+        partes = np.array_split(fontes, min(self.processos, len(fontes)))
+        futuros = [self._pool.submit(_dependencias_trabalhador, parte, lote) for parte in partes]
+        return sum(futuro.result() for futuro in futuros)
+
+
+def _escalar(soma, n, normalizado, fontes=None):
+    """
+    Normaliza as somas de dependências como `nx.betweenness_centrality` (pares ordenados
+    (s, t), sem contar as pontas), inclusive o ajuste da amostragem de `k` fontes.
+    """
+    N = n - 1
+    if N < 2:
+        return soma
+    correcao = 1 if normalizado else 2
+    if fontes is None:
+        return soma * (1 / (N * (N - 1)) if normalizado else 1 / correcao)
+    k = len(fontes)
+    fator = 1 / (N - 1) if normalizado else N / correcao
+    escala = np.full(n, fator / k)
+    escala[fontes] = fator / (k - 1) if k > 1 else math.nan
+    return soma * escala
+
+
+def intermediacao(grafo, normalizado=True, k=None, seed=None, processos=None, lote=None):
+    """
+    Centralidade de intermediação pelo algoritmo de Brandes, com as fontes divididas entre
+    processos, igual a `nx.betweenness_centrality` (grafo não direcionado, sem pesos).
+
+    Args:
+        grafo (networkx.Graph | Centralidades): O grafo.
+        normalizado (bool): Divide pelo número de pares (n - 1)(n - 2), como no NetworkX.
+        k (int, opcional): Se dado, usa só `k` fontes sorteadas (estimativa, ajustada como no
+            NetworkX); None calcula o valor exato com todas as fontes.
+        seed (int, opcional): Semente do sorteio das fontes.
+        processos (int, opcional): Número de processos. Padrão: número de CPUs.
+        lote (int, opcional): Fontes por busca em largura matricial.
+
+    Returns:
+        dict: Nó -> centralidade de intermediação.
+    """
+    centralidades = _centralidades(grafo)
+    n = centralidades.num_nos
+    fontes = None
+    if k is not None and k < n:
+        fontes = np.random.default_rng(seed).choice(n, size=k, replace=False)
+    with _Executor(centralidades.matriz, processos) as executor:
+        soma = executor.dependencias(np.arange(n) if fontes is None else fontes, lote)
+    return centralidades.como_dicionario(_escalar(soma, n, normalizado, fontes))
+
+
+def _limite_diametro_vertices(matriz):
+    """
+    Limite superior do diâmetro em vértices (nós no maior menor caminho). Em cada componente
+    ele é o menor entre o seu tamanho e 2 * excentricidade + 1 a partir de um nó dela; a busca
+    só é feita nas componentes maiores que o limite já obtido, das maiores para as menores,
+    então grafos com muitas componentes pequenas não pagam uma busca por componente.
+    """
+    n = matriz.shape[0]
+    _, rotulos = connected_components(matriz, directed=False)
+    tamanhos = np.bincount(rotulos)
+    _, representantes = np.unique(rotulos, return_index=True)
+    ordem = np.argsort(-tamanhos, kind="stable")
+    lote = _tamanho_lote(n)
+    limite = 1
+    for inicio in range(0, len(ordem), lote):
+        bloco = ordem[inicio:inicio + lote]
+        bloco = bloco[tamanhos[bloco] > limite]  # As demais já cabem no limite pelo tamanho
+        if len(bloco) == 0:
+            break
+        nivel, _, _ = _bfs_lote(matriz, representantes[bloco])
+        limite = max(limite, int(np.minimum(tamanhos[bloco], 2 * nivel.max(axis=0) + 1).max()))
+    return limite
+
+
+def tamanho_amostra_rk(diametro_vertices, epsilon, delta, c=0.5):
+    """
+    Número de amostras de Riondato–Kornaropoulos: com essa quantidade de menores caminhos
+    sorteados, todas as estimativas ficam a menos de `epsilon` do valor exato (normalizado
+    por n(n - 1)) com probabilidade pelo menos 1 - `delta`.
+    """
+    dimensao_vc = math.floor(math.log2(max(diametro_vertices - 2, 1))) + 1
+    return math.ceil(c / epsilon ** 2 * (dimensao_vc + math.log(1 / delta)))
+
+
+def intermediacao_rk(grafo, epsilon=0.05, delta=0.1, normalizado=True, seed=None, lote=None):
+    """
+    Estimativa da intermediação pela amostragem de Riondato–Kornaropoulos: sorteia pares de
+    nós (s, t), um menor caminho uniforme entre eles e conta os nós internos do caminho.
+
+    O número de amostras depende só de `epsilon`, `delta` e de um limite do diâmetro do grafo
+    (ver `tamanho_amostra_rk`), não do número de nós. As buscas em largura das amostras são
+    feitas em lotes, e o caminho é sorteado voltando de t e escolhendo cada predecessor com
+    probabilidade proporcional ao seu número de menores caminhos.
+
+    Args:
+        grafo (networkx.Graph | Centralidades): O grafo.
+        epsilon (float): Erro máximo absoluto (na escala normalizada por n(n - 1)).
+        delta (float): Probabilidade máxima de o erro ser ultrapassado.
+        normalizado (bool): Mesma escala de `intermediacao`.
+        seed (int, opcional): Semente do sorteio.
+        lote (int, opcional): Amostras por busca em largura matricial.
+
+    Returns:
+        dict: Nó -> intermediação estimada, no formato de `intermediacao`.
+    """
+    centralidades = _centralidades(grafo)
+    matriz = centralidades.matriz
+    n = centralidades.num_nos
+    if n < 3:
+        return centralidades.como_dicionario(np.zeros(n))
+    rng = np.random.default_rng(seed)
+    amostras = tamanho_amostra_rk(_limite_diametro_vertices(matriz), epsilon, delta)
+    origens = rng.integers(n, size=amostras)
+    destinos = (origens + rng.integers(1, n, size=amostras)) % n  # Sempre diferente da origem
+    indptr, indices = matriz.indptr, matriz.indices
+
+    contagem = np.zeros(n)
+    lote = _tamanho_lote(n, lote)
+    for inicio in range(0, amostras, lote):
+        bloco = origens[inicio:inicio + lote]
+        nivel, sigma, _ = _bfs_lote(matriz, bloco)
+        for coluna, t in enumerate(destinos[inicio:inicio + lote].tolist()):
+            atual = t
+            while nivel[atual, coluna] > 1:
+                vizinhos = indices[indptr[atual]:indptr[atual + 1]]
+                anteriores = vizinhos[nivel[vizinhos, coluna] == nivel[atual, coluna] - 1]
+                pesos = sigma[anteriores, coluna]
+                atual = anteriores[np.searchsorted(np.cumsum(pesos), rng.random() * pesos.sum(), side="right")]
+                contagem[atual] += 1
+
+    # Fração dos pares ordenados n(n - 1) -> escala do NetworkX
+    estimativa = contagem / amostras
+    estimativa *= n / (n - 2) if normalizado else n * (n - 1) / 2
+    return centralidades.como_dicionario(estimativa)
+
+
+def intermediacao_top_k(grafo, top=10, lote=64, rodadas_estaveis=3, normalizado=True, seed=None, processos=None):
+    """
+    Estimativa adaptativa para quando só interessam os `top` nós mais centrais.
+
+    Sorteia fontes em rodadas de `lote` e atualiza a estimativa (como em `intermediacao` com
+    `k`); para quando a lista ordenada dos `top` primeiros não muda por `rodadas_estaveis`
+    rodadas seguidas, ou quando todas as fontes foram usadas (resultado exato).
+
+    Args:
+        grafo (networkx.Graph | Centralidades): O grafo.
+        top (int): Tamanho do ranking que precisa se estabilizar.
+        lote (int): Fontes sorteadas por rodada.
+        rodadas_estaveis (int): Rodadas seguidas sem mudança no ranking para parar.
+        normalizado (bool): Mesma escala de `intermediacao`.
+        seed (int, opcional): Semente do sorteio das fontes.
+        processos (int, opcional): Número de processos.
+
+    Returns:
+        tuple: (valores, relatorio), em que valores é o dicionário nó -> intermediação
+        estimada e relatorio traz "fontes" (número de fontes usadas), "rodadas" e "exato".
+    """
+    centralidades = _centralidades(grafo)
+    n = centralidades.num_nos
+    if n == 0:
+        return {}, {"fontes": 0, "rodadas": 0, "exato": True}
+    ordem = np.random.default_rng(seed).permutation(n)
+    soma = np.zeros(n)
+    ranking = None
+    estaveis = 0
+    usadas = 0
+    rodadas = 0
+    with _Executor(centralidades.matriz, processos) as executor:
+        while usadas < n and estaveis < rodadas_estaveis:
+            soma += executor.dependencias(ordem[usadas:usadas + lote])
+            usadas = min(usadas + lote, n)
+            rodadas += 1
+            estimativa = _escalar(soma, n, normalizado, ordem[:usadas] if usadas < n else None)
+            atual = tuple(np.argsort(-estimativa, kind="stable")[:top].tolist())
+            estaveis = estaveis + 1 if atual == ranking else 0
+            ranking = atual
+
+    relatorio = {"fontes": usadas, "rodadas": rodadas, "exato": usadas == n}
+    return centralidades.como_dicionario(estimativa), relatorio
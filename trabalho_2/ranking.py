@@ -0,0 +1,111 @@
+import heapq
+import itertools
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+# Seleção dos k maiores valores sem ordenar tudo: heap de tamanho k para dicionários e
+# iteráveis (O(n log k)), `np.partition` para arrays (O(n + k log k)). Em caso de empate,
+# vale a ordem de chegada, como em `sorted(..., reverse=True)`.
+
+
+def top_k(valores, k=10, nos=None):
+    """
+    Retorna os `k` nós de maior valor, em ordem decrescente.
+
+    Args:
+        valores (dict | numpy.ndarray): Nó -> valor, ou um array de valores.
+        k (int): Quantidade de nós.
+        nos (list, opcional): Nó de cada posição do array; sem ele, os índices são os nós.
+
+    Returns:
+        list: Pares (nó, valor).
+    """
+    if isinstance(valores, dict):
+        return heapq.nlargest(k, valores.items(), key=itemgetter(1))
+    valores = np.asarray(valores)
+    k = min(k, valores.size)
+    if k <= 0:
+        return []
+    # O k-ésimo maior valor separa os candidatos; entre os empatados nele ficam os primeiros
+    limite = -np.partition(-valores, k - 1)[k - 1]
+    maiores = np.flatnonzero(valores > limite)
+    empatados = np.flatnonzero(valores == limite)[:k - len(maiores)]
+    candidatos = np.concatenate([maiores, empatados])
+    escolhidos = candidatos[np.argsort(-valores[candidatos], kind="stable")]
+    return [(nos[i] if nos is not None else i, valores[i].item()) for i in escolhidos.tolist()]
+
+
+def top_k_fluxo(pares, k=10):
+    """
+    Seleciona os `k` maiores de um iterável de pares (nó, valor) consumido uma única vez,
+    guardando só k pares na memória (os valores nunca precisam virar um dicionário).
+
+    Returns:
+        list: Pares (nó, valor), em ordem decrescente de valor.
+    """
+    if k <= 0:
+        return []
+    heap = []
+    contador = itertools.count()
+    for no, valor in pares:
+        # Chave (valor, -ordem): no empate, o nó que chegou primeiro fica
+        item = (valor, -next(contador), no)
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+    return [(no, valor) for valor, _, no in sorted(heap, reverse=True)]
+
+
+def tabela_top_k(medidas, k=10):
+    """
+    Monta uma tabela com o top-k de várias medidas lado a lado.
+
+    Args:
+        medidas (dict): Nome da medida -> dicionário nó -> valor.
+        k (int): Linhas da tabela.
+
+    Returns:
+        pandas.DataFrame: Uma linha por posição (1..k) e, para cada medida, as colunas
+        (medida, "Nó") e (medida, "Valor").
+    """
+    colunas = {}
+    for nome, valores in medidas.items():
+        ranking = top_k(valores, k)
+        colunas[(nome, "Nó")] = [no for no, _ in ranking]
+        colunas[(nome, "Valor")] = [valor for _, valor in ranking]
+    tabela = pd.DataFrame({chave: pd.Series(coluna) for chave, coluna in colunas.items()})
+    tabela.index = pd.RangeIndex(1, len(tabela) + 1, name="Posição")
+    return tabela
+
+
+def correlacoes(medidas, metodo="spearman"):
+    """
+    Correlação de postos entre cada par de medidas, calculada sobre os nós comuns a todas.
+
+    Args:
+        medidas (dict): Nome da medida -> dicionário nó -> valor.
+        metodo (str): "spearman" (rho de Spearman) ou "kendall" (tau-b de Kendall).
+
+    Returns:
+        pandas.DataFrame: Matriz simétrica de correlações, com as medidas nas linhas e colunas.
+    """
+    if metodo == "spearman":
+        correlacao = stats.spearmanr
+    elif metodo == "kendall":
+        correlacao = stats.kendalltau
+    else:
+        raise ValueError(f"Método desconhecido: {metodo!r} (use 'spearman' ou 'kendall').")
+
+    nomes = list(medidas)
+    nos = set.intersection(*(set(valores) for valores in medidas.values())) if nomes else set()
+    ordem = list(nos)
+    vetores = [np.fromiter((medidas[nome][no] for no in ordem), dtype=float, count=len(ordem)) for nome in nomes]
+    matriz = np.eye(len(nomes))
+    for i, j in itertools.combinations(range(len(nomes)), 2):
+        matriz[i, j] = matriz[j, i] = correlacao(vetores[i], vetores[j])[0]
+    return pd.DataFrame(matriz, index=nomes, columns=nomes)